@@ -1,16 +1,23 @@
 """Ticket API endpoints."""
 
+from datetime import datetime
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.ticket import EscalationLevel
 from app.dependencies import get_db_session, get_ticket_service, get_current_user
 from app.schemas.ticket import (
-    TicketCreate,  TicketResponse, TicketListResponse,
-    TicketBatchRequest, TicketBatchResponse, TicketFilters
+    CountMode, TicketCreate,  TicketResponse, TicketListResponse,
+    TicketBatchRequest, TicketBatchResponse, TicketFilters,
+    TicketEventBatchRequest, TicketEventBatchResponse, TicketIngestResponse,
+    TICKET_FIELDS, TICKET_SUMMARY_FIELDS
 )
+from app.services.ticket_ingest import TicketIngestor, iter_ndjson_lines
 from app.services.ticket_service import TicketService
 import structlog
 
@@ -44,6 +51,87 @@ async def create_ticket(
         )
 
 
+@router.post("/batch", response_model=TicketBatchResponse, status_code=status.HTTP_200_OK)
+async def create_tickets_batch(
+    batch: TicketBatchRequest,
+    db_session: AsyncSession = Depends(get_db_session),
+    ticket_service: TicketService = Depends(get_ticket_service),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Create up to 1000 tickets in one transaction.
+
+    Tickets whose external_id already exists are skipped and listed in
+    ``errors``; the rest of the batch is still created.
+    """
+    try:
+        result = await ticket_service.create_tickets_batch(db_session, batch.tickets)
+        logger.info(
+            "Ticket batch created via API",
+            successful=result.successful,
+            failed=result.failed,
+            user_id=current_user.get("user_id")
+        )
+        return result
+    except Exception as e:
+        logger.error("Failed to create ticket batch", error=str(e), size=len(batch.tickets))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create ticket batch: {str(e)}"
+        )
+
+
+@router.post("/events", response_model=TicketEventBatchResponse, status_code=status.HTTP_200_OK)
+async def ingest_ticket_events(
+    batch: TicketEventBatchRequest,
+    db_session: AsyncSession = Depends(get_db_session),
+    ticket_service: TicketService = Depends(get_ticket_service),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Idempotently apply ticket events (created, updated, status_changed) keyed on external_id.
+
+    Replayed or stale events are accepted and reported as ``unchanged``.
+    """
+    try:
+        return await ticket_service.ingest_events(db_session, batch.events)
+    except Exception as e:
+        logger.error("Failed to ingest ticket events", error=str(e), size=len(batch.events))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to ingest ticket events: {str(e)}"
+        )
+
+
+@router.post("/ingest", response_model=TicketIngestResponse, status_code=status.HTTP_200_OK)
+async def ingest_tickets_ndjson(
+    request: Request,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Stream tickets from an NDJSON request body (one ``TicketCreate`` per line).
+
+    The body is read incrementally and written in bounded batches, so the
+    upload is throttled to the database's pace. Tickets with an existing
+    external_id are skipped, which makes interrupted uploads safe to resend.
+    """
+    try:
+        stats = await TicketIngestor().ingest(iter_ndjson_lines(request.stream()))
+        logger.info(
+            "Tickets ingested via API",
+            created=stats.created,
+            invalid=stats.invalid,
+            user_id=current_user.get("user_id")
+        )
+        return TicketIngestResponse(**stats.summary())
+    except Exception as e:
+        logger.error("Failed to ingest tickets", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to ingest tickets: {str(e)}"
+        )
+
+
 
 @router.get("/{ticket_id}", response_model=TicketResponse)
 async def get_ticket(
@@ -79,31 +167,109 @@ async def get_ticket(
 
 
 
+def _upper(values: Optional[List[str]]) -> Optional[List[str]]:
+    return [value.upper() for value in values] if values else None
+
+
+async def get_ticket_filters(
+    status_filter: Optional[List[str]] = Query(None, alias="status", description="Filter by status"),
+    priority: Optional[List[str]] = Query(None, description="Filter by priority"),
+    customer_tier: Optional[List[str]] = Query(None, description="Filter by customer tier"),
+    escalation_level: Optional[List[int]] = Query(None, description="Filter by escalation level (0-4)"),
+    response_sla_status: Optional[List[str]] = Query(None, description="Filter by response SLA status"),
+    resolution_sla_status: Optional[List[str]] = Query(None, description="Filter by resolution SLA status"),
+    assigned_to: Optional[List[str]] = Query(None, description="Filter by assigned agent"),
+    department: Optional[List[str]] = Query(None, description="Filter by department"),
+    created_from: Optional[datetime] = Query(None, description="Filter by creation date (from)"),
+    created_to: Optional[datetime] = Query(None, description="Filter by creation date (to)"),
+    search: Optional[str] = Query(None, min_length=1, description="Search in title and description")
+) -> TicketFilters:
+    """Collect ticket list filters from query parameters; enum values are case-insensitive."""
+    if escalation_level and any(level not in EscalationLevel._value2member_map_ for level in escalation_level):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="escalation_level must be between 0 and 4"
+        )
+    try:
+        return TicketFilters(
+            status=_upper(status_filter),
+            priority=_upper(priority),
+            customer_tier=_upper(customer_tier),
+            escalation_level=escalation_level,
+            response_sla_status=_upper(response_sla_status),
+            resolution_sla_status=_upper(resolution_sla_status),
+            assigned_to=assigned_to,
+            department=department,
+            created_from=created_from,
+            created_to=created_to,
+            search=search
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.errors(include_url=False)
+        )
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Columns requested with ``?fields=``; ``id`` and ``created_at`` are always included."""
+    if not fields:
+        return None
+    if fields == "summary":
+        return list(TICKET_SUMMARY_FIELDS)
+
+    columns = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in columns if name not in TICKET_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown ticket fields: {', '.join(unknown)}"
+        )
+    for required in ("created_at", "id"):
+        if required not in columns:
+            columns.insert(0, required)
+    return columns
+
+
 @router.get("/", response_model=TicketListResponse)
 async def list_tickets(
-    page: int = Query(1, ge=1, description="Page number"),
+    page: Optional[int] = Query(None, ge=1, description="Page number (offset pagination; prefer cursor)"),
     size: int = Query(100, ge=1, le=1000, description="Items per page"),
-    status: Optional[List[str]] = Query(None, description="Filter by status"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    count: CountMode = Query(CountMode.ESTIMATE, description="Total: exact, estimate or none"),
+    fields: Optional[str] = Query(None, description="'summary' or comma-separated ticket fields"),
+    ticket_filters: TicketFilters = Depends(get_ticket_filters),
     db_session: AsyncSession = Depends(get_db_session),
     ticket_service: TicketService = Depends(get_ticket_service),
     current_user: dict = Depends(get_current_user)
 ):
-    """Get tickets with pagination and filtering."""
+    """
+    Get tickets, newest first, with cursor pagination and filtering.
+
+    Follow ``next_cursor`` to fetch the next page; every page costs the same
+    regardless of depth. ``page`` still selects offset pages when no cursor
+    is given. All ``TicketFilters`` fields are available as query parameters;
+    list-valued filters are repeated (``?priority=P0&priority=P1``).
+
+    ``fields`` selects only the given columns (or the ``summary`` view);
+    those rows skip ORM loading and model validation and are serialized
+    directly with orjson.
+    """
+    columns = _parse_fields(fields)
     try:
         # Build filters
-        filters = {}
-        if status:
-            filters["status"] = status
-        # Calculate pagination
-        skip = (page - 1) * size
+        filters = ticket_filters.model_dump(exclude_none=True)
+        # Offset pagination only without a cursor
+        skip = (page - 1) * size if page and not cursor else 0
         
         # Get tickets
-        tickets, total = await ticket_service.get_tickets(
-            db_session, skip=skip, limit=size, filters=filters
+        tickets, total, total_is_estimate, next_cursor = await ticket_service.get_tickets(
+            db_session, skip=skip, limit=size, filters=filters, cursor=cursor,
+            count_mode=count, columns=columns
         )
         
         # Calculate pagination metadata
-        pages = (total + size - 1) // size  # Ceiling division
+        pages = (total + size - 1) // size if total is not None else None  # Ceiling division
         
         # logger.info(
         #     "Tickets listed",
@@ -113,18 +279,35 @@ async def list_tickets(
         #     user_id=current_user.get("user_id")
         # )
         
+        if columns:
+            return ORJSONResponse({
+                "tickets": tickets,
+                "total": total,
+                "total_is_estimate": total_is_estimate,
+                "page": page if not cursor else None,
+                "size": size,
+                "pages": pages,
+                "next_cursor": next_cursor
+            })
+        
         return TicketListResponse(
             tickets=tickets,
             total=total,
-            page=page,
+            total_is_estimate=total_is_estimate,
+            page=page if not cursor else None,
             size=size,
-            pages=pages
+            pages=pages,
+            next_cursor=next_cursor
         )
         
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error("Failed to list tickets", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to list tickets: {str(e)}"
         )
-
@@ -8,6 +8,8 @@ from pydantic_settings import BaseSettings
 from pydantic import Field, validator
 import yaml
 
+from app.utils.business_calendar import BusinessCalendar, DEFAULT_BUSINESS_CALENDAR
+
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
@@ -33,9 +35,77 @@ class Settings(BaseSettings):
     # Slack webhook
     slack_webhook_url: str = Field(default="", env="SLACK_WEBHOOK_URL")
     
+    # Notification HTTP client (shared connection pool)
+    notification_http2: bool = Field(default=True, env="NOTIFICATION_HTTP2")
+    notification_max_connections: int = Field(default=20, env="NOTIFICATION_MAX_CONNECTIONS")
+    notification_max_keepalive_connections: int = Field(default=10, env="NOTIFICATION_MAX_KEEPALIVE_CONNECTIONS")
+    notification_keepalive_expiry: float = Field(default=30.0, env="NOTIFICATION_KEEPALIVE_EXPIRY")  # seconds
+    notification_timeout: float = Field(default=10.0, env="NOTIFICATION_TIMEOUT")  # seconds
+    notification_connect_timeout: float = Field(default=5.0, env="NOTIFICATION_CONNECT_TIMEOUT")  # seconds
+    
+    # Notification outbox: alerts are delivered by a background dispatcher
+    # instead of inline during SLA evaluation
+    notification_outbox_enabled: bool = Field(default=True, env="NOTIFICATION_OUTBOX_ENABLED")
+    notification_dispatch_batch_size: int = Field(default=100, env="NOTIFICATION_DISPATCH_BATCH_SIZE")
+    notification_dispatch_concurrency: int = Field(default=10, env="NOTIFICATION_DISPATCH_CONCURRENCY")
+    notification_dispatch_poll_interval: float = Field(default=1.0, env="NOTIFICATION_DISPATCH_POLL_INTERVAL")  # seconds
+    notification_max_attempts: int = Field(default=5, env="NOTIFICATION_MAX_ATTEMPTS")
+    notification_retry_backoff: float = Field(default=5.0, env="NOTIFICATION_RETRY_BACKOFF")  # seconds, doubled per attempt
+    notification_retry_backoff_max: float = Field(default=600.0, env="NOTIFICATION_RETRY_BACKOFF_MAX")  # seconds
+    notification_max_age_minutes: int = Field(default=60, env="NOTIFICATION_MAX_AGE_MINUTES")
+    
     # Scheduler settings
     scheduler_interval: int = Field(default=60, env="SCHEDULER_INTERVAL")  # seconds
     
+    # SLA evaluation: "incremental" (due tickets only), "full" (every open ticket),
+    # "streaming" (every open ticket, committed chunk by chunk) or "sql"
+    # (set-based status recomputation in the database)
+    sla_evaluation_mode: str = Field(default="incremental", env="SLA_EVALUATION_MODE")
+    sla_evaluation_chunk_size: int = Field(default=1000, env="SLA_EVALUATION_CHUNK_SIZE")
+    # Compute statuses of a whole batch with the NumPy kernel
+    sla_vectorized_evaluation: bool = Field(default=True, env="SLA_VECTORIZED_EVALUATION")
+    
+    # Fire evaluations at exact threshold crossings in addition to the minute tick
+    sla_timer_enabled: bool = Field(default=True, env="SLA_TIMER_ENABLED")
+    
+    # Sharded evaluation across replicas (1 = no sharding)
+    sla_shard_count: int = Field(default=1, env="SLA_SHARD_COUNT")
+    sla_max_shards_per_worker: int = Field(default=0, env="SLA_MAX_SHARDS_PER_WORKER")  # 0 = unlimited
+    
+    # Streaming NDJSON ingestion
+    ingest_batch_size: int = Field(default=1000, env="INGEST_BATCH_SIZE")
+    ingest_concurrency: int = Field(default=4, env="INGEST_CONCURRENCY")
+    ingest_max_pending_batches: int = Field(default=8, env="INGEST_MAX_PENDING_BATCHES")
+    ingest_progress_interval: float = Field(default=5.0, env="INGEST_PROGRESS_INTERVAL")  # seconds
+    ingest_max_line_bytes: int = Field(default=1048576, env="INGEST_MAX_LINE_BYTES")
+    
+    # Ticket list totals in count=estimate mode
+    ticket_count_cache_ttl: float = Field(default=30.0, env="TICKET_COUNT_CACHE_TTL")  # seconds
+    
+    # RAG engine, loaded once in the background at startup
+    rag_enabled: bool = Field(default=True, env="RAG_ENABLED")
+    rag_warmup: bool = Field(default=True, env="RAG_WARMUP")
+    rag_index_path: str = Field(default="artifacts/faiss.index", env="RAG_INDEX_PATH")
+    rag_texts_path: str = Field(default="artifacts/texts.json", env="RAG_TEXTS_PATH")
+    rag_bm25_path: str = Field(default="artifacts/bm25", env="RAG_BM25_PATH")
+    rag_llm_model: str = Field(default="LiquidAI/LFM2-1.2B-RAG", env="RAG_LLM_MODEL")
+    
+    # Shared embedding model and query micro-batching
+    embedding_model_name: str = Field(default="BAAI/bge-base-en-v1.5", env="EMBEDDING_MODEL_NAME")
+    embedding_batch_max_size: int = Field(default=64, env="EMBEDDING_BATCH_MAX_SIZE")
+    embedding_batch_max_wait_ms: float = Field(default=5.0, env="EMBEDDING_BATCH_MAX_WAIT_MS")
+    
+    # Inference worker pool for /classify and /respond
+    inference_max_workers: int = Field(default=2, env="INFERENCE_MAX_WORKERS")
+    inference_max_queue_depth: int = Field(default=16, env="INFERENCE_MAX_QUEUE_DEPTH")
+    inference_timeout: float = Field(default=60.0, env="INFERENCE_TIMEOUT")  # seconds
+    classify_timeout: float = Field(default=30.0, env="CLASSIFY_TIMEOUT")  # seconds
+    respond_timeout: float = Field(default=120.0, env="RESPOND_TIMEOUT")  # seconds
+    
+    # Intent classifier, loaded once in the background at startup
+    classifier_preload: bool = Field(default=True, env="CLASSIFIER_PRELOAD")
+    classifier_nli_model: str = Field(default="facebook/bart-large-mnli", env="CLASSIFIER_NLI_MODEL")
+    
     # WebSocket settings
     ws_max_connections: int = Field(default=100, env="WS_MAX_CONNECTIONS")
     
@@ -63,6 +133,7 @@ class SLAConfig:
     def __init__(self, config_path: str = "sla_config.yaml"):
         self.config_path = Path(config_path)
         self._config: Dict[str, Any] = {}
+        self._business_calendars: Dict[str, BusinessCalendar] = {}
         self._callbacks = []
         self.load_config()
     
@@ -70,18 +141,24 @@ class SLAConfig:
         """Load configuration from YAML file."""
         try:
             with open(self.config_path, 'r') as f:
-                self._config = yaml.safe_load(f) or {}
+                config = yaml.safe_load(f) or {}
+            self._business_calendars = self._compile_business_calendars(config)
+            self._config = config
             self._notify_callbacks()
             return self._config
         except Exception as e:
             # Return default config if file doesn't exist or is invalid
             self._config = self._get_default_config()
+            self._business_calendars = {}
             return self._config
     
+    @property
+    def config(self) -> Dict[str, Any]:
+        """The raw configuration currently loaded."""
+        return self._config
+    
     def get_sla_target(self, sla_type: str, priority: str, customer_tier: str) -> int:
         """Get SLA target time in minutes."""
-        print(sla_type, priority, customer_tier)
-
         return (
             self._config
             .get("sla_targets", {})
@@ -112,6 +189,32 @@ class SLAConfig:
             return slack_config
         return webhooks.get(service, {})
     
+    def get_notification_config(self, service: str) -> Dict[str, Any]:
+        """Get notification settings (digests, rate limits) for a service."""
+        return self._config.get('notifications', {}).get(service, {})
+    
+    def get_triage_config(self) -> Dict[str, Any]:
+        """Get the intent classification settings (``triage`` section)."""
+        return self._config.get('triage') or {}
+    
+    def get_business_calendar(self, customer_tier: str) -> BusinessCalendar:
+        """Get the business calendar of a customer tier, falling back to the default calendar."""
+        return (
+            self._business_calendars.get(customer_tier)
+            or self._business_calendars.get('default')
+            or DEFAULT_BUSINESS_CALENDAR
+        )
+    
+    @staticmethod
+    def _compile_business_calendars(config: Dict[str, Any]) -> Dict[str, BusinessCalendar]:
+        """Build the calendars of ``business_calendars``; tier sections extend ``default``."""
+        sections = config.get('business_calendars') or {}
+        default = sections.get('default') or {}
+        return {
+            name: BusinessCalendar.from_config({**default, **(section or {})})
+            for name, section in sections.items()
+        }
+    
     def subscribe_to_changes(self, callback):
         """Subscribe to configuration changes."""
         self._callbacks.append(callback)
@@ -1,6 +1,6 @@
 """Database configuration and connection management."""
 
-from sqlalchemy import create_engine, MetaData
+from sqlalchemy import create_engine, MetaData, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
@@ -49,6 +49,8 @@ async def get_async_session():
 async def init_database():
     """Initialize database tables."""
     async with async_engine.begin() as conn:
+        # Trigram operator classes used by the ticket search indexes
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         # Create all tables
         await conn.run_sync(Base.metadata.create_all)
     # logger.info("Database initialized successfully")
@@ -10,6 +10,7 @@ from app.services.ticket_service import TicketService
 from app.services.sla_engine import SLAEngine
 from app.services.escalation_service import EscalationService
 from app.utils.sla_calculator import SLACalculator
+from ticket_triage_service.rag_engine import RAGEngine, rag_engine
 
 logger = structlog.get_logger(__name__)
 
@@ -43,6 +44,17 @@ async def get_escalation_service() -> EscalationService:
     return EscalationService()
 
 
+async def get_rag_engine() -> RAGEngine:
+    """Dependency to get the process-wide RAG engine; 503 until it is ready."""
+    if not rag_engine.ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"RAG engine is {rag_engine.state.value}",
+            headers={"Retry-After": "30"}
+        )
+    return rag_engine
+
+
 # Optional authentication (can be extended for production)
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
@@ -1,15 +1,15 @@
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
 from enum import Enum as PyEnum
 
 from sqlalchemy import (
     Column, Integer, String, DateTime, Boolean, Text, 
-    Enum, ForeignKey, Index, JSON, Float, UniqueConstraint
+    Enum, ForeignKey, Index, JSON, Float, UniqueConstraint, Computed
 )
-from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.sql import func, text
 
 from app.database import Base
 
@@ -25,6 +25,14 @@ class TicketStatus(PyEnum):
     CANCELLED = "CANCELLED"
 
 
+# Ticket statuses that stop the SLA clocks for good
+TERMINAL_STATUSES = [
+    TicketStatus.RESOLVED,
+    TicketStatus.CLOSED,
+    TicketStatus.CANCELLED,
+]
+
+
 class Priority(PyEnum):
     """Priority enumeration."""
     P0 = "P0"  # Critical - 15 minutes response
@@ -59,6 +67,10 @@ class EscalationLevel(PyEnum):
     LEVEL_4 = 4  # VP
 
 
+# Text search configuration of Ticket.search_vector; queries must use the same one
+SEARCH_CONFIG = "english"
+
+
 class Ticket(Base):
     """Ticket model with SLA tracking."""
     
@@ -98,12 +110,28 @@ class Ticket(Base):
     last_escalation_at = Column(DateTime(timezone=True))
     escalation_count = Column(Integer, default=0)
     
+    # Incremental evaluation
+    next_transition_at = Column(DateTime(timezone=True), comment="Next warning/critical/breach threshold crossing")
+    
+    # Event ordering; updated_at is overwritten by the update trigger
+    last_event_at = Column(DateTime(timezone=True), comment="Source time of the last applied ticket event")
+    
     # Additional metadata
     assigned_to = Column(String(255))
     department = Column(String(100))
     tags = Column(JSON, default=list)
     ticket_metadata = Column(JSON, default=dict)
     
+    # Full-text search: title weighted above description, maintained by Postgres
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce(description, '')), 'B')",
+            persisted=True
+        )
+    ))
+    
     # Relationships
     status_history = relationship("TicketStatusHistory", back_populates="ticket", cascade="all, delete-orphan")
     alerts = relationship("Alert", back_populates="ticket", cascade="all, delete-orphan")
@@ -113,6 +141,17 @@ class Ticket(Base):
         Index('idx_ticket_sla_status', 'response_sla_status', 'resolution_sla_status'),
         Index('idx_ticket_deadlines', 'response_sla_deadline', 'resolution_sla_deadline'),
         Index('idx_ticket_active', 'status', 'created_at'),
+        Index('idx_ticket_created_id', 'created_at', 'id'),
+        Index('idx_tickets_priority_customer_tier', 'priority', 'customer_tier'),
+        Index('idx_tickets_assigned_to', 'assigned_to'),
+        Index('idx_tickets_department', 'department'),
+        Index('idx_ticket_search_vector', 'search_vector', postgresql_using='gin'),
+        Index('idx_ticket_title_trgm', 'title', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
+        Index(
+            'idx_ticket_description_trgm', 'description',
+            postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'}
+        ),
+        Index('idx_ticket_next_transition', 'next_transition_at'),
         UniqueConstraint('external_id', name='uq_ticket_external_id')
     )
     
@@ -172,6 +211,32 @@ class Ticket(Base):
             self.resolution_sla_status = SLAStatus.PAUSED
             self.resolution_sla_remaining_minutes = 0
     
+    def calculate_next_transition_at(self, now: Optional[datetime] = None) -> Optional[datetime]:
+        """Calculate the next instant at which an SLA status threshold is crossed.
+        
+        Mirrors the thresholds used by ``update_sla_status``: a status moves to
+        WARNING/CRITICAL once the whole remaining minutes drop to the threshold,
+        i.e. ``(threshold + 1)`` minutes before the deadline, and to BREACHED at
+        the deadline itself. Returns ``None`` once both SLAs are breached.
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
+        
+        candidates = []
+        for deadline, target in (
+            (self.response_sla_deadline, self.response_sla_target),
+            (self.resolution_sla_deadline, self.resolution_sla_target),
+        ):
+            if not deadline:
+                continue
+            crossings = [deadline]
+            if target:
+                crossings.append(deadline - timedelta(minutes=int(target * 0.15) + 1))  # WARNING
+                crossings.append(deadline - timedelta(minutes=int(target * 0.05) + 1))  # CRITICAL
+            candidates.extend(crossing for crossing in crossings if crossing >= now)
+        
+        return min(candidates) if candidates else None
+    
     def get_sla_summary(self) -> Dict[str, Any]:
         """Get comprehensive SLA summary for API responses."""
         self.update_sla_status()
@@ -252,6 +317,11 @@ class Alert(Base):
     is_sent = Column(Boolean, default=False)
     sent_at = Column(DateTime(timezone=True))
     
+    # Outbox delivery state
+    delivery_attempts = Column(Integer, nullable=False, default=0)
+    next_delivery_at = Column(DateTime(timezone=True), comment="Earliest time the dispatcher may (re)try delivery")
+    last_delivery_error = Column(Text)
+    
     # Timestamps
     created_at = Column(DateTime(timezone=True), nullable=False, default=func.now(), index=True)
     resolved_at = Column(DateTime(timezone=True))
@@ -266,6 +336,11 @@ class Alert(Base):
     __table_args__ = (
         Index('idx_alert_active', 'is_active', 'alert_type'),
         Index('idx_alert_ticket_type', 'ticket_id', 'alert_type'),
+        Index(
+            'uq_alert_active_ticket_sla_type', 'ticket_id', 'sla_type', 'alert_type',
+            unique=True, postgresql_where=text('is_active')
+        ),
+        Index('idx_alert_pending_delivery', 'next_delivery_at', postgresql_where=text('NOT is_sent')),
     )
 
 
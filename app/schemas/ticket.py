@@ -91,6 +91,17 @@ class TicketResponse(BaseModel):
         from_attributes = True
 
 
+# Columns a ticket list can be projected to with ``?fields=``
+TICKET_FIELDS = tuple(TicketResponse.model_fields)
+
+# Columns of the ``?fields=summary`` view used by dashboards
+TICKET_SUMMARY_FIELDS = (
+    "id", "external_id", "title", "priority", "customer_tier", "status", "created_at",
+    "response_sla_status", "resolution_sla_status", "response_sla_deadline",
+    "resolution_sla_deadline", "escalation_level", "assigned_to",
+)
+
+
 class TicketSLASummary(BaseModel):
     """SLA summary information for a ticket."""
     
@@ -114,14 +125,24 @@ class TicketStatusHistoryItem(BaseModel):
         from_attributes = True
 
 
+class CountMode(str, PyEnum):
+    """How a ticket list computes its total."""
+    
+    EXACT = "exact"        # count(*) over the filtered rows
+    ESTIMATE = "estimate"  # planner statistics or a briefly cached count
+    NONE = "none"          # no total
+
+
 class TicketListResponse(BaseModel):
     """Schema for paginated ticket list response."""
     
     tickets: List[TicketResponse]
-    total: int
-    page: int
+    total: Optional[int] = Field(None, description="Matching tickets; None when count=none")
+    total_is_estimate: bool = Field(False, description="Whether total is an estimate")
+    page: Optional[int] = Field(None, description="Page number (offset pagination only)")
     size: int
-    pages: int
+    pages: Optional[int] = Field(None, description="Number of pages; None without a total")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page; None on the last page")
 
 
 class TicketBatchRequest(BaseModel):
@@ -151,6 +172,19 @@ class TicketBatchResponse(BaseModel):
     errors: List[str] = Field(default_factory=list, description="List of error messages")
 
 
+class TicketIngestResponse(BaseModel):
+    """Schema for streaming NDJSON ingestion report."""
+    
+    lines: int = Field(..., description="Number of non-empty lines read")
+    created: int = Field(..., description="Number of tickets created")
+    failed: int = Field(..., description="Number of valid tickets not created (e.g. existing external_id)")
+    invalid: int = Field(..., description="Number of lines that failed parsing or validation")
+    batches: int = Field(..., description="Number of batches written")
+    errors: List[str] = Field(default_factory=list, description="First error messages")
+    elapsed_seconds: float = Field(..., description="Wall-clock duration of the ingest")
+    tickets_per_second: float = Field(..., description="Created tickets per second")
+
+
 class TicketEvent(BaseModel):
     """Schema for ticket events from external systems."""
     
@@ -159,6 +193,22 @@ class TicketEvent(BaseModel):
     correlation_id: Optional[str] = Field(None, description="Correlation ID for tracing")
 
 
+class TicketEventBatchRequest(BaseModel):
+    """Schema for batch ingestion of ticket events."""
+    
+    events: List[TicketEvent] = Field(..., min_items=1, max_items=1000)
+
+
+class TicketEventBatchResponse(BaseModel):
+    """Schema for ticket event ingestion response."""
+    
+    created: int = Field(..., description="Number of tickets created")
+    updated: int = Field(..., description="Number of tickets updated")
+    unchanged: int = Field(..., description="Number of replayed, stale or superseded events without effect")
+    failed: int = Field(..., description="Number of failed events")
+    errors: List[str] = Field(default_factory=list, description="List of error messages")
+
+
 class TicketFilters(BaseModel):
     """Schema for filtering tickets in queries."""
     
@@ -0,0 +1,102 @@
+"""Bulk alert insertion for SLA evaluation ticks."""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from app.models.ticket import Alert
+
+logger = structlog.get_logger(__name__)
+
+# Callback invoked with the persisted alert once its row has been inserted
+AlertInsertCallback = Callable[[Alert], Awaitable[None]]
+
+
+class AlertBatch:
+    """
+    Accumulate new alerts during an evaluation tick and write them in bulk.
+
+    Alerts are collected as plain column values and inserted with one
+    multi-row ``INSERT ... RETURNING`` per chunk instead of an ``add`` plus
+    ``flush`` round trip per alert. With ``skip_active_duplicates`` enabled the
+    insert uses ``ON CONFLICT DO NOTHING`` against the partial unique index on
+    active alerts, so de-duplication is enforced atomically by the database even
+    when several evaluators race on the same ticket.
+
+    Args:
+        skip_active_duplicates: Silently skip alerts that already have an active
+            counterpart for the same ticket, SLA type and alert type
+        chunk_size: Maximum number of rows per INSERT statement
+    """
+
+    def __init__(self, skip_active_duplicates: bool = True, chunk_size: int = 1000):
+        self.skip_active_duplicates = skip_active_duplicates
+        self.chunk_size = chunk_size
+        self._rows: Dict[Tuple[UUID, str, str], Dict[str, Any]] = {}
+        self._callbacks: Dict[Tuple[UUID, str, str], AlertInsertCallback] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, on_insert: Optional[AlertInsertCallback] = None, **values: Any) -> bool:
+        """
+        Queue an alert for insertion.
+
+        Args:
+            on_insert: Coroutine function called with the inserted Alert after flush
+            **values: Alert column values; ticket_id, sla_type and alert_type are required
+
+        Returns:
+            bool: False if an alert with the same key is already queued
+        """
+        key = (values["ticket_id"], values["sla_type"], values["alert_type"])
+        if key in self._rows:
+            return False
+
+        values.setdefault("is_active", True)
+        values.setdefault("is_sent", False)
+        values.setdefault("delivery_attempts", 0)
+        values.setdefault("alert_metadata", {})
+        self._rows[key] = values
+        if on_insert is not None:
+            self._callbacks[key] = on_insert
+        return True
+
+    async def flush(self, db: AsyncSession) -> List[Alert]:
+        """
+        Insert all queued alerts and run their callbacks.
+
+        Returns:
+            List of inserted Alert objects. Alerts skipped because an active
+            duplicate already exists are not returned and their callbacks are
+            not invoked.
+        """
+        rows = list(self._rows.values())
+        callbacks = self._callbacks
+        self._rows = {}
+        self._callbacks = {}
+
+        inserted: List[Alert] = []
+        for start in range(0, len(rows), self.chunk_size):
+            stmt = pg_insert(Alert).values(rows[start:start + self.chunk_size])
+            if self.skip_active_duplicates:
+                stmt = stmt.on_conflict_do_nothing(
+                    index_elements=[Alert.ticket_id, Alert.sla_type, Alert.alert_type],
+                    index_where=Alert.is_active
+                )
+            result = await db.scalars(stmt.returning(Alert))
+            inserted.extend(result.all())
+
+        skipped = len(rows) - len(inserted)
+        if skipped:
+            logger.debug("Skipped duplicate active alerts", skipped=skipped)
+
+        for alert in inserted:
+            callback = callbacks.get((alert.ticket_id, alert.sla_type, alert.alert_type))
+            if callback is not None:
+                await callback(alert)
+
+        return inserted
@@ -9,8 +9,10 @@ import httpx
 import structlog
 
 from app.models.ticket import Ticket, Alert, EscalationLevel
-from app.config import sla_config
+from app.config import settings, sla_config
 from app.utils.sla_calculator import SLACalculator
+from app.services.alert_batch import AlertBatch
+from app.services.notification_transport import notification_transport
 
 logger = structlog.get_logger(__name__)
 
@@ -27,8 +29,10 @@ class EscalationService:
             # Update ticket escalation level
             await self._update_escalation_level(db, ticket, alert)
             
-            # Send notifications
-            await self._send_notifications(db, ticket, alert)
+            # Send notifications; with the outbox the dispatcher delivers the
+            # alert after the evaluation transaction commits
+            if not settings.notification_outbox_enabled:
+                await self._send_notifications(db, ticket, alert)
             
             # logger.info(
             #     "Alert escalation handled",
@@ -47,19 +51,36 @@ class EscalationService:
             )
             raise
     
-    async def handle_breach(self, db: AsyncSession, ticket: Ticket, sla_type: str):
-        """Handle SLA breach escalation."""
+    async def handle_breach(
+        self, 
+        db: AsyncSession, 
+        ticket: Ticket, 
+        sla_type: str, 
+        alert_batch: Optional[AlertBatch] = None
+    ):
+        """Handle SLA breach escalation.
+        
+        When ``alert_batch`` is given the breach alert is queued on it and the
+        critical notifications are sent once the batch is flushed.
+        """
         try:
             # Force maximum escalation for breaches
             ticket.escalation_level = EscalationLevel.LEVEL_4
             ticket.escalation_count += 1
             ticket.last_escalation_at = datetime.now(timezone.utc)
             
-            # Create breach notification
-            breach_alert = await self._create_breach_notification(db, ticket, sla_type)
+            async def on_insert(breach_alert: Alert):
+                # Send critical notifications
+                await self._send_critical_notifications(db, ticket, breach_alert)
             
-            # Send critical notifications
-            await self._send_critical_notifications(db, ticket, breach_alert)
+            # Create breach notification
+            batch = alert_batch if alert_batch is not None else AlertBatch()
+            self._create_breach_notification(
+                batch, ticket, sla_type,
+                None if settings.notification_outbox_enabled else on_insert
+            )
+            if alert_batch is None:
+                await batch.flush(db)
             
             logger.critical(
                 "SLA breach escalation handled",
@@ -146,25 +167,43 @@ class EscalationService:
         
         await db.flush()
     
+    @staticmethod
+    def get_notification_channel(webhook_config: Dict[str, Any], alert: Alert) -> str:
+        """Slack channel for an alert: breaches and critical alerts go to the critical channel."""
+        channels = webhook_config.get("channels", {})
+        if alert.alert_type in ("critical", "breached"):
+            return channels.get("critical", "#sla-critical")
+        return channels.get("general", "#sla-alerts")
+    
+    async def deliver_slack_notification(self, webhook_url: str, channel: str, ticket: Ticket, alert: Alert):
+        """Post an alert to the Slack webhook, raising on transport or HTTP errors."""
+        # Format message based on alert type
+        message = self._format_slack_message(ticket, alert)
+        
+        payload = {
+            "channel": channel,
+            "text": message["text"],
+            "attachments": message["attachments"]
+        }
+        
+        await notification_transport.post_json(webhook_url, payload)
+    
+    async def deliver_slack_digest(self, webhook_url: str, channel: str, alert_type: str, alerts: List[Alert]):
+        """Post one digest message covering several alerts of the same type, raising on errors."""
+        message = self._format_digest_message(alert_type, alerts)
+        
+        payload = {
+            "channel": channel,
+            "text": message["text"],
+            "attachments": message["attachments"]
+        }
+        
+        await notification_transport.post_json(webhook_url, payload)
+    
     async def _send_slack_notification(self, webhook_url: str, channel: str, ticket: Ticket, alert: Alert):
         """Send notification to Slack webhook."""
         try:
-            # Format message based on alert type
-            message = self._format_slack_message(ticket, alert)
-            
-            payload = {
-                "channel": channel,
-                "text": message["text"],
-                "attachments": message["attachments"]
-            }
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    webhook_url,
-                    json=payload,
-                    timeout=10.0
-                )
-                response.raise_for_status()
+            await self.deliver_slack_notification(webhook_url, channel, ticket, alert)
             
             # logger.info(
             #     "Slack notification sent",
@@ -198,6 +237,43 @@ class EscalationService:
         else:
             return self._format_warning_message(ticket, alert, now)
     
+    def _format_digest_message(self, alert_type: str, alerts: List[Alert]) -> Dict[str, Any]:
+        """Format a digest message with one row per ticket."""
+        now = datetime.now(timezone.utc)
+        
+        if alert_type == "breached":
+            text = f"🚨 SLA BREACH DIGEST - {len(alerts)} tickets breached"
+            color = "danger"
+        elif alert_type == "critical":
+            text = f"🔴 CRITICAL SLA DIGEST - {len(alerts)} tickets"
+            color = "warning"
+        else:
+            text = f"⚠️ SLA WARNING DIGEST - {len(alerts)} tickets"
+            color = "#ffaa00"
+        
+        rows = []
+        for alert in alerts:
+            ticket = alert.ticket
+            if alert_type == "breached":
+                remaining = "breached"
+            else:
+                remaining = f"{SLACalculator.format_duration(alert.time_remaining_minutes)} left"
+            rows.append(
+                f"• *{ticket.external_id}* {ticket.priority.value}/{ticket.customer_tier.value} - "
+                f"{alert.sla_type.title()} {remaining} - "
+                f"Level {ticket.escalation_level.value} - {ticket.assigned_to or 'Unassigned'}"
+            )
+        
+        attachments = [{
+            "color": color,
+            "text": "\n".join(rows),
+            "mrkdwn_in": ["text"],
+            "footer": "SLA Service",
+            "ts": int(now.timestamp())
+        }]
+        
+        return {"text": text, "attachments": attachments}
+    
     def _format_breach_message(self, ticket: Ticket, alert: Alert, now: datetime) -> Dict[str, Any]:
         """Format breach notification message."""
         escalation_level = sla_config.get_escalation_levels().get(ticket.escalation_level.value, "Unknown")
@@ -224,7 +300,7 @@ class EscalationService:
                 },
                 {
                     "title": "Customer Tier",
-                    "value": ticket.customer_tier.title(),
+                    "value": ticket.customer_tier.value.title(),
                     "short": True
                 },
                 {
@@ -286,7 +362,7 @@ class EscalationService:
                 },
                 {
                     "title": "Customer Tier",
-                    "value": ticket.customer_tier.title(),
+                    "value": ticket.customer_tier.value.title(),
                     "short": True
                 },
                 {
@@ -343,7 +419,7 @@ class EscalationService:
                 },
                 {
                     "title": "Customer Tier",
-                    "value": ticket.customer_tier.title(),
+                    "value": ticket.customer_tier.value.title(),
                     "short": True
                 },
                 {
@@ -368,11 +444,10 @@ class EscalationService:
         
         return {"text": text, "attachments": attachments}
     
-    async def _create_breach_notification(self, db: AsyncSession, ticket: Ticket, sla_type: str):
-        """Create a breach notification alert."""
-        from app.models.ticket import Alert as AlertModel
-        
-        alert = AlertModel(
+    def _create_breach_notification(self, alert_batch: AlertBatch, ticket: Ticket, sla_type: str, on_insert=None):
+        """Queue a breach notification alert."""
+        alert_batch.add(
+            on_insert=on_insert,
             ticket_id=ticket.id,
             alert_type="breached",
             sla_type=sla_type,
@@ -387,8 +462,3 @@ class EscalationService:
                 "breach_timestamp": datetime.now(timezone.utc).isoformat()
             }
         )
-        
-        db.add(alert)
-        await db.flush()
-        
-        return alert
@@ -0,0 +1,405 @@
+"""Background dispatcher delivering alerts recorded in the notification outbox."""
+
+import asyncio
+import math
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, update, and_, or_, any_, literal
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.orm import selectinload
+import structlog
+
+from app.config import settings, sla_config
+from app.models.ticket import Alert
+from app.services.escalation_service import EscalationService
+
+logger = structlog.get_logger(__name__)
+
+# One outgoing Slack message: channel, alert type and the alerts it covers
+NotificationMessage = Tuple[str, str, List[Alert]]
+
+# Alert types delivered without waiting for the digest window
+DIGEST_BYPASS_ALERT_TYPES = ["breached", "critical"]
+
+
+class ChannelRateBudget:
+    """
+    Token bucket limiting the messages posted to one channel.
+
+    Args:
+        rate: Messages per second refilled into the bucket
+        burst: Maximum messages sent back to back
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """
+        Take one message from the budget.
+
+        Returns:
+            float: 0 if the message may be sent now, otherwise the seconds
+            until the budget allows it (nothing is taken in that case)
+        """
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+
+class NotificationDispatcher:
+    """
+    Drain unsent alerts from the ``alerts`` table and deliver them to Slack.
+
+    SLA evaluation only records alerts (``is_sent = false``) in its own
+    transaction; this dispatcher delivers them afterwards, so evaluation time
+    no longer depends on webhook latency and no database locks are held while
+    a webhook is slow.
+
+    Each round claims a batch of due alerts with ``FOR UPDATE SKIP LOCKED`` and
+    pushes their ``next_delivery_at`` out by a lease, so concurrent dispatchers
+    on other replicas skip them while they are in flight. Deliveries run
+    concurrently up to ``concurrency``. Delivered alerts are marked sent in one
+    UPDATE; failed ones are retried with exponential backoff until
+    ``max_attempts`` is reached. Alerts older than ``max_age_minutes`` are
+    no longer delivered.
+
+    During alert storms, claimed alerts are coalesced per channel and alert
+    type into digest messages with one row per ticket, and every channel has a
+    token-bucket rate budget. Both are configured under
+    ``notifications.slack`` in ``sla_config.yaml``::
+
+        digest:
+          enabled: true
+          window_seconds: 5   # wait this long for alerts to accumulate
+          bypass_alert_types: [breached, critical]  # sent without waiting
+          min_alerts: 3       # smaller groups are sent as single messages
+          max_rows: 20        # tickets per digest message
+        rate_limit:
+          messages_per_second: 1
+          burst: 5
+
+    Messages over budget are not failed; their alerts are pushed back until
+    the budget allows them, where they coalesce with newer alerts.
+
+    Args:
+        escalation_service: Service used to format and post notifications
+        batch_size: Maximum alerts claimed per round
+        concurrency: Maximum notifications in flight
+        poll_interval: Seconds between rounds while the outbox is empty
+        lease_seconds: Seconds a claimed alert is hidden from other dispatchers
+        max_attempts: Deliveries attempted before an alert is given up
+        backoff_seconds: Delay before the first retry, doubled per attempt
+        backoff_max_seconds: Upper bound of the retry delay
+        max_age_minutes: Alerts older than this are not delivered anymore
+    """
+
+    def __init__(
+        self,
+        escalation_service: EscalationService,
+        batch_size: int = 100,
+        concurrency: int = 10,
+        poll_interval: float = 1.0,
+        lease_seconds: float = 60.0,
+        max_attempts: int = 5,
+        backoff_seconds: float = 5.0,
+        backoff_max_seconds: float = 600.0,
+        max_age_minutes: int = 60
+    ):
+        self.escalation_service = escalation_service
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.max_age_minutes = max_age_minutes
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._rate_budgets: Dict[str, ChannelRateBudget] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._session_factory = None
+
+    async def start(self, session_factory):
+        """Start the dispatcher task."""
+        self._session_factory = session_factory
+        self._task = asyncio.create_task(self._run(), name="notification-dispatcher")
+
+    async def stop(self):
+        """Stop the dispatcher task; claimed but undelivered alerts are retried after their lease."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def wake(self):
+        """Run the next round now instead of waiting for the poll interval."""
+        self._wakeup.set()
+
+    async def _run(self):
+        """Deliver batches back to back while the outbox is full, then poll."""
+        while True:
+            self._wakeup.clear()
+            try:
+                claimed = await self.dispatch_pending()
+            except Exception as e:
+                logger.error("Notification dispatch failed", error=str(e))
+                claimed = 0
+
+            if claimed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def dispatch_pending(self) -> int:
+        """
+        Claim and deliver one batch of pending alerts.
+
+        Returns:
+            int: Number of alerts claimed
+        """
+        webhook_config = sla_config.get_webhook_config("slack")
+        webhook_url = webhook_config.get("slack_webhook_url")
+        if not webhook_url:
+            return 0
+
+        notification_config = sla_config.get_notification_config("slack")
+        digest_config = notification_config.get("digest", {})
+        digest_enabled = digest_config.get("enabled", False)
+        window_seconds = digest_config.get("window_seconds", 0) if digest_enabled else 0
+        bypass_alert_types = digest_config.get("bypass_alert_types", DIGEST_BYPASS_ALERT_TYPES)
+
+        alerts = await self._claim_pending(window_seconds, bypass_alert_types)
+        if not alerts:
+            return 0
+
+        messages = self._build_messages(alerts, webhook_config, digest_config if digest_enabled else None)
+
+        # Hold back messages over their channel's rate budget
+        deliverable: List[NotificationMessage] = []
+        deferred: Dict[UUID, float] = {}
+        rate_config = notification_config.get("rate_limit", {})
+        for message in messages:
+            wait_seconds = self._reserve_budget(message[0], rate_config)
+            if wait_seconds > 0:
+                deferred.update((alert.id, wait_seconds) for alert in message[2])
+            else:
+                deliverable.append(message)
+
+        errors = await asyncio.gather(
+            *(self._deliver(webhook_url, message) for message in deliverable)
+        )
+
+        results: List[Tuple[Alert, Optional[str]]] = []
+        for (_, _, message_alerts), error in zip(deliverable, errors):
+            results.extend((alert, error) for alert in message_alerts)
+        await self._record_results(results, deferred)
+
+        if deferred:
+            logger.info("Notifications deferred by rate budget", alerts=len(deferred))
+        return len(alerts)
+
+    async def _claim_pending(
+        self,
+        window_seconds: float = 0,
+        bypass_alert_types: Optional[List[str]] = None
+    ) -> List[Alert]:
+        """
+        Lease a batch of due alerts and load them with their tickets.
+
+        Alerts younger than ``window_seconds`` are left for a later round so
+        that alerts raised in the same tick end up in the same digest, except
+        for ``bypass_alert_types`` (breaches and critical alerts), which are
+        claimed right away.
+        """
+        now = datetime.now(timezone.utc)
+
+        pending = (
+            select(Alert.id)
+            .where(
+                and_(
+                    Alert.is_sent.is_(False),
+                    or_(Alert.next_delivery_at.is_(None), Alert.next_delivery_at <= now),
+                    Alert.delivery_attempts < self.max_attempts,
+                    Alert.created_at >= now - timedelta(minutes=self.max_age_minutes),
+                    or_(
+                        Alert.created_at <= now - timedelta(seconds=window_seconds),
+                        Alert.alert_type.in_(bypass_alert_types or [])
+                    )
+                )
+            )
+            .order_by(Alert.created_at)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+
+        async with self._session_factory() as db:
+            result = await db.execute(
+                update(Alert)
+                .where(Alert.id.in_(pending.scalar_subquery()))
+                .values(next_delivery_at=now + timedelta(seconds=self.lease_seconds))
+                .returning(Alert.id)
+                .execution_options(synchronize_session=False)
+            )
+            alert_ids = list(result.scalars())
+            if not alert_ids:
+                await db.commit()
+                return []
+
+            result = await db.execute(
+                select(Alert)
+                .options(selectinload(Alert.ticket))
+                .where(Alert.id == any_(literal(alert_ids, ARRAY(PG_UUID(as_uuid=True)))))
+                .order_by(Alert.created_at)
+            )
+            alerts = list(result.scalars())
+            await db.commit()
+
+        return alerts
+
+    def _build_messages(
+        self,
+        alerts: List[Alert],
+        webhook_config: Dict[str, Any],
+        digest_config: Optional[Dict[str, Any]]
+    ) -> List[NotificationMessage]:
+        """Group alerts per channel and alert type into single and digest messages."""
+        groups: Dict[Tuple[str, str], List[Alert]] = defaultdict(list)
+        for alert in alerts:
+            channel = self.escalation_service.get_notification_channel(webhook_config, alert)
+            groups[(channel, alert.alert_type)].append(alert)
+
+        min_alerts = digest_config.get("min_alerts", 3) if digest_config else None
+        max_rows = max(1, digest_config.get("max_rows", 20)) if digest_config else 1
+
+        messages: List[NotificationMessage] = []
+        for (channel, alert_type), group in groups.items():
+            if min_alerts is None or len(group) < min_alerts:
+                messages.extend((channel, alert_type, [alert]) for alert in group)
+                continue
+            for start in range(0, len(group), max_rows):
+                messages.append((channel, alert_type, group[start:start + max_rows]))
+        return messages
+
+    def _reserve_budget(self, channel: str, rate_config: Dict[str, Any]) -> float:
+        """Take one message from the channel's budget; returns seconds to wait if exhausted."""
+        rate = rate_config.get("messages_per_second", 0)
+        if not rate or rate <= 0:
+            return 0.0
+
+        burst = max(1, int(rate_config.get("burst", 1)))
+        budget = self._rate_budgets.get(channel)
+        if budget is None or budget.rate != rate or budget.burst != burst:
+            # New channel or changed configuration
+            budget = ChannelRateBudget(rate, burst)
+            self._rate_budgets[channel] = budget
+        return budget.reserve()
+
+    async def _deliver(self, webhook_url: str, message: NotificationMessage) -> Optional[str]:
+        """Deliver one message; returns the error message on failure."""
+        channel, alert_type, alerts = message
+        async with self._semaphore:
+            try:
+                if len(alerts) == 1:
+                    await self.escalation_service.deliver_slack_notification(
+                        webhook_url, channel, alerts[0].ticket, alerts[0]
+                    )
+                else:
+                    await self.escalation_service.deliver_slack_digest(
+                        webhook_url, channel, alert_type, alerts
+                    )
+            except Exception as e:
+                logger.warning(
+                    "Notification delivery failed",
+                    channel=channel,
+                    alert_type=alert_type,
+                    alerts=len(alerts),
+                    error=str(e)
+                )
+                return str(e) or type(e).__name__
+        return None
+
+    async def _record_results(self, results: List[Tuple[Alert, Optional[str]]], deferred: Dict[UUID, float]):
+        """Mark delivered alerts sent and reschedule failed and deferred ones, in bulk."""
+        now = datetime.now(timezone.utc)
+        sent_ids: List[UUID] = []
+        retries: List[Dict[str, Any]] = []
+
+        for alert, error in results:
+            if error is None:
+                sent_ids.append(alert.id)
+                continue
+            attempts = alert.delivery_attempts + 1
+            delay = min(self.backoff_max_seconds, self.backoff_seconds * 2 ** (attempts - 1))
+            retries.append({
+                "id": alert.id,
+                "delivery_attempts": attempts,
+                "next_delivery_at": now + timedelta(seconds=delay),
+                "last_delivery_error": error[:1000]
+            })
+            if attempts >= self.max_attempts:
+                logger.error(
+                    "Giving up notification delivery",
+                    alert_id=str(alert.id),
+                    ticket_id=str(alert.ticket_id),
+                    attempts=attempts
+                )
+
+        # Deferred alerts keep their attempt count
+        retries.extend(
+            {"id": alert_id, "next_delivery_at": now + timedelta(seconds=wait_seconds)}
+            for alert_id, wait_seconds in deferred.items()
+        )
+
+        async with self._session_factory() as db:
+            if sent_ids:
+                await db.execute(
+                    update(Alert)
+                    .where(Alert.id == any_(literal(sent_ids, ARRAY(PG_UUID(as_uuid=True)))))
+                    .values(
+                        is_sent=True,
+                        sent_at=now,
+                        delivery_attempts=Alert.delivery_attempts + 1,
+                        next_delivery_at=None,
+                        last_delivery_error=None
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+            if retries:
+                # Bulk UPDATE by primary key, executed as one executemany
+                await db.execute(update(Alert), retries)
+            await db.commit()
+
+
+# Process-wide dispatcher, started from the application lifespan
+notification_dispatcher = NotificationDispatcher(
+    EscalationService(),
+    batch_size=settings.notification_dispatch_batch_size,
+    concurrency=settings.notification_dispatch_concurrency,
+    poll_interval=settings.notification_dispatch_poll_interval,
+    # Long enough for every request of a full batch to time out
+    lease_seconds=settings.notification_timeout * (
+        math.ceil(settings.notification_dispatch_batch_size / settings.notification_dispatch_concurrency) + 1
+    ),
+    max_attempts=settings.notification_max_attempts,
+    backoff_seconds=settings.notification_retry_backoff,
+    backoff_max_seconds=settings.notification_retry_backoff_max,
+    max_age_minutes=settings.notification_max_age_minutes
+)
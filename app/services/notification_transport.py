@@ -0,0 +1,93 @@
+"""Shared HTTP transport for outgoing webhook notifications."""
+
+from typing import Any, Dict, Optional
+
+import httpx
+import structlog
+
+from app.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+class NotificationTransport:
+    """
+    Pooled HTTP client shared by every notification sender.
+
+    One ``httpx.AsyncClient`` is opened for the lifetime of the application, so
+    connections to the webhook host are kept alive and reused instead of paying
+    TCP and TLS setup for every alert. With HTTP/2 enabled, concurrent
+    notifications are multiplexed over a single connection.
+
+    Args:
+        http2: Negotiate HTTP/2 when the server supports it
+        max_connections: Maximum concurrent connections in the pool
+        max_keepalive_connections: Idle connections kept open for reuse
+        keepalive_expiry: Seconds an idle connection is kept open
+        timeout: Overall request timeout in seconds
+        connect_timeout: Connection establishment timeout in seconds
+    """
+
+    def __init__(
+        self,
+        http2: bool = True,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 10.0,
+        connect_timeout: float = 5.0
+    ):
+        self.http2 = http2
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared client, opened on first use outside the application lifespan."""
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+
+    async def start(self):
+        """Open the connection pool."""
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+
+    async def close(self):
+        """Close the connection pool and every open connection."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def post_json(self, url: str, payload: Dict[str, Any]) -> httpx.Response:
+        """POST a JSON payload and raise for non-2xx responses."""
+        response = await self.client.post(url, json=payload)
+        response.raise_for_status()
+        return response
+
+    def _create_client(self) -> httpx.AsyncClient:
+        http2 = self.http2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("h2 package not installed, falling back to HTTP/1.1 for notifications")
+                http2 = False
+
+        return httpx.AsyncClient(http2=http2, limits=self.limits, timeout=self.timeout)
+
+
+# Process-wide transport, opened and closed by the application lifespan
+notification_transport = NotificationTransport(
+    http2=settings.notification_http2,
+    max_connections=settings.notification_max_connections,
+    max_keepalive_connections=settings.notification_max_keepalive_connections,
+    keepalive_expiry=settings.notification_keepalive_expiry,
+    timeout=settings.notification_timeout,
+    connect_timeout=settings.notification_connect_timeout
+)
@@ -0,0 +1,105 @@
+"""Shard leases for running SLA evaluation on multiple replicas."""
+
+import random
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
+from sqlalchemy import Text, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# First key of the two-key advisory lock space reserved for SLA evaluation shards
+SLA_SHARD_LOCK_NAMESPACE = 0x534C41  # "SLA"
+
+
+def shard_filter(id_column, shard: int, shard_count: int):
+    """
+    Build a filter selecting the rows of one shard.
+
+    Tickets are partitioned by a hash of their id, computed in Postgres so that
+    every replica agrees on the assignment without any coordination.
+    """
+    shard_key = func.hashtext(cast(id_column, Text)).op("&")(0x7FFFFFFF)
+    return shard_key % shard_count == shard
+
+
+class ShardLease:
+    """Shards claimed by this worker for the duration of one evaluation tick."""
+
+    def __init__(self, conn: AsyncConnection, shard_count: int, max_shards: Optional[int]):
+        self._conn = conn
+        self.shard_count = shard_count
+        self.max_shards = max_shards
+        self.claimed: List[int] = []
+
+    async def claim_shards(self) -> AsyncIterator[int]:
+        """
+        Yield shards as they are claimed.
+
+        Shards are tried in random order with ``pg_try_advisory_lock``; shards
+        held by another replica are skipped. A claimed shard stays locked until
+        the lease ends, so no other replica evaluates it again in the same tick.
+        Because each worker only claims the next shard after finishing the
+        previous one, faster replicas naturally pick up more shards.
+        """
+        shards = list(range(self.shard_count))
+        random.shuffle(shards)
+
+        for shard in shards:
+            if self.max_shards is not None and len(self.claimed) >= self.max_shards:
+                break
+            acquired = await self._conn.scalar(
+                select(func.pg_try_advisory_lock(SLA_SHARD_LOCK_NAMESPACE, shard))
+            )
+            # Session-level locks survive the commit; don't sit idle in a transaction
+            await self._conn.commit()
+            if acquired:
+                self.claimed.append(shard)
+                yield shard
+
+    async def release(self):
+        """Release every shard claimed during this lease."""
+        for shard in self.claimed:
+            await self._conn.scalar(
+                select(func.pg_advisory_unlock(SLA_SHARD_LOCK_NAMESPACE, shard))
+            )
+        await self._conn.commit()
+        self.claimed = []
+
+
+class ShardLeaseManager:
+    """
+    Hand out SLA evaluation shards to workers through Postgres advisory locks.
+
+    Session-level advisory locks are held on a dedicated connection for the
+    whole tick. Evaluation sessions commit independently, so the locks cannot
+    live on those sessions' connections, which go back to the pool on commit.
+
+    Args:
+        engine: Async engine used to open the lock connection
+        shard_count: Number of shards tickets are partitioned into
+        max_shards_per_worker: Upper bound of shards one worker claims per tick;
+            None lets a worker take every shard that is free
+    """
+
+    def __init__(self, engine: AsyncEngine, shard_count: int, max_shards_per_worker: Optional[int] = None):
+        self.engine = engine
+        self.shard_count = shard_count
+        self.max_shards_per_worker = max_shards_per_worker
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[ShardLease]:
+        """Open a lease for one evaluation tick and release its shards afterwards."""
+        async with self.engine.connect() as conn:
+            lease = ShardLease(conn, self.shard_count, self.max_shards_per_worker)
+            try:
+                yield lease
+            finally:
+                try:
+                    await lease.release()
+                except Exception as e:
+                    # Locks die with the connection if it is discarded
+                    await conn.invalidate()
+                    logger.error("Failed to release SLA shard locks", error=str(e))
@@ -1,22 +1,31 @@
 """SLA evaluation engine with background processing."""
 
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, and_, or_, func
+import numpy as np
+from sqlalchemy import select, update, and_, or_, func, any_, literal, case, cast, true, Integer
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.models.ticket import Ticket, Alert, SLAStatus, EscalationLevel,TicketStatus
+from app.models.ticket import Ticket, Alert, SLAStatus, EscalationLevel,TicketStatus, TERMINAL_STATUSES
 from app.services.ticket_service import TicketService
 from app.services.escalation_service import EscalationService
-from app.config import sla_config, settings
+from app.services.alert_batch import AlertBatch
+from app.services.shard_lease import shard_filter
+from app.config import settings
 from app.utils.sla_calculator import SLACalculator
+from app.utils import sla_kernel
+from app.utils.sla_targets import sla_targets
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# (ticket_id, sla_type, alert_type) of an active alert
+AlertKey = Tuple[UUID, str, str]
+
 
 class SLAEngine:
     """
@@ -53,7 +62,7 @@ class SLAEngine:
         self.sla_calculator = SLACalculator()
         self.is_running = False
     
-    async def evaluate_all_tickets(self, db: AsyncSession) -> Dict[str, Any]:
+    async def evaluate_all_tickets(self, db: AsyncSession, shard: Optional[int] = None) -> Dict[str, Any]:
         """
         Evaluate SLA status and compliance for all active tickets in the system.
         
@@ -75,6 +84,7 @@ class SLAEngine:
         
         Args:
             db: AsyncSession for database operations
+            shard: Only evaluate tickets of this shard (see ``settings.sla_shard_count``)
             
         Returns:
             Dict containing processing statistics:
@@ -87,39 +97,15 @@ class SLAEngine:
             Exception: If evaluation fails, database changes are rolled back
         """
         start_time = datetime.now(timezone.utc)
-        processed_count = 0
-        alert_count = 0
-        breach_count = 0
         
         try:
             # Get all open tickets that haven't been resolved/closed
-            open_tickets_query = select(Ticket).where(
-                and_(
-                    Ticket.status.not_in([
-                        TicketStatus.RESOLVED,
-                        TicketStatus.CLOSED,
-                        TicketStatus.CANCELLED,
-                    ]),
-                    Ticket.response_sla_deadline.isnot(None)
-                )
-            )
+            open_tickets_query = select(Ticket).where(self._open_tickets_filter(shard))
             
             result = await db.execute(open_tickets_query)
             tickets = result.scalars().all()
-            
-            for ticket in tickets:
-                processed_count += 1
-                
-                # Update SLA status for this ticket
-                await self._evaluate_ticket_sla(db, ticket)
-                
-                # Check for alerts and escalations
-                alerts_created = await self._check_and_create_alerts(db, ticket)
-                alert_count += len(alerts_created)
-                
-                # Check for breaches
-                if await self._check_for_breaches(db, ticket):
-                    breach_count += 1
+            processed_count = len(tickets)
+            alert_count, breach_count = await self._evaluate_batch(db, tickets, start_time)
             
             await db.commit()
             
@@ -145,7 +131,594 @@ class SLAEngine:
             logger.error("SLA evaluation failed", error=str(e))
             raise
     
-    async def _evaluate_ticket_sla(self, db: AsyncSession, ticket: Ticket):
+    async def evaluate_due_tickets(self, db: AsyncSession, shard: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Evaluate only the tickets whose next SLA threshold crossing is due.
+        
+        Incremental counterpart of ``evaluate_all_tickets``. Every evaluation
+        persists ``Ticket.next_transition_at`` (the next warning, critical or
+        breach instant), so a tick only has to load the open tickets whose
+        ``next_transition_at`` has passed. Tickets whose status cannot change
+        before the next tick are never touched, which keeps the cost of a tick
+        proportional to the number of state changes instead of the backlog.
+        
+        Args:
+            db: AsyncSession for database operations
+            shard: Only evaluate tickets of this shard
+            
+        Returns:
+            Dict with the same processing statistics as ``evaluate_all_tickets``.
+            
+        Raises:
+            Exception: If evaluation fails, database changes are rolled back
+        """
+        start_time = datetime.now(timezone.utc)
+        
+        try:
+            # Skip tickets another evaluator (timer or replica) is working on
+            due_tickets_query = (
+                select(Ticket)
+                .where(self._due_tickets_filter(start_time, shard))
+                .with_for_update(skip_locked=True)
+            )
+            
+            result = await db.execute(due_tickets_query)
+            tickets = result.scalars().all()
+            processed_count = len(tickets)
+            alert_count, breach_count = await self._evaluate_batch(db, tickets, start_time)
+            
+            await db.commit()
+            
+            evaluation_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+            
+            logger.info(
+                "Incremental SLA evaluation completed",
+                processed_tickets=processed_count,
+                alerts_created=alert_count,
+                breaches_detected=breach_count,
+                evaluation_time_seconds=evaluation_time
+            )
+            
+            return {
+                "processed_tickets": processed_count,
+                "alerts_created": alert_count,
+                "breaches_detected": breach_count,
+                "evaluation_time_seconds": evaluation_time
+            }
+            
+        except Exception as e:
+            await db.rollback()
+            logger.error("Incremental SLA evaluation failed", error=str(e))
+            raise
+    
+    async def evaluate_tickets_streaming(
+        self, 
+        db: AsyncSession, 
+        due_only: bool = False, 
+        chunk_size: Optional[int] = None,
+        shard: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Evaluate tickets in fixed-size chunks with bounded memory.
+        
+        Tickets are read with keyset pagination on the primary key rather than
+        a single ``scalars().all()``. Each chunk is evaluated, committed and then
+        expunged from the session, so the identity map never holds more than one
+        chunk and peak memory stays flat regardless of the backlog size. Keyset
+        pagination is used instead of a server-side cursor because committing
+        per chunk would close the cursor.
+        
+        A failing chunk is rolled back and logged without aborting the rest of
+        the tick; its tickets are picked up again on the next run.
+        
+        Args:
+            db: AsyncSession for database operations
+            due_only: Only evaluate tickets whose next threshold crossing is due
+                (same selection as ``evaluate_due_tickets``)
+            chunk_size: Tickets per chunk, defaults to ``settings.sla_evaluation_chunk_size``
+            shard: Only evaluate tickets of this shard
+            
+        Returns:
+            Dict with the statistics of ``evaluate_all_tickets`` plus
+            ``failed_chunks``, the number of chunks that were rolled back.
+        """
+        start_time = datetime.now(timezone.utc)
+        chunk_size = chunk_size or settings.sla_evaluation_chunk_size
+        ticket_filter = (
+            self._due_tickets_filter(start_time, shard) if due_only else self._open_tickets_filter(shard)
+        )
+        processed_count = 0
+        alert_count = 0
+        breach_count = 0
+        failed_chunks = 0
+        last_id = None
+        
+        while True:
+            chunk_query = select(Ticket).where(ticket_filter).order_by(Ticket.id).limit(chunk_size)
+            if due_only:
+                chunk_query = chunk_query.with_for_update(skip_locked=True)
+            if last_id is not None:
+                chunk_query = chunk_query.where(Ticket.id > last_id)
+            
+            result = await db.execute(chunk_query)
+            tickets = result.scalars().all()
+            if not tickets:
+                break
+            first_id, last_id = tickets[0].id, tickets[-1].id
+            
+            try:
+                chunk_alerts, chunk_breaches = await self._evaluate_batch(db, tickets, start_time)
+                await db.commit()
+                processed_count += len(tickets)
+                alert_count += chunk_alerts
+                breach_count += chunk_breaches
+            except Exception as e:
+                await db.rollback()
+                failed_chunks += 1
+                logger.error(
+                    "SLA evaluation chunk failed",
+                    first_ticket_id=str(first_id),
+                    last_ticket_id=str(last_id),
+                    error=str(e)
+                )
+            finally:
+                # Drop processed tickets and alerts from the identity map
+                db.expunge_all()
+            
+            if len(tickets) < chunk_size:
+                break
+        
+        evaluation_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+        
+        logger.info(
+            "Streaming SLA evaluation completed",
+            processed_tickets=processed_count,
+            alerts_created=alert_count,
+            breaches_detected=breach_count,
+            failed_chunks=failed_chunks,
+            evaluation_time_seconds=evaluation_time
+        )
+        
+        return {
+            "processed_tickets": processed_count,
+            "alerts_created": alert_count,
+            "breaches_detected": breach_count,
+            "failed_chunks": failed_chunks,
+            "evaluation_time_seconds": evaluation_time
+        }
+    
+    async def evaluate_tickets_sql(self, db: AsyncSession, shard: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Recompute SLA statuses for all open tickets with one set-based UPDATE.
+        
+        The status and remaining-minute rules of ``Ticket.update_sla_status`` are
+        expressed in SQL (see ``_sql_sla_state``) and applied with a single
+        ``UPDATE tickets ... FROM (SELECT ...) RETURNING`` statement wrapped in a
+        CTE. Only rows whose response or resolution status actually changed are
+        returned, so Python only loads those tickets and runs the alert, breach
+        and escalation side effects for them.
+        
+        Args:
+            db: AsyncSession for database operations
+            shard: Only evaluate tickets of this shard
+            
+        Returns:
+            Dict with the statistics of ``evaluate_all_tickets``; ``processed_tickets``
+            counts the tickets whose SLA status transitioned.
+            
+        Raises:
+            Exception: If evaluation fails, database changes are rolled back
+        """
+        start_time = datetime.now(timezone.utc)
+        alert_count = 0
+        breach_count = 0
+        
+        try:
+            current = Ticket.__table__.alias("ticket_state")
+            response_status, response_remaining = self._sql_sla_state(
+                current.c.response_sla_deadline, current.c.response_sla_target, start_time
+            )
+            resolution_status, resolution_remaining = self._sql_sla_state(
+                current.c.resolution_sla_deadline, current.c.resolution_sla_target, start_time
+            )
+            computed = (
+                select(
+                    current.c.id,
+                    current.c.response_sla_status.label("old_response_status"),
+                    current.c.resolution_sla_status.label("old_resolution_status"),
+                    response_status.label("response_status"),
+                    response_remaining.label("response_remaining"),
+                    resolution_status.label("resolution_status"),
+                    resolution_remaining.label("resolution_remaining"),
+                )
+                .where(
+                    and_(
+                        current.c.status.not_in(TERMINAL_STATUSES),
+                        current.c.response_sla_deadline.isnot(None),
+                        self._shard_filter(current.c.id, shard)
+                    )
+                )
+                .subquery("computed")
+            )
+            updated = (
+                update(Ticket)
+                .where(Ticket.id == computed.c.id)
+                .where(
+                    or_(
+                        Ticket.response_sla_status.is_distinct_from(computed.c.response_status),
+                        Ticket.resolution_sla_status.is_distinct_from(computed.c.resolution_status),
+                        Ticket.response_sla_remaining_minutes.is_distinct_from(computed.c.response_remaining),
+                        Ticket.resolution_sla_remaining_minutes.is_distinct_from(computed.c.resolution_remaining),
+                    )
+                )
+                .values(
+                    response_sla_status=computed.c.response_status,
+                    response_sla_remaining_minutes=computed.c.response_remaining,
+                    resolution_sla_status=computed.c.resolution_status,
+                    resolution_sla_remaining_minutes=computed.c.resolution_remaining,
+                )
+                .returning(
+                    Ticket.id,
+                    computed.c.old_response_status,
+                    computed.c.old_resolution_status,
+                    computed.c.response_status,
+                    computed.c.resolution_status,
+                )
+                .cte("updated")
+            )
+            transitions_query = select(
+                updated.c.id, updated.c.old_response_status, updated.c.old_resolution_status
+            ).where(
+                or_(
+                    updated.c.old_response_status.is_distinct_from(updated.c.response_status),
+                    updated.c.old_resolution_status.is_distinct_from(updated.c.resolution_status),
+                )
+            )
+            
+            result = await db.execute(transitions_query)
+            previous_statuses = {
+                ticket_id: {"response": old_response, "resolution": old_resolution}
+                for ticket_id, old_response, old_resolution in result
+            }
+            
+            # Side effects only for the tickets that transitioned, loaded in chunks
+            ticket_ids = list(previous_statuses)
+            chunk_size = settings.sla_evaluation_chunk_size
+            for start in range(0, len(ticket_ids), chunk_size):
+                chunk_ids = ticket_ids[start:start + chunk_size]
+                tickets_result = await db.execute(
+                    select(Ticket)
+                    .where(Ticket.id == any_(literal(chunk_ids, ARRAY(PG_UUID(as_uuid=True)))))
+                    .execution_options(populate_existing=True)
+                )
+                tickets = tickets_result.scalars().all()
+                chunk_alerts, chunk_breaches = await self._evaluate_batch(
+                    db, tickets, start_time, previous_statuses
+                )
+                alert_count += chunk_alerts
+                breach_count += chunk_breaches
+            
+            await db.commit()
+            
+            evaluation_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+            
+            logger.info(
+                "SQL SLA evaluation completed",
+                processed_tickets=len(ticket_ids),
+                alerts_created=alert_count,
+                breaches_detected=breach_count,
+                evaluation_time_seconds=evaluation_time
+            )
+            
+            return {
+                "processed_tickets": len(ticket_ids),
+                "alerts_created": alert_count,
+                "breaches_detected": breach_count,
+                "evaluation_time_seconds": evaluation_time
+            }
+            
+        except Exception as e:
+            await db.rollback()
+            logger.error("SQL SLA evaluation failed", error=str(e))
+            raise
+    
+    @staticmethod
+    def _sql_sla_state(deadline, target, now: datetime):
+        """
+        Build SQL expressions for the SLA status and remaining minutes of one SLA.
+        
+        Mirrors ``Ticket.update_sla_status``: remaining minutes are whole minutes
+        clamped at zero, BREACHED once the deadline has passed, CRITICAL/WARNING
+        when the remaining minutes drop to 5%/15% of the target (truncated), and
+        PAUSED when there is no deadline.
+        """
+        remaining_seconds = func.extract("epoch", deadline - now)
+        remaining_minutes = func.greatest(0, cast(func.floor(remaining_seconds / 60), Integer))
+        status_type = Ticket.__table__.c.response_sla_status.type
+        status = case(
+            (deadline.is_(None), literal(SLAStatus.PAUSED, status_type)),
+            (remaining_seconds <= 0, literal(SLAStatus.BREACHED, status_type)),
+            (remaining_minutes <= func.floor(target * 0.05), literal(SLAStatus.CRITICAL, status_type)),
+            (remaining_minutes <= func.floor(target * 0.15), literal(SLAStatus.WARNING, status_type)),
+            else_=literal(SLAStatus.COMPLIANT, status_type)
+        )
+        remaining = case((deadline.is_(None), 0), else_=remaining_minutes)
+        return status, remaining
+    
+    async def evaluate_tickets_by_id(self, db: AsyncSession, ticket_ids: List[UUID]) -> Dict[str, Any]:
+        """
+        Evaluate the given tickets if their next threshold crossing is due.
+        
+        Used by the SLA timer to evaluate tickets at their exact crossing
+        instant. Tickets that are no longer due, or that are locked by another
+        evaluator, are skipped.
+        
+        Args:
+            db: AsyncSession for database operations
+            ticket_ids: Tickets to evaluate
+            
+        Returns:
+            Dict with the same processing statistics as ``evaluate_all_tickets``.
+        """
+        start_time = datetime.now(timezone.utc)
+        
+        try:
+            result = await db.execute(
+                select(Ticket)
+                .where(
+                    and_(
+                        Ticket.id == any_(literal(ticket_ids, ARRAY(PG_UUID(as_uuid=True)))),
+                        self._due_tickets_filter(start_time)
+                    )
+                )
+                .with_for_update(skip_locked=True)
+            )
+            tickets = result.scalars().all()
+            alert_count, breach_count = await self._evaluate_batch(db, tickets, start_time)
+            
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.error("SLA evaluation of due tickets failed", tickets=len(ticket_ids), error=str(e))
+            raise
+        
+        return {
+            "processed_tickets": len(tickets),
+            "alerts_created": alert_count,
+            "breaches_detected": breach_count,
+            "evaluation_time_seconds": (datetime.now(timezone.utc) - start_time).total_seconds()
+        }
+    
+    async def run_evaluation(self, db: AsyncSession, shard: Optional[int] = None) -> Dict[str, Any]:
+        """Run one evaluation tick, optionally for a single shard, using the mode selected in settings."""
+        if settings.sla_evaluation_mode == "full":
+            return await self.evaluate_all_tickets(db, shard=shard)
+        if settings.sla_evaluation_mode == "streaming":
+            return await self.evaluate_tickets_streaming(db, shard=shard)
+        if settings.sla_evaluation_mode == "sql":
+            return await self.evaluate_tickets_sql(db, shard=shard)
+        return await self.evaluate_due_tickets(db, shard=shard)
+    
+    async def run_sharded_evaluation(self, session_factory, lease_manager) -> Dict[str, Any]:
+        """
+        Evaluate every shard this worker can claim during the current tick.
+        
+        Each replica runs this on its own schedule. Shards are claimed one at a
+        time through advisory locks (see ``ShardLeaseManager``), each with its
+        own session, so replicas split the tickets between them instead of
+        evaluating them twice. Duplicate alerts are additionally prevented by
+        the partial unique index on active alerts.
+        
+        Args:
+            session_factory: Callable returning a new AsyncSession context manager
+            lease_manager: ShardLeaseManager handing out the shards
+            
+        Returns:
+            Dict with summed statistics and the list of evaluated shards.
+        """
+        totals = {"processed_tickets": 0, "alerts_created": 0, "breaches_detected": 0, "shards": []}
+        
+        async with lease_manager.lease() as lease:
+            async for shard in lease.claim_shards():
+                try:
+                    async with session_factory() as db:
+                        result = await self.run_evaluation(db, shard=shard)
+                except Exception as e:
+                    logger.error("SLA evaluation of shard failed", shard=shard, error=str(e))
+                    continue
+                totals["shards"].append(shard)
+                for key in ("processed_tickets", "alerts_created", "breaches_detected"):
+                    totals[key] += result.get(key, 0)
+        
+        return totals
+    
+    @staticmethod
+    def _shard_filter(id_column, shard: Optional[int]):
+        """Filter restricting a query to one shard, or no restriction without a shard."""
+        if shard is None:
+            return true()
+        return shard_filter(id_column, shard, settings.sla_shard_count)
+    
+    def _open_tickets_filter(self, shard: Optional[int] = None):
+        """Filter selecting every open ticket with SLA deadlines."""
+        return and_(
+            Ticket.status.not_in(TERMINAL_STATUSES),
+            Ticket.response_sla_deadline.isnot(None),
+            self._shard_filter(Ticket.id, shard)
+        )
+    
+    def _due_tickets_filter(self, now: datetime, shard: Optional[int] = None):
+        """Filter selecting open tickets whose next threshold crossing has passed."""
+        return and_(
+            Ticket.status.not_in(TERMINAL_STATUSES),
+            Ticket.next_transition_at <= now,
+            self._shard_filter(Ticket.id, shard)
+        )
+    
+    async def _evaluate_batch(
+        self, 
+        db: AsyncSession, 
+        tickets: List[Ticket], 
+        now: datetime,
+        previous_statuses: Optional[Dict[UUID, Dict[str, SLAStatus]]] = None
+    ) -> Tuple[int, int]:
+        """
+        Evaluate a batch of tickets and write the resulting alerts.
+        
+        Active alerts for the whole batch are prefetched in one query and new
+        alerts are inserted in bulk once every ticket has been processed. The
+        caller is responsible for committing.
+        
+        With ``sla_vectorized_evaluation`` enabled, statuses of the whole batch
+        are computed by the NumPy kernel first, and only tickets with an alert,
+        breach or escalation change go through the per-ticket workflow.
+        
+        Args:
+            db: AsyncSession for database operations
+            tickets: Tickets to evaluate
+            now: Evaluation timestamp of the current tick
+            previous_statuses: Pre-tick statuses by ticket id for tickets whose
+                statuses were already recomputed in SQL
+            
+        Returns:
+            Tuple of (alerts created, breaches detected)
+        """
+        if previous_statuses is None and settings.sla_vectorized_evaluation and tickets:
+            tickets, previous_statuses = self._apply_sla_kernel(tickets, now)
+        
+        active_alerts = await self._get_active_alert_keys(db, [ticket.id for ticket in tickets])
+        alert_batch = AlertBatch()
+        breach_count = 0
+        
+        for ticket in tickets:
+            ticket_previous_statuses = previous_statuses.get(ticket.id) if previous_statuses else None
+            if await self._process_ticket(
+                db, ticket, now, active_alerts, alert_batch, ticket_previous_statuses
+            ):
+                breach_count += 1
+        
+        # Write all alerts of this batch at once and run their escalation workflows
+        inserted_alerts = await alert_batch.flush(db)
+        alert_count = sum(1 for alert in inserted_alerts if alert.alert_type != "breached")
+        
+        return alert_count, breach_count
+    
+    def _apply_sla_kernel(
+        self, 
+        tickets: List[Ticket], 
+        now: datetime
+    ) -> Tuple[List[Ticket], Dict[UUID, Dict[str, SLAStatus]]]:
+        """
+        Update SLA statuses of a whole batch in one vectorized pass.
+        
+        Writes remaining minutes, statuses and next transition of every ticket.
+        
+        Returns:
+            Tuple of (tickets that need the alert, breach or escalation
+            workflow, their statuses before this evaluation by ticket id)
+        """
+        now_us = sla_kernel.to_epoch_microseconds(now)
+        table = sla_targets.table
+        warning_threshold = table.warning_threshold * 100
+        critical_threshold = table.critical_threshold * 100
+        
+        def evaluate(deadlines, targets, statuses):
+            return sla_kernel.evaluate_sla_batch(
+                [sla_kernel.to_epoch_microseconds(deadline) for deadline in deadlines],
+                [target or 0 for target in targets],
+                [sla_kernel.STATUS_CODES.get(status, sla_kernel.UNKNOWN_STATUS) for status in statuses],
+                now_us,
+                warning_threshold,
+                critical_threshold
+            )
+        
+        response = evaluate(
+            [ticket.response_sla_deadline for ticket in tickets],
+            [ticket.response_sla_target for ticket in tickets],
+            [ticket.response_sla_status for ticket in tickets]
+        )
+        resolution = evaluate(
+            [ticket.resolution_sla_deadline for ticket in tickets],
+            [ticket.resolution_sla_target for ticket in tickets],
+            [ticket.resolution_sla_status for ticket in tickets]
+        )
+        levels = sla_kernel.escalation_levels(response.statuses, resolution.statuses)
+        current_levels = [ticket.escalation_level.value for ticket in tickets]
+        
+        needs_workflow = (
+            (response.alerts != sla_kernel.NO_ALERT) | (resolution.alerts != sla_kernel.NO_ALERT)
+            | response.breached | resolution.breached
+            | (levels != np.asarray(current_levels))
+        ).tolist()
+        next_transitions = np.minimum(response.next_transition, resolution.next_transition).tolist()
+        
+        workflow_tickets = []
+        previous_statuses = {}
+        rows = zip(
+            tickets, needs_workflow, next_transitions,
+            response.statuses.tolist(), response.remaining_minutes.tolist(),
+            resolution.statuses.tolist(), resolution.remaining_minutes.tolist()
+        )
+        for ticket, needed, next_transition, response_status, response_remaining, resolution_status, resolution_remaining in rows:
+            if needed:
+                workflow_tickets.append(ticket)
+                previous_statuses[ticket.id] = {
+                    "response": ticket.response_sla_status,
+                    "resolution": ticket.resolution_sla_status,
+                }
+            ticket.response_sla_status = sla_kernel.SLA_STATUSES[response_status]
+            ticket.response_sla_remaining_minutes = response_remaining
+            ticket.resolution_sla_status = sla_kernel.SLA_STATUSES[resolution_status]
+            ticket.resolution_sla_remaining_minutes = resolution_remaining
+            ticket.next_transition_at = sla_kernel.from_epoch_microseconds(next_transition)
+        
+        return workflow_tickets, previous_statuses
+    
+    async def _process_ticket(
+        self, 
+        db: AsyncSession, 
+        ticket: Ticket, 
+        now: datetime, 
+        active_alerts: Set[AlertKey],
+        alert_batch: AlertBatch,
+        previous_statuses: Optional[Dict[str, SLAStatus]] = None
+    ) -> bool:
+        """
+        Run the full evaluation workflow for a single ticket.
+        
+        Updates SLA status, creates alerts for threshold crossings, detects
+        breaches and finally stores the next threshold crossing so that the
+        incremental evaluator knows when to look at the ticket again.
+        
+        Args:
+            db: AsyncSession for database operations
+            ticket: Ticket to evaluate
+            now: Evaluation timestamp of the current tick
+            active_alerts: Active alert keys prefetched for the current batch
+            alert_batch: Accumulator for the alerts created during this tick
+            previous_statuses: Statuses before the tick when the new statuses were
+                already computed in SQL; the Python status update is then skipped
+            
+        Returns:
+            bool: True if an SLA breach was detected
+        """
+        if previous_statuses is None:
+            # Update SLA status for this ticket
+            previous_statuses = await self._evaluate_ticket_sla(db, ticket)
+        else:
+            await self._update_escalation_level(db, ticket)
+        
+        # Check for alerts and escalations
+        await self._check_and_create_alerts(db, ticket, previous_statuses, active_alerts, alert_batch)
+        
+        # Check for breaches
+        breached = await self._check_for_breaches(db, ticket, previous_statuses, alert_batch)
+        
+        ticket.next_transition_at = ticket.calculate_next_transition_at(now)
+        
+        return breached
+    
+    async def _evaluate_ticket_sla(self, db: AsyncSession, ticket: Ticket) -> Dict[str, SLAStatus]:
         """
         Evaluate and update SLA status for a single ticket.
         
@@ -165,18 +738,36 @@ class SLAEngine:
             db: AsyncSession for database operations
             ticket: Ticket instance to evaluate
             
+        Returns:
+            Dict mapping "response" and "resolution" to the SLA status the
+            ticket had before this evaluation, used to detect transitions.
+            
         Note:
             This method modifies the ticket object in-place and updates escalation
             level in the database if changed. Changes are not committed to allow
             for batch processing with other tickets.
         """
+        previous_statuses = {
+            "response": ticket.response_sla_status,
+            "resolution": ticket.resolution_sla_status,
+        }
+        
         # Update SLA status
         ticket.update_sla_status()
         
         # Check if escalation level needs to be updated based on SLA status
         await self._update_escalation_level(db, ticket)
+        
+        return previous_statuses
     
-    async def _check_and_create_alerts(self, db: AsyncSession, ticket: Ticket) -> List[Alert]:
+    async def _check_and_create_alerts(
+        self, 
+        db: AsyncSession, 
+        ticket: Ticket, 
+        previous_statuses: Dict[str, SLAStatus],
+        active_alerts: Set[AlertKey],
+        alert_batch: AlertBatch
+    ) -> List[AlertKey]:
         """
         Check if proactive alerts should be created for a ticket based on SLA thresholds.
         
@@ -184,8 +775,8 @@ class SLAEngine:
         1. Retrieving configurable alert thresholds from system configuration
         2. Checking response SLA for threshold violations
         3. Checking resolution SLA for threshold violations  
-        4. Creating alerts for both SLA types if thresholds are breached
-        5. Triggering escalation workflows for new alerts
+        4. Queueing alerts for both SLA types if thresholds are breached
+        5. Triggering escalation workflows once the queued alerts are inserted
         
         Alert Thresholds:
         - WARNING: Triggers when ≤15% of SLA time remains
@@ -200,27 +791,33 @@ class SLAEngine:
         Args:
             db: AsyncSession for database operations
             ticket: Ticket to check for alert conditions
+            previous_statuses: SLA statuses before this evaluation, keyed by SLA type
+            active_alerts: Active alert keys for the current batch, used for de-duplication
+            alert_batch: Accumulator the new alerts are queued on
             
         Returns:
-            List of Alert objects created during this check. May be empty if no
+            Keys of the alerts queued during this check. May be empty if no
             alert conditions were met or if duplicate prevention logic blocked
             alert creation.
         """
         alerts_created = []
         
-        # Get alert thresholds from config
-        warning_threshold = sla_config.get_alert_threshold("warning") * 100  # Convert to percentage
-        critical_threshold = sla_config.get_alert_threshold("critical") * 100  # Convert to percentage
+        # Get alert thresholds from the compiled config
+        table = sla_targets.table
+        warning_threshold = table.warning_threshold * 100  # Convert to percentage
+        critical_threshold = table.critical_threshold * 100  # Convert to percentage
         
         # Check response SLA
         response_alerts = await self._check_sla_type_alerts(
-            db, ticket, "response", warning_threshold, critical_threshold
+            db, ticket, "response", warning_threshold, critical_threshold,
+            previous_statuses.get("response"), active_alerts, alert_batch
         )
         alerts_created.extend(response_alerts)
         
         # Check resolution SLA
         resolution_alerts = await self._check_sla_type_alerts(
-            db, ticket, "resolution", warning_threshold, critical_threshold
+            db, ticket, "resolution", warning_threshold, critical_threshold,
+            previous_statuses.get("resolution"), active_alerts, alert_batch
         )
         alerts_created.extend(resolution_alerts)
         
@@ -232,8 +829,11 @@ class SLAEngine:
         ticket: Ticket, 
         sla_type: str, 
         warning_threshold: float, 
-        critical_threshold: float
-    ) -> List[Alert]:
+        critical_threshold: float,
+        previous_status: Optional[SLAStatus],
+        active_alerts: Set[AlertKey],
+        alert_batch: AlertBatch
+    ) -> List[AlertKey]:
         """
         Check alert conditions for a specific SLA type and create alerts if needed.
         
@@ -245,11 +845,12 @@ class SLAEngine:
         1. Retrieves SLA-specific data (remaining time, target, deadline, status)
         2. Skips processing if no SLA target exists or status is already BREACHED
         3. Calculates remaining time as percentage of target SLA time
-        4. Determines alert type based on thresholds:
-           - CRITICAL: ≤ critical_threshold% time remaining AND status not already CRITICAL
-           - WARNING: ≤ warning_threshold% time remaining AND status is COMPLIANT
-        5. Checks for existing active alerts to prevent duplicates
-        6. Creates new alert if conditions are met and triggers escalation
+        4. Determines alert type based on thresholds, comparing against the status
+           the ticket had before the current evaluation:
+           - CRITICAL: ≤ critical_threshold% time remaining AND status was not already CRITICAL
+           - WARNING: ≤ warning_threshold% time remaining AND status was COMPLIANT
+        5. Checks the batch's prefetched active alerts to prevent duplicates
+        6. Queues a new alert if conditions are met; escalation runs once it is inserted
         
         Key Business Rules:
         - Only escalates from COMPLIANT to WARNING status (prevents downgrade alerts)
@@ -263,9 +864,14 @@ class SLAEngine:
             sla_type: Either "response" or "resolution" - determines which SLA to check
             warning_threshold: Percentage threshold for warning alerts (typically 15.0)
             critical_threshold: Percentage threshold for critical alerts (typically 5.0)
+            previous_status: SLA status before this evaluation; defaults to the
+                current status when unknown
+            active_alerts: Active alert keys for the current batch; new alerts
+                are added so later checks in the same tick see them
+            alert_batch: Accumulator the new alert is queued on
             
         Returns:
-            List of Alert objects created. Empty list if no alert conditions met or
+            Keys of the alerts queued. Empty list if no alert conditions met or
             if alert creation was prevented by duplicate checking logic.
             
         Note:
@@ -290,6 +896,9 @@ class SLAEngine:
         if not target_minutes or current_status == SLAStatus.BREACHED:
             return alerts_created
         
+        if previous_status is None:
+            previous_status = current_status
+        
         # Calculate remaining percentage
         remaining_percentage = SLACalculator.calculate_remaining_percentage(remaining_minutes, target_minutes)
         
@@ -297,30 +906,34 @@ class SLAEngine:
         alert_type = None
         threshold_percentage = None
         
-        if remaining_percentage <= critical_threshold and current_status != SLAStatus.CRITICAL:
+        if remaining_percentage <= critical_threshold and previous_status != SLAStatus.CRITICAL:
             alert_type = "critical"
             threshold_percentage = critical_threshold
-        elif remaining_percentage <= warning_threshold and current_status == SLAStatus.COMPLIANT:
+        elif remaining_percentage <= warning_threshold and previous_status == SLAStatus.COMPLIANT:
             alert_type = "warning"
             threshold_percentage = warning_threshold
         
         # Create alert if needed
         if alert_type:
             # Check if we already have an active alert of this type
-            existing_alert = await self._get_active_alert(db, ticket.id, sla_type, alert_type)
-            if not existing_alert:
-                alert = await self._create_alert(
-                    db, ticket, sla_type, alert_type, 
+            alert_key = (ticket.id, sla_type, alert_type)
+            if alert_key not in active_alerts:
+                self._create_alert(
+                    db, alert_batch, ticket, sla_type, alert_type, 
                     threshold_percentage, remaining_minutes, deadline
                 )
-                alerts_created.append(alert)
-                
-                # Trigger escalation workflow
-                await self.escalation_service.handle_alert(db, ticket, alert)
+                active_alerts.add(alert_key)
+                alerts_created.append(alert_key)
         
         return alerts_created
     
-    async def _check_for_breaches(self, db: AsyncSession, ticket: Ticket) -> bool:
+    async def _check_for_breaches(
+        self, 
+        db: AsyncSession, 
+        ticket: Ticket, 
+        previous_statuses: Dict[str, SLAStatus],
+        alert_batch: AlertBatch
+    ) -> bool:
         """
         Check for SLA breaches and trigger appropriate escalation workflows.
         
@@ -333,7 +946,7 @@ class SLAEngine:
         Breach Detection Logic:
         - Response SLA Breach: Current time exceeds response_sla_deadline
         - Resolution SLA Breach: Current time exceeds resolution_sla_deadline
-        - Only processes tickets not already marked as BREACHED status
+        - Only processes SLAs that were not already BREACHED before this evaluation
         - Updates status to BREACHED and creates breach alerts for each type
         
         Escalation Response:
@@ -344,6 +957,8 @@ class SLAEngine:
         Args:
             db: AsyncSession for database operations
             ticket: Ticket to check for SLA breaches
+            previous_statuses: SLA statuses before this evaluation, keyed by SLA type
+            alert_batch: Accumulator the breach alerts are queued on
             
         Returns:
             bool: True if any SLA breach was detected, False otherwise. This
@@ -359,25 +974,25 @@ class SLAEngine:
         
         # Check response SLA breach
         if (ticket.response_sla_deadline and 
-            ticket.response_sla_status != SLAStatus.BREACHED and
+            previous_statuses.get("response") != SLAStatus.BREACHED and
             SLACalculator.is_sla_breached(ticket.response_sla_deadline)):
             
             ticket.response_sla_status = SLAStatus.BREACHED
             breach_detected = True
             
             # Create breach alert
-            await self._create_breach_alert(db, ticket, "response")
+            self._create_breach_alert(alert_batch, ticket, "response")
         
         # Check resolution SLA breach
         if (ticket.resolution_sla_deadline and 
-            ticket.resolution_sla_status != SLAStatus.BREACHED and
+            previous_statuses.get("resolution") != SLAStatus.BREACHED and
             SLACalculator.is_sla_breached(ticket.resolution_sla_deadline)):
             
             ticket.resolution_sla_status = SLAStatus.BREACHED
             breach_detected = True
             
             # Create breach alert
-            await self._create_breach_alert(db, ticket, "resolution")
+            self._create_breach_alert(alert_batch, ticket, "resolution")
         
         # If breach detected, escalate
         if breach_detected:
@@ -385,18 +1000,25 @@ class SLAEngine:
         
         return breach_detected
     
-    async def _create_alert(
+    def _create_alert(
         self, 
         db: AsyncSession, 
+        alert_batch: AlertBatch,
         ticket: Ticket, 
         sla_type: str, 
         alert_type: str,
         threshold_percentage: float,
         time_remaining_minutes: int,
         deadline: datetime
-    ) -> Alert:
-        """Create a new alert."""
-        alert = Alert(
+    ):
+        """Queue a new alert; the escalation workflow runs once it is inserted."""
+        
+        async def on_insert(alert: Alert):
+            # Trigger escalation workflow
+            await self.escalation_service.handle_alert(db, ticket, alert)
+        
+        alert_batch.add(
+            on_insert=on_insert,
             ticket_id=ticket.id,
             alert_type=alert_type,
             sla_type=sla_type,
@@ -410,24 +1032,20 @@ class SLAEngine:
                 "escalation_level": ticket.escalation_level.value
             }
         )
+    
+    def _create_breach_alert(self, alert_batch: AlertBatch, ticket: Ticket, sla_type: str):
+        """Queue a breach alert."""
         
-        db.add(alert)
-        await db.flush()  # Get the ID without committing
-        
-        # logger.info(
-        #     "Alert created",
-        #     alert_id=str(alert.id),
-        #     ticket_id=str(ticket.id),
-        #     sla_type=sla_type,
-        #     alert_type=alert_type,
-        #     threshold_percentage=threshold_percentage
-        # )
+        async def on_insert(alert: Alert):
+            logger.warning(
+                "SLA breach detected",
+                alert_id=str(alert.id),
+                ticket_id=str(ticket.id),
+                sla_type=sla_type
+            )
         
-        return alert
-    
-    async def _create_breach_alert(self, db: AsyncSession, ticket: Ticket, sla_type: str):
-        """Create a breach alert."""
-        alert = Alert(
+        alert_batch.add(
+            on_insert=on_insert,
             ticket_id=ticket.id,
             alert_type="breached",
             sla_type=sla_type,
@@ -442,36 +1060,22 @@ class SLAEngine:
                 "breach_timestamp": datetime.now(timezone.utc).isoformat()
             }
         )
-        
-        db.add(alert)
-        await db.flush()
-        
-        logger.warning(
-            "SLA breach detected",
-            alert_id=str(alert.id),
-            ticket_id=str(ticket.id),
-            sla_type=sla_type
-        )
     
-    async def _get_active_alert(
-        self, 
-        db: AsyncSession, 
-        ticket_id: UUID, 
-        sla_type: str, 
-        alert_type: str
-    ) -> Optional[Alert]:
-        """Check if an active alert already exists for this ticket/sla_type/alert_type."""
+    async def _get_active_alert_keys(self, db: AsyncSession, ticket_ids: List[UUID]) -> Set[AlertKey]:
+        """Fetch the active alert keys for a batch of tickets in a single query."""
+        if not ticket_ids:
+            return set()
+        
+        # Bind the ids as one array parameter so large batches stay a single statement
         result = await db.execute(
-            select(Alert).where(
+            select(Alert.ticket_id, Alert.sla_type, Alert.alert_type).where(
                 and_(
-                    Alert.ticket_id == ticket_id,
-                    Alert.sla_type == sla_type,
-                    Alert.alert_type == alert_type,
+                    Alert.ticket_id == any_(literal(ticket_ids, ARRAY(PG_UUID(as_uuid=True)))),
                     Alert.is_active == True
                 )
             )
         )
-        return result.scalar_one_or_none()
+        return {(ticket_id, sla_type, alert_type) for ticket_id, sla_type, alert_type in result}
     
     async def _update_escalation_level(self, db: AsyncSession, ticket: Ticket):
         """Update escalation level based on current SLA status."""
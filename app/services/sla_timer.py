@@ -0,0 +1,192 @@
+"""In-memory timer firing SLA evaluations at their exact threshold crossings."""
+
+import asyncio
+import heapq
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, and_, any_, literal
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+import structlog
+
+from app.models.ticket import Ticket, TERMINAL_STATUSES
+
+logger = structlog.get_logger(__name__)
+
+
+class SLATimer:
+    """
+    Heap scheduler that evaluates tickets at their next SLA threshold crossing.
+
+    Every open ticket is kept in a min-heap keyed by ``Ticket.next_transition_at``.
+    A single asyncio task sleeps until the earliest entry is due, evaluates all
+    due tickets in one batch and reschedules them from their new
+    ``next_transition_at``. Alerts therefore fire within about a second of the
+    exact warning, critical or breach instant, and the task does no work while
+    nothing is due. The minute scheduler keeps running as a safety net; due
+    tickets are locked with ``SKIP LOCKED`` so both never evaluate the same one.
+
+    Rescheduling a ticket pushes a new heap entry and leaves the old one in
+    place; stale entries are recognised through ``_scheduled`` and dropped
+    when they reach the top of the heap.
+
+    Args:
+        batch_size: Maximum tickets evaluated per batch
+        retry_seconds: Delay before a failed or skipped ticket is evaluated again
+    """
+
+    def __init__(self, batch_size: int = 1000, retry_seconds: float = 5.0):
+        self.batch_size = batch_size
+        self.retry_seconds = retry_seconds
+        self._heap: List[Tuple[datetime, UUID]] = []
+        self._scheduled: Dict[UUID, datetime] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._sla_engine = None
+        self._session_factory = None
+
+    def __len__(self) -> int:
+        return len(self._scheduled)
+
+    def schedule(self, ticket_id: UUID, fire_at: Optional[datetime]):
+        """Schedule (or reschedule) a ticket; ``None`` removes it from the timer."""
+        if fire_at is None:
+            self._scheduled.pop(ticket_id, None)
+            return
+
+        if self._scheduled.get(ticket_id) == fire_at:
+            return
+        self._scheduled[ticket_id] = fire_at
+        heapq.heappush(self._heap, (fire_at, ticket_id))
+
+        # Wake the loop if the new entry is now the earliest one
+        if self._heap[0][1] == ticket_id:
+            self._wakeup.set()
+
+    def cancel(self, ticket_id: UUID):
+        """Stop tracking a ticket."""
+        self._scheduled.pop(ticket_id, None)
+
+    async def start(self, sla_engine, session_factory):
+        """Load the pending transitions from the database and start the timer task."""
+        self._sla_engine = sla_engine
+        self._session_factory = session_factory
+        await self.load()
+        self._task = asyncio.create_task(self._run(), name="sla-timer")
+
+    async def stop(self):
+        """Stop the timer task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def load(self):
+        """Load ``next_transition_at`` of every open ticket, reading in keyset pages."""
+        last_id = None
+        async with self._session_factory() as db:
+            while True:
+                query = (
+                    select(Ticket.id, Ticket.next_transition_at)
+                    .where(
+                        and_(
+                            Ticket.status.not_in(TERMINAL_STATUSES),
+                            Ticket.next_transition_at.isnot(None)
+                        )
+                    )
+                    .order_by(Ticket.id)
+                    .limit(self.batch_size)
+                )
+                if last_id is not None:
+                    query = query.where(Ticket.id > last_id)
+
+                rows = (await db.execute(query)).all()
+                for ticket_id, fire_at in rows:
+                    self.schedule(ticket_id, fire_at)
+                if len(rows) < self.batch_size:
+                    break
+                last_id = rows[-1][0]
+
+        logger.info("SLA timer loaded", scheduled_tickets=len(self._scheduled))
+
+    def _pop_due(self, now: datetime) -> List[UUID]:
+        """Pop up to ``batch_size`` live entries that are due."""
+        due = []
+        while self._heap and len(due) < self.batch_size:
+            fire_at, ticket_id = self._heap[0]
+            if self._scheduled.get(ticket_id) != fire_at:
+                heapq.heappop(self._heap)  # stale entry
+                continue
+            if fire_at > now:
+                break
+            heapq.heappop(self._heap)
+            del self._scheduled[ticket_id]
+            due.append(ticket_id)
+        return due
+
+    def _seconds_until_next(self, now: datetime) -> Optional[float]:
+        """Seconds until the earliest live entry, dropping stale entries on the way."""
+        while self._heap:
+            fire_at, ticket_id = self._heap[0]
+            if self._scheduled.get(ticket_id) != fire_at:
+                heapq.heappop(self._heap)
+                continue
+            return max(0.0, (fire_at - now).total_seconds())
+        return None
+
+    async def _run(self):
+        """Sleep until the next crossing, evaluate the due tickets, repeat."""
+        while True:
+            self._wakeup.clear()
+            delay = self._seconds_until_next(datetime.now(timezone.utc))
+            if delay is None or delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            due = self._pop_due(datetime.now(timezone.utc))
+            if not due:
+                continue
+            try:
+                await self._fire(due)
+            except Exception as e:
+                logger.error("SLA timer evaluation failed", tickets=len(due), error=str(e))
+                retry_at = datetime.now(timezone.utc) + timedelta(seconds=self.retry_seconds)
+                for ticket_id in due:
+                    self.schedule(ticket_id, retry_at)
+
+    async def _fire(self, ticket_ids: List[UUID]):
+        """
+        Evaluate due tickets and reschedule them from their new transitions.
+
+        A ticket whose transition is still due afterwards was skipped, usually
+        because the minute scheduler holds its lock; it is retried after
+        ``retry_seconds`` instead of firing again right away.
+        """
+        async with self._session_factory() as db:
+            await self._sla_engine.evaluate_tickets_by_id(db, ticket_ids)
+
+            result = await db.execute(
+                select(Ticket.id, Ticket.next_transition_at).where(
+                    and_(
+                        Ticket.id == any_(literal(ticket_ids, ARRAY(PG_UUID(as_uuid=True)))),
+                        Ticket.status.not_in(TERMINAL_STATUSES)
+                    )
+                )
+            )
+            now = datetime.now(timezone.utc)
+            for ticket_id, fire_at in result:
+                if fire_at is not None and fire_at <= now:
+                    fire_at = now + timedelta(seconds=self.retry_seconds)
+                self.schedule(ticket_id, fire_at)
+
+
+# Process-wide timer, started from the application lifespan
+sla_timer = SLATimer()
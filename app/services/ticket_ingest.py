@@ -0,0 +1,233 @@
+"""Streaming NDJSON ticket ingestion for bulk backfills."""
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from pydantic import ValidationError
+import structlog
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.schemas.ticket import TicketCreate
+from app.services.ticket_service import TicketService
+from app.utils.sla_calculator import SLACalculator
+
+logger = structlog.get_logger(__name__)
+
+# Error messages kept for the report; further errors are only counted
+MAX_REPORTED_ERRORS = 100
+
+
+@dataclass
+class IngestStats:
+    """Running counters of one ingest run."""
+
+    lines: int = 0
+    invalid: int = 0
+    created: int = 0
+    failed: int = 0
+    batches: int = 0
+    errors: List[str] = field(default_factory=list)
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def tickets_per_second(self) -> float:
+        return self.created / max(self.elapsed_seconds, 1e-9)
+
+    def add_error(self, message: str):
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(message)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "lines": self.lines,
+            "created": self.created,
+            "failed": self.failed,
+            "invalid": self.invalid,
+            "batches": self.batches,
+            "errors": list(self.errors),
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "tickets_per_second": round(self.tickets_per_second, 1),
+        }
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterator[bytes],
+    max_line_bytes: Optional[int] = None
+) -> AsyncIterator[Optional[bytes]]:
+    """
+    Split a stream of byte chunks into lines without buffering the whole stream.
+    
+    Only the unterminated tail of the stream is kept between chunks and each
+    chunk is scanned once, so long lines cost linear time. A line longer than
+    ``max_line_bytes`` is discarded while it streams in and yielded as
+    ``None``, so memory stays bounded even without newlines.
+    """
+    max_line_bytes = max_line_bytes or settings.ingest_max_line_bytes
+    # Pieces of the current line from earlier chunks, and their total length
+    tail: List[bytes] = []
+    tail_bytes = 0
+    oversized = False
+    
+    async for chunk in chunks:
+        start = 0
+        while (end := chunk.find(b"\n", start)) >= 0:
+            if oversized or tail_bytes + end - start > max_line_bytes:
+                yield None
+            else:
+                yield b"".join(tail) + chunk[start:end] if tail else chunk[start:end]
+            tail, tail_bytes, oversized = [], 0, False
+            start = end + 1
+        
+        if start < len(chunk) and not oversized:
+            tail_bytes += len(chunk) - start
+            if tail_bytes > max_line_bytes:
+                tail, oversized = [], True
+            else:
+                tail.append(chunk[start:])
+    
+    if oversized:
+        yield None
+    elif tail:
+        yield b"".join(tail)
+
+
+class TicketIngestor:
+    """
+    Validate NDJSON ticket rows and write them to Postgres in bounded batches.
+
+    The reader validates each line with ``TicketCreate`` and hands full batches
+    to a fixed number of writers through a bounded queue. When the writers fall
+    behind, the reader blocks on the queue and stops consuming its input, so
+    memory stays at ``max_pending_batches * batch_size`` tickets however long
+    the stream is and throughput is set by the database. Each batch goes
+    through ``TicketService.create_tickets_batch``; tickets whose external_id
+    already exists are counted as failed, which makes interrupted backfills
+    safe to rerun.
+
+    Args:
+        batch_size: Tickets per multi-row insert
+        concurrency: Batches written in parallel, one session each
+        max_pending_batches: Validated batches buffered ahead of the writers
+        progress_interval: Seconds between progress reports
+        on_progress: Called with the running stats at every progress report
+        schedule_timer: Hand created tickets to the in-process SLA timer
+    """
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        max_pending_batches: Optional[int] = None,
+        progress_interval: Optional[float] = None,
+        on_progress: Optional[Callable[[IngestStats], None]] = None,
+        schedule_timer: bool = True
+    ):
+        self.batch_size = batch_size or settings.ingest_batch_size
+        self.concurrency = concurrency or settings.ingest_concurrency
+        self.max_pending_batches = max_pending_batches or settings.ingest_max_pending_batches
+        self.progress_interval = progress_interval or settings.ingest_progress_interval
+        self.on_progress = on_progress
+        self.schedule_timer = schedule_timer
+        self.ticket_service = TicketService(SLACalculator())
+
+    async def ingest(self, lines: AsyncIterator[Optional[bytes]]) -> IngestStats:
+        """Ingest an NDJSON line stream and return the final stats; ``None`` lines are too long."""
+        stats = IngestStats()
+        self._last_report = stats.started_at
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_pending_batches)
+        writers = [asyncio.create_task(self._write_batches(queue, stats)) for _ in range(self.concurrency)]
+
+        try:
+            batch: List[TicketCreate] = []
+            line_number = 0
+            async for line in lines:
+                line_number += 1
+                if line is None:
+                    stats.lines += 1
+                    stats.invalid += 1
+                    stats.add_error(f"line {line_number}: line too long")
+                    continue
+                if not line.strip():
+                    continue
+                stats.lines += 1
+                try:
+                    batch.append(TicketCreate(**json.loads(line)))
+                except (ValueError, TypeError, ValidationError) as e:
+                    stats.invalid += 1
+                    stats.add_error(f"line {line_number}: {str(e)}")
+                    continue
+
+                if len(batch) >= self.batch_size:
+                    await self._put(queue, batch, writers)
+                    batch = []
+
+            if batch:
+                await self._put(queue, batch, writers)
+            for _ in writers:
+                await self._put(queue, None, writers)
+            await asyncio.gather(*writers)
+        except BaseException:
+            for writer in writers:
+                writer.cancel()
+            await asyncio.gather(*writers, return_exceptions=True)
+            raise
+
+        self._report(stats, final=True)
+        return stats
+
+    async def _put(self, queue: asyncio.Queue, item: Optional[List[TicketCreate]], writers: List[asyncio.Task]):
+        """Queue a batch, waiting for room; fails fast if a writer died."""
+        put = asyncio.ensure_future(queue.put(item))
+        done, _ = await asyncio.wait([put, *writers], return_when=asyncio.FIRST_COMPLETED)
+        if put in done:
+            return
+        put.cancel()
+        for writer in done:
+            writer.result()
+        raise RuntimeError("Ticket ingest writers stopped unexpectedly")
+
+    async def _write_batches(self, queue: asyncio.Queue, stats: IngestStats):
+        async with AsyncSessionLocal() as db:
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    return
+                try:
+                    result = await self.ticket_service.create_tickets_batch(
+                        db, batch, schedule_timer=self.schedule_timer
+                    )
+                except Exception:
+                    await db.rollback()
+                    raise
+
+                stats.batches += 1
+                stats.created += result.successful
+                stats.failed += result.failed
+                for error in result.errors:
+                    stats.add_error(error)
+                self._report(stats)
+
+    def _report(self, stats: IngestStats, final: bool = False):
+        now = time.monotonic()
+        if not final and now - self._last_report < self.progress_interval:
+            return
+        self._last_report = now
+
+        logger.info(
+            "Ticket ingest finished" if final else "Ticket ingest progress",
+            lines=stats.lines,
+            created=stats.created,
+            failed=stats.failed,
+            invalid=stats.invalid,
+            tickets_per_second=round(stats.tickets_per_second, 1)
+        )
+        if self.on_progress:
+            self.on_progress(stats)
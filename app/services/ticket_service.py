@@ -3,22 +3,66 @@
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timezone,timedelta
 from uuid import UUID
+import json
+import time
 
-from sqlalchemy import select, and_, or_, func, desc
+from sqlalchemy import select, and_, or_, func, desc, case, cast, literal, any_, String, Float, text, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, REGCONFIG, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.ticket import (
     Ticket, TicketStatusHistory, Alert, SLAStatus, 
-    TicketStatus, Priority, CustomerTier, EscalationLevel
+    TicketStatus, Priority, CustomerTier, EscalationLevel, SEARCH_CONFIG
 )
-from app.schemas.ticket import TicketCreate, TicketResponse
-from app.config import sla_config
+from app.config import settings
+from app.schemas.ticket import (
+    CountMode, TicketCreate, TicketResponse, TicketBatchResponse, TicketEvent, TicketEventBatchResponse
+)
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.utils.sla_targets import sla_targets, SLATargetTable
 from app.utils.sla_calculator import SLACalculator
+from app.services.sla_timer import sla_timer
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Ticket columns written by multi-row inserts; the others take their column defaults
+TICKET_INSERT_COLUMNS = (
+    "external_id", "title", "description", "priority", "customer_tier", "status",
+    "created_at", "updated_at", "response_sla_target", "resolution_sla_target",
+    "response_sla_deadline", "resolution_sla_deadline", "next_transition_at",
+    "assigned_to", "department", "tags", "ticket_metadata",
+)
+
+# Columns an event may change, by event type; SLA columns follow priority and tier
+EVENT_UPDATE_COLUMNS = {
+    "created": (
+        "title", "description", "priority", "customer_tier", "status",
+        "assigned_to", "department", "tags", "ticket_metadata",
+    ),
+    "status_changed": ("status",),
+}
+EVENT_UPDATE_COLUMNS["updated"] = EVENT_UPDATE_COLUMNS["created"]
+
+# Columns reset from the new targets when priority or customer tier changes
+SLA_RECALCULATED_COLUMNS = (
+    "response_sla_target", "resolution_sla_target", "response_sla_deadline",
+    "resolution_sla_deadline", "response_sla_status", "resolution_sla_status",
+    "response_sla_remaining_minutes", "resolution_sla_remaining_minutes", "next_transition_at",
+)
+
+# JSON has no equality operator; compare those columns as JSONB
+JSON_COLUMNS = ("tags", "ticket_metadata")
+
+# Filtered ticket counts for CountMode.ESTIMATE: filters key -> (expires_at, count)
+_COUNT_CACHE: Dict[str, Tuple[float, int]] = {}
+COUNT_CACHE_MAX_ENTRIES = 1024
+
+# Postgres accepts at most 32767 bind parameters per statement; column
+# defaults are bound per row as well
+MAX_INSERT_ROWS = 32767 // len(Ticket.__table__.columns)
+
 
 class TicketService:
     """Service for ticket business logic operations."""
@@ -28,14 +72,262 @@ class TicketService:
     
     async def create_ticket(self, db: AsyncSession, ticket_data: TicketCreate) -> Ticket:
         """Create a new ticket with SLA calculations."""
-        # Calculate SLA targets based on priority and customer tier
-        response_target = sla_config.get_sla_target("response", ticket_data.priority.value, ticket_data.customer_tier.value)
-        resolution_target = sla_config.get_sla_target("resolution", ticket_data.priority.value, ticket_data.customer_tier.value)
+        ticket = self._build_ticket(ticket_data, sla_targets.table, datetime.now(timezone.utc))
+        
+        db.add(ticket)
+        await db.commit()
+        await db.refresh(ticket)
+        
+        # Create initial status history entry
+        await self._create_status_history(db, ticket, None, ticket.status, "System", "Ticket created")
         
-        # Calculate deadlines
+        # Fire the first threshold crossing at its exact instant
+        sla_timer.schedule(ticket.id, ticket.next_transition_at)
+        
+        # logger.info(
+        #     "Ticket created", 
+        #     ticket_id=str(ticket.id), 
+        #     external_id=ticket.external_id,
+        #     priority=ticket.priority.value,
+        #     customer_tier=ticket.customer_tier.value
+        # )
+        
+        return ticket
+  
+    async def create_tickets_batch(
+        self,
+        db: AsyncSession,
+        tickets_data: List[TicketCreate],
+        schedule_timer: bool = True
+    ) -> TicketBatchResponse:
+        """
+        Create many tickets in a single transaction.
+        
+        SLA targets for the whole batch are taken from one snapshot of the
+        target table. Tickets and their initial status history rows are written
+        with multi-row ``INSERT`` statements; tickets whose external_id already
+        exists are skipped with ``ON CONFLICT DO NOTHING`` and reported as
+        failed items instead of aborting the batch. Repeats of an external_id
+        within the batch are reported as failed as well; the first one is kept.
+        
+        Processes without a running SLA timer (e.g. command line backfills)
+        pass ``schedule_timer=False``; the scheduler still finds the tickets
+        through ``next_transition_at``.
+        """
         now = datetime.now(timezone.utc)
-        response_deadline = now + timedelta(minutes=response_target)
-        resolution_deadline = now + timedelta(minutes=resolution_target)
+        table = sla_targets.table
+        errors = []
+        
+        rows = []
+        seen_external_ids = set()
+        for ticket_data in tickets_data:
+            if ticket_data.external_id in seen_external_ids:
+                errors.append(f"{ticket_data.external_id}: duplicate external_id in batch")
+                continue
+            seen_external_ids.add(ticket_data.external_id)
+            try:
+                ticket = self._build_ticket(ticket_data, table, now)
+            except Exception as e:
+                errors.append(f"{ticket_data.external_id}: {str(e)}")
+                continue
+            rows.append({column: getattr(ticket, column) for column in TICKET_INSERT_COLUMNS})
+        
+        created = []
+        for start in range(0, len(rows), MAX_INSERT_ROWS):
+            result = await db.execute(
+                pg_insert(Ticket)
+                .values(rows[start:start + MAX_INSERT_ROWS])
+                .on_conflict_do_nothing(constraint="uq_ticket_external_id")
+                .returning(Ticket.id, Ticket.external_id, Ticket.status, Ticket.next_transition_at)
+            )
+            created.extend(result.all())
+        
+        created_external_ids = {row.external_id for row in created}
+        errors.extend(
+            f"{row['external_id']}: ticket already exists"
+            for row in rows if row["external_id"] not in created_external_ids
+        )
+        
+        if created:
+            # Initial status history entries, written in the same transaction
+            history_rows = [
+                {
+                    "ticket_id": row.id,
+                    "from_status": None,
+                    "to_status": row.status,
+                    "changed_at": now,
+                    "changed_by": "System",
+                    "reason": "Ticket created",
+                    "ticket_status_metadata": {}
+                }
+                for row in created
+            ]
+            for start in range(0, len(history_rows), MAX_INSERT_ROWS):
+                await db.execute(pg_insert(TicketStatusHistory).values(history_rows[start:start + MAX_INSERT_ROWS]))
+        
+        await db.commit()
+        
+        if schedule_timer:
+            for row in created:
+                sla_timer.schedule(row.id, row.next_transition_at)
+        
+        return TicketBatchResponse(
+            successful=len(created),
+            failed=len(tickets_data) - len(created),
+            errors=errors
+        )
+    
+    async def ingest_events(self, db: AsyncSession, events: List[TicketEvent]) -> TicketEventBatchResponse:
+        """
+        Apply ticket events idempotently, keyed on external_id.
+        
+        Events are upserted with ``INSERT ... ON CONFLICT DO UPDATE``: unknown
+        tickets are created, known tickets are updated only when the event
+        actually changes a column, so replays cost no writes. Event order is
+        kept in ``last_event_at``, the event's ``updated_at``: an event older
+        than the last applied one is ignored, also across batches. The stored
+        ``updated_at`` cannot be used for this, because the ``tickets`` trigger
+        in ``init-db.sql`` overwrites it with the write time of every update.
+        SLA targets and deadlines are recalculated only when priority or
+        customer tier changed, and status history rows are written only for
+        real transitions. ``status_changed`` events update the status alone.
+        
+        Only the newest event per external_id within a batch is applied;
+        stale and no-op events are counted as unchanged.
+        """
+        now = datetime.now(timezone.utc)
+        table = sla_targets.table
+        errors = []
+        
+        # Newest event per ticket; later events win ties
+        latest: Dict[str, TicketEvent] = {}
+        for event in events:
+            if event.event_type not in EVENT_UPDATE_COLUMNS:
+                errors.append(f"{event.ticket.external_id}: unknown event type '{event.event_type}'")
+                continue
+            current = latest.get(event.ticket.external_id)
+            if current is None or event.ticket.updated_at >= current.ticket.updated_at:
+                latest[event.ticket.external_id] = event
+        
+        rows_by_type: Dict[str, List[Dict[str, Any]]] = {}
+        for external_id, event in latest.items():
+            try:
+                ticket = self._build_ticket(event.ticket, table, now)
+            except Exception as e:
+                errors.append(f"{external_id}: {str(e)}")
+                continue
+            row = {column: getattr(ticket, column) for column in TICKET_INSERT_COLUMNS}
+            row["last_event_at"] = event.ticket.updated_at
+            rows_by_type.setdefault(event.event_type, []).append(row)
+        
+        changed = []
+        for event_type, rows in rows_by_type.items():
+            for start in range(0, len(rows), MAX_INSERT_ROWS):
+                changed.extend(await self._upsert_tickets(
+                    db, rows[start:start + MAX_INSERT_ROWS], EVENT_UPDATE_COLUMNS[event_type]
+                ))
+        
+        history_rows = []
+        for row in changed:
+            if row.previous_status is not None and row.previous_status == row.status:
+                continue
+            event = latest[row.external_id]
+            history_rows.append({
+                "ticket_id": row.id,
+                "from_status": row.previous_status,
+                "to_status": row.status,
+                "changed_at": now,
+                "changed_by": "System",
+                "reason": "Ticket created" if row.previous_status is None else f"Status changed by {event.event_type} event",
+                "ticket_status_metadata": {"correlation_id": event.correlation_id} if event.correlation_id else {}
+            })
+        for start in range(0, len(history_rows), MAX_INSERT_ROWS):
+            await db.execute(pg_insert(TicketStatusHistory).values(history_rows[start:start + MAX_INSERT_ROWS]))
+        
+        await db.commit()
+        
+        for row in changed:
+            sla_timer.schedule(row.id, row.next_transition_at)
+        
+        created = sum(1 for row in changed if row.previous_status is None)
+        failed = len(errors)
+        logger.info(
+            "Ticket events ingested",
+            events=len(events),
+            created=created,
+            updated=len(changed) - created,
+            failed=failed
+        )
+        return TicketEventBatchResponse(
+            created=created,
+            updated=len(changed) - created,
+            unchanged=len(events) - len(changed) - failed,
+            failed=failed,
+            errors=errors
+        )
+    
+    async def _upsert_tickets(self, db: AsyncSession, rows: List[Dict[str, Any]], update_columns: Tuple[str, ...]) -> List[Any]:
+        """
+        Upsert ticket rows in one statement and return the rows that were written.
+        
+        Rows carry ``last_event_at``; a stored ticket is only updated by a row
+        at least as new as the last event applied to it.
+        
+        The ``previous`` CTE reads the stored rows in the same snapshot as the
+        upsert, so each returned row carries the status it had before this
+        statement (``None`` for inserted tickets).
+        """
+        columns = Ticket.__table__.c
+        previous = (
+            select(columns.id, columns.external_id, columns.status)
+            .where(columns.external_id == any_(literal([row["external_id"] for row in rows], ARRAY(String))))
+            .cte("previous")
+        )
+        
+        stmt = pg_insert(Ticket).values(rows)
+        excluded = stmt.excluded
+        
+        def compared(table, column):
+            return cast(table[column], JSONB) if column in JSON_COLUMNS else table[column]
+        
+        set_ = {column: excluded[column] for column in update_columns}
+        set_["updated_at"] = excluded.updated_at
+        set_["last_event_at"] = excluded.last_event_at
+        if "priority" in update_columns:
+            sla_changed = or_(
+                columns.priority.is_distinct_from(excluded.priority),
+                columns.customer_tier.is_distinct_from(excluded.customer_tier)
+            )
+            for column in SLA_RECALCULATED_COLUMNS:
+                set_[column] = case((sla_changed, excluded[column]), else_=columns[column])
+        
+        upserted = (
+            stmt.on_conflict_do_update(
+                constraint="uq_ticket_external_id",
+                set_=set_,
+                where=and_(
+                    # Events older than the last applied one are replays
+                    or_(columns.last_event_at.is_(None), excluded.last_event_at >= columns.last_event_at),
+                    or_(*(
+                        compared(columns, column).is_distinct_from(compared(excluded, column))
+                        for column in update_columns
+                    ))
+                )
+            )
+            .returning(columns.id, columns.external_id, columns.status, columns.next_transition_at)
+            .cte("upserted")
+        )
+        
+        result = await db.execute(
+            select(upserted, previous.c.status.label("previous_status"))
+            .outerjoin(previous, previous.c.id == upserted.c.id)
+        )
+        return result.all()
+    
+    def _build_ticket(self, ticket_data: TicketCreate, table: SLATargetTable, now: datetime) -> Ticket:
+        """Build a transient ticket with SLA targets, deadlines and its first transition."""
+        # Calculate SLA targets based on priority and customer tier
+        response_target, resolution_target = table.get_targets(ticket_data.customer_tier, ticket_data.priority)
         
         # Create ticket
         ticket = Ticket(
@@ -49,31 +341,16 @@ class TicketService:
             updated_at=ticket_data.updated_at,
             response_sla_target=response_target,
             resolution_sla_target=resolution_target,
-            response_sla_deadline=response_deadline,
-            resolution_sla_deadline=resolution_deadline,
+            response_sla_deadline=now + timedelta(minutes=response_target),
+            resolution_sla_deadline=now + timedelta(minutes=resolution_target),
             assigned_to=ticket_data.assigned_to,
             department=ticket_data.department,
             tags=ticket_data.tags,
             ticket_metadata=ticket_data.ticket_metadata
         )
-        
-        db.add(ticket)
-        await db.commit()
-        await db.refresh(ticket)
-        
-        # Create initial status history entry
-        await self._create_status_history(db, ticket, None, ticket.status, "System", "Ticket created")
-        
-        # logger.info(
-        #     "Ticket created", 
-        #     ticket_id=str(ticket.id), 
-        #     external_id=ticket.external_id,
-        #     priority=ticket.priority.value,
-        #     customer_tier=ticket.customer_tier.value
-        # )
-        
+        ticket.next_transition_at = ticket.calculate_next_transition_at(now)
         return ticket
-  
+    
     async def get_ticket_by_id(self, db: AsyncSession, ticket_id: UUID) -> Optional[Ticket]:
         """Get ticket by ID with all related data."""
         result = await db.execute(
@@ -92,32 +369,132 @@ class TicketService:
         db: AsyncSession, 
         skip: int = 0, 
         limit: int = 100,
-        filters: Optional[Dict[str, Any]] = None
-    ) -> Tuple[List[Ticket], int]:
-        """Get tickets with pagination and filtering."""
+        filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        columns: Optional[List[str]] = None
+    ) -> Tuple[List[Any], Optional[int], bool, Optional[str]]:
+        """
+        Get tickets, newest first, with filtering and keyset pagination.
+        
+        Pages are anchored on ``(created_at, id)``: ``cursor`` is the
+        ``next_cursor`` of the previous page and the query seeks past it
+        through ``idx_ticket_created_id``, so every page costs the same.
+        ``skip`` is still honoured for offset pagination when no cursor is
+        given. With a ``search`` filter, tickets are ordered by relevance
+        first and the cursor also carries the rank.
+        
+        With ``columns``, only those columns are selected and tickets are
+        returned as plain dicts without ORM hydration.
+        
+        Args:
+            db: Database session
+            skip: Rows to skip (offset pagination, ignored with a cursor)
+            limit: Page size
+            filters: Filters understood by ``_apply_filters``
+            cursor: Opaque cursor of the previous page
+            count_mode: How to compute the total
+            columns: Ticket column names to project to
+        
+        Returns:
+            Tickets (ORM objects, or dicts with ``columns``) of the page, the
+            total (None for CountMode.NONE), whether the total is an estimate
+            and the cursor of the next page (None on the last page).
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        search = (filters or {}).get("search")
+        anchor = decode_cursor(cursor) if cursor else None
+        if anchor and (anchor[2] is None) != (not search):
+            raise ValueError("Pagination cursor does not match the search")
+        
         try:
-            query = select(Ticket)
+            query = select(*(Ticket.__table__.c[name] for name in columns)) if columns else select(Ticket)
             
             # Apply filters
             if filters:
                 query = self._apply_filters(query, filters)
             
-            # Get total count
-            count_query = select(func.count()).select_from(query.subquery())
-            total_result = await db.execute(count_query)
-            total = total_result.scalar()
+            total, total_is_estimate = await self._count_tickets(db, query, filters, count_mode)
+            
+            # Sort key, most relevant first when searching
+            sort_key = [Ticket.created_at, Ticket.id]
+            if search:
+                rank = func.ts_rank_cd(Ticket.search_vector, self._search_query(search))
+                sort_key.insert(0, rank)
+                query = query.add_columns(rank)
             
-            # Apply pagination and ordering
-            query = query.order_by(desc(Ticket.created_at)).offset(skip).limit(limit)
+            # Seek past the previous page; one extra row tells if there is a next page
+            query = query.order_by(*(desc(column) for column in sort_key))
+            if anchor:
+                created_at, ticket_id, anchor_rank = anchor
+                anchor_key = [created_at, ticket_id] if anchor_rank is None else [
+                    literal(anchor_rank, Float), created_at, ticket_id
+                ]
+                query = query.where(tuple_(*sort_key) < tuple_(*anchor_key))
+            elif skip:
+                query = query.offset(skip)
+            result = await db.execute(query.limit(limit + 1))
+            rows = result.all()
             
-            # Execute query
-            result = await db.execute(query)
-            tickets = result.scalars().all()
+            next_cursor = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                last = rows[-1] if columns else rows[-1][0]
+                next_cursor = encode_cursor(last.created_at, last.id, rows[-1][-1] if search else None)
             
-            return tickets, total
+            if columns:
+                # zip() drops the trailing rank column
+                return [dict(zip(columns, row)) for row in rows], total, total_is_estimate, next_cursor
+            return [row[0] for row in rows], total, total_is_estimate, next_cursor
         except Exception as e:
             raise Exception(f"Error retrieving tickets: {str(e)}")
     
+    async def _count_tickets(
+        self,
+        db: AsyncSession,
+        query,
+        filters: Optional[Dict[str, Any]],
+        count_mode: CountMode
+    ) -> Tuple[Optional[int], bool]:
+        """
+        Total matching tickets according to ``count_mode``, and whether it is an estimate.
+        
+        ESTIMATE reads the planner statistics in ``pg_class.reltuples`` for an
+        unfiltered list and otherwise reuses an exact count cached for
+        ``TICKET_COUNT_CACHE_TTL`` seconds per filter combination. Planner
+        statistics and cached counts are estimates; a count computed for this
+        request is exact in every mode.
+        """
+        if count_mode == CountMode.NONE:
+            return None, False
+        
+        if count_mode == CountMode.ESTIMATE:
+            if not filters:
+                result = await db.execute(
+                    text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+                    {"table": Ticket.__tablename__}
+                )
+                estimate = result.scalar()
+                # -1 until the table has been vacuumed or analyzed
+                if estimate is not None and estimate >= 0:
+                    return estimate, True
+            
+            key = json.dumps(filters or {}, sort_keys=True, default=str)
+            cached = _COUNT_CACHE.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1], True
+        
+        result = await db.execute(select(func.count()).select_from(query.subquery()))
+        total = result.scalar()
+        
+        if count_mode == CountMode.ESTIMATE:
+            if len(_COUNT_CACHE) >= COUNT_CACHE_MAX_ENTRIES:
+                _COUNT_CACHE.clear()
+            _COUNT_CACHE[key] = (time.monotonic() + settings.ticket_count_cache_ttl, total)
+        return total, False
+    
     
     async def _create_status_history(
         self, 
@@ -141,8 +518,7 @@ class TicketService:
     
     async def _recalculate_sla_targets(self, db: AsyncSession, ticket: Ticket):
         """Recalculate SLA targets when priority or customer tier changes."""
-        response_target = sla_config.get_sla_target("response", ticket.priority.value, ticket.customer_tier.value)
-        resolution_target = sla_config.get_sla_target("resolution", ticket.priority.value, ticket.customer_tier.value)
+        response_target, resolution_target = sla_targets.table.get_targets(ticket.customer_tier, ticket.priority)
         
         now = datetime.now(timezone.utc)
         ticket.response_sla_target = response_target
@@ -152,51 +528,110 @@ class TicketService:
         
         # Update SLA status
         ticket.update_sla_status()
+        ticket.next_transition_at = ticket.calculate_next_transition_at(now)
+        sla_timer.schedule(ticket.id, ticket.next_transition_at)
     
     def _apply_filters(self, query, filters: Dict[str, Any]):
-        """Apply filters to the query."""
-        # This is a simplified version - in practice, you'd want more sophisticated filtering
-        if "status" in filters and filters["status"]:
-            statuses = [
-                TicketStatus[s.upper()] if isinstance(s, str) else s
-                for s in filters["status"]
-            ]
-            query = query.where(Ticket.status.in_(statuses))
-            
-        if "priority" in filters and filters["priority"]:
-            query = query.where(Ticket.priority.in_(filters["priority"]))
-        
-        if "customer_tier" in filters and filters["customer_tier"]:
-            query = query.where(Ticket.customer_tier.in_(filters["customer_tier"]))
+        """
+        Apply filters to the query.
         
-        if "escalation_level" in filters and filters["escalation_level"]:
-            query = query.where(Ticket.escalation_level.in_(filters["escalation_level"]))
+        Predicates compare the indexed columns directly with typed enum
+        values, so every filter stays sargable. The common combinations are
+        served by composite indexes (``idx_ticket_active``: status,
+        created_at; ``idx_tickets_priority_customer_tier``;
+        ``idx_ticket_sla_status``), which tests/test_ticket_filter_plans.py
+        checks with ``EXPLAIN``. The search uses the GIN full-text and
+        trigram indexes.
+        """
+        # status + created_at range: idx_ticket_active
+        if filters.get("status"):
+            query = query.where(self._match(Ticket.status, self._enum_values(TicketStatus, filters["status"])))
         
-        if "response_sla_status" in filters and filters["response_sla_status"]:
-            query = query.where(Ticket.response_sla_status.in_(filters["response_sla_status"]))
+        if filters.get("created_from"):
+            query = query.where(Ticket.created_at >= filters["created_from"])
         
-        if "resolution_sla_status" in filters and filters["resolution_sla_status"]:
-            query = query.where(Ticket.resolution_sla_status.in_(filters["resolution_sla_status"]))
+        if filters.get("created_to"):
+            query = query.where(Ticket.created_at <= filters["created_to"])
         
-        if "assigned_to" in filters and filters["assigned_to"]:
-            query = query.where(Ticket.assigned_to.in_(filters["assigned_to"]))
+        # priority + customer_tier: idx_tickets_priority_customer_tier
+        if filters.get("priority"):
+            query = query.where(self._match(Ticket.priority, self._enum_values(Priority, filters["priority"])))
         
-        if "department" in filters and filters["department"]:
-            query = query.where(Ticket.department.in_(filters["department"]))
+        if filters.get("customer_tier"):
+            query = query.where(
+                self._match(Ticket.customer_tier, self._enum_values(CustomerTier, filters["customer_tier"]))
+            )
         
-        if "created_from" in filters and filters["created_from"]:
-            query = query.where(Ticket.created_at >= filters["created_from"])
+        # response + resolution SLA status: idx_ticket_sla_status
+        if filters.get("response_sla_status"):
+            query = query.where(
+                self._match(Ticket.response_sla_status, self._enum_values(SLAStatus, filters["response_sla_status"]))
+            )
         
-        if "created_to" in filters and filters["created_to"]:
-            query = query.where(Ticket.created_at <= filters["created_to"])
+        if filters.get("resolution_sla_status"):
+            query = query.where(
+                self._match(Ticket.resolution_sla_status, self._enum_values(SLAStatus, filters["resolution_sla_status"]))
+            )
         
-        if "search" in filters and filters["search"]:
-            search_term = f"%{filters['search']}%"
+        # Single-column indexes
+        if filters.get("escalation_level"):
             query = query.where(
-                or_(
-                    Ticket.title.ilike(search_term),
-                    Ticket.description.ilike(search_term)
-                )
+                self._match(Ticket.escalation_level, self._enum_values(EscalationLevel, filters["escalation_level"]))
             )
         
+        if filters.get("assigned_to"):
+            query = query.where(self._match(Ticket.assigned_to, filters["assigned_to"]))
+        
+        if filters.get("department"):
+            query = query.where(self._match(Ticket.department, filters["department"]))
+        
+        if filters.get("search"):
+            query = query.where(self._search_condition(filters["search"]))
+        
         return query
+    
+    @staticmethod
+    def _search_query(search: str):
+        """Full-text query of a search string; supports quotes, OR and -exclusions."""
+        return func.websearch_to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), search)
+    
+    def _search_condition(self, search: str):
+        """
+        Match the search string as full text or as a substring of the title or description.
+        
+        The full-text match uses ``idx_ticket_search_vector``, the substring
+        matches the trigram indexes, combined by a bitmap OR.
+        """
+        # LIKE wildcards in the search string match literally
+        escaped = search.replace("/", "//").replace("%", "/%").replace("_", "/_")
+        pattern = f"%{escaped}%"
+        return or_(
+            Ticket.search_vector.op("@@")(self._search_query(search)),
+            Ticket.title.ilike(pattern, escape="/"),
+            Ticket.description.ilike(pattern, escape="/")
+        )
+    
+    @staticmethod
+    def _match(column, values: List[Any]):
+        """Equality for a single value, IN for several."""
+        return column == values[0] if len(values) == 1 else column.in_(values)
+    
+    @staticmethod
+    def _enum_values(enum_class, values: List[Any]) -> List[Any]:
+        """
+        Convert filter values to enum members.
+        
+        Accepts members, values and case-insensitive names.
+        
+        Raises:
+            ValueError: If a value is not a member of ``enum_class``
+        """
+        members = []
+        for value in values:
+            if isinstance(value, enum_class):
+                members.append(value)
+            elif isinstance(value, str) and value.upper() in enum_class.__members__:
+                members.append(enum_class[value.upper()])
+            else:
+                members.append(enum_class(value))
+        return members
@@ -0,0 +1,221 @@
+"""Business calendar arithmetic for business-hours SLAs."""
+
+from bisect import bisect_left
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, Iterable, Tuple
+from zoneinfo import ZoneInfo
+
+WEEKDAY_NAMES = {"MON": 0, "TUE": 1, "WED": 2, "THU": 3, "FRI": 4, "SAT": 5, "SUN": 6}
+
+ONE_DAY = timedelta(days=1)
+ONE_WEEK = timedelta(days=7)
+
+
+class BusinessCalendar:
+    """
+    Working hours, working days and holidays of one support team.
+
+    Elapsed business time and business deadlines are computed arithmetically
+    instead of stepping through time: whole weeks are counted in O(1), the
+    partial first and last days are clipped to the working hours, and holidays
+    are found by bisecting a sorted list. A month-long interval costs a few
+    dozen operations instead of one loop iteration per minute.
+
+    Working hours are wall-clock times in ``timezone``. Naive datetimes are
+    interpreted as UTC; results are returned in UTC.
+
+    Args:
+        timezone: IANA timezone name of the working hours
+        workdays: Working weekdays, 0 = Monday
+        start: Start of the working day
+        end: End of the working day
+        holidays: Dates without working hours
+    """
+
+    def __init__(
+        self,
+        timezone: str = "UTC",
+        workdays: Iterable[int] = (0, 1, 2, 3, 4),
+        start: time = time(9, 0),
+        end: time = time(17, 0),
+        holidays: Iterable[date] = ()
+    ):
+        if end <= start:
+            raise ValueError("Business day must end after it starts")
+
+        self.tz = ZoneInfo(timezone)
+        self.workdays = frozenset(workdays)
+        if not self.workdays:
+            raise ValueError("Business calendar needs at least one workday")
+
+        self.start = start
+        self.end = end
+        self.day_start_minute = start.hour * 60 + start.minute
+        self.day_end_minute = end.hour * 60 + end.minute
+        self.minutes_per_day = self.day_end_minute - self.day_start_minute
+        # Only holidays on workdays change any result
+        self.holidays: Tuple[date, ...] = tuple(sorted(
+            {day for day in holidays if day.weekday() in self.workdays}
+        ))
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "BusinessCalendar":
+        """
+        Build a calendar from its ``sla_config.yaml`` section.
+
+        Example::
+
+            timezone: Europe/Berlin
+            workdays: [MON, TUE, WED, THU, FRI]
+            hours: {start: "08:00", end: "18:00"}
+            holidays: ["2026-12-25", "2026-12-26"]
+        """
+        hours = config.get("hours", {})
+        return cls(
+            timezone=config.get("timezone", "UTC"),
+            workdays=[
+                WEEKDAY_NAMES[day.upper()[:3]] if isinstance(day, str) else int(day)
+                for day in config.get("workdays", ["MON", "TUE", "WED", "THU", "FRI"])
+            ],
+            start=time.fromisoformat(str(hours.get("start", "09:00"))),
+            end=time.fromisoformat(str(hours.get("end", "17:00"))),
+            holidays=[
+                day if isinstance(day, date) else date.fromisoformat(str(day))
+                for day in config.get("holidays", [])
+            ]
+        )
+
+    def is_business_day(self, day: date) -> bool:
+        """Check if a date has working hours."""
+        if day.weekday() not in self.workdays:
+            return False
+        index = bisect_left(self.holidays, day)
+        return index == len(self.holidays) or self.holidays[index] != day
+
+    def business_days_between(self, first: date, last: date) -> int:
+        """Count business days in the half-open range ``[first, last)``."""
+        if last <= first:
+            return 0
+
+        weeks, rest = divmod((last - first).days, 7)
+        count = weeks * len(self.workdays)
+        weekday = first.weekday()
+        for offset in range(rest):
+            if (weekday + offset) % 7 in self.workdays:
+                count += 1
+
+        count -= bisect_left(self.holidays, last) - bisect_left(self.holidays, first)
+        return count
+
+    def business_minutes_between(self, start_time: datetime, end_time: datetime) -> int:
+        """Whole business minutes elapsed between two instants."""
+        return int(self.business_seconds_between(start_time, end_time) // 60)
+
+    def business_seconds_between(self, start_time: datetime, end_time: datetime) -> float:
+        """Business seconds elapsed between two instants."""
+        start_local = self._to_local(start_time)
+        end_local = self._to_local(end_time)
+        if end_local <= start_local:
+            return 0.0
+
+        first_day = start_local.date()
+        last_day = end_local.date()
+        start_offset = self._clip(self._seconds_into_day(start_local))
+        end_offset = self._clip(self._seconds_into_day(end_local))
+
+        if first_day == last_day:
+            if not self.is_business_day(first_day):
+                return 0.0
+            return max(0.0, end_offset - start_offset)
+
+        seconds = 0.0
+        if self.is_business_day(first_day):
+            seconds += self.day_end_minute * 60 - start_offset
+        if self.is_business_day(last_day):
+            seconds += end_offset - self.day_start_minute * 60
+        seconds += self.business_days_between(first_day + ONE_DAY, last_day) * self.minutes_per_day * 60
+        return seconds
+
+    def add_business_minutes(self, start_time: datetime, minutes: float) -> datetime:
+        """Instant at which ``minutes`` business minutes have elapsed after ``start_time``."""
+        local = self._to_local(start_time)
+        day = local.date()
+        offset = self._seconds_into_day(local)
+
+        # Move to the next business instant
+        if not self.is_business_day(day) or offset >= self.day_end_minute * 60:
+            day = self._next_business_day(day)
+            offset = self.day_start_minute * 60
+        offset = max(offset, self.day_start_minute * 60)
+
+        remaining = minutes * 60
+        available = self.day_end_minute * 60 - offset
+        if remaining <= available:
+            return self._to_utc(day, offset + remaining)
+
+        # Skip whole business days, ending inside the last one
+        remaining -= available
+        day_seconds = self.minutes_per_day * 60
+        full_days, leftover = divmod(remaining, day_seconds)
+        if leftover == 0:
+            full_days -= 1
+            leftover = day_seconds
+
+        day = self._advance_business_days(self._next_business_day(day), int(full_days))
+        return self._to_utc(day, self.day_start_minute * 60 + leftover)
+
+    def next_business_time(self, current_time: datetime) -> datetime:
+        """The given instant if it is within working hours, otherwise the next working start."""
+        local = self._to_local(current_time)
+        day = local.date()
+        offset = self._seconds_into_day(local)
+
+        if self.is_business_day(day) and self.day_start_minute * 60 <= offset < self.day_end_minute * 60:
+            return local.astimezone(timezone.utc)
+        if self.is_business_day(day) and offset < self.day_start_minute * 60:
+            return self._to_utc(day, self.day_start_minute * 60)
+        return self._to_utc(self._next_business_day(day), self.day_start_minute * 60)
+
+    def _next_business_day(self, day: date) -> date:
+        day += ONE_DAY
+        while not self.is_business_day(day):
+            day += ONE_DAY
+        return day
+
+    def _advance_business_days(self, day: date, count: int) -> date:
+        """The business day ``count`` business days after ``day``."""
+        per_week = len(self.workdays)
+        while count > 0:
+            # Every 7-day span holds exactly per_week workdays; jump it when holiday-free
+            week_end = day + ONE_WEEK
+            if count >= per_week and (
+                bisect_left(self.holidays, week_end + ONE_DAY) == bisect_left(self.holidays, day + ONE_DAY)
+            ):
+                day = week_end
+                count -= per_week
+                continue
+            day += ONE_DAY
+            if self.is_business_day(day):
+                count -= 1
+        return day
+
+    def _clip(self, seconds: float) -> float:
+        return min(max(seconds, self.day_start_minute * 60), self.day_end_minute * 60)
+
+    def _to_local(self, moment: datetime) -> datetime:
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        return moment.astimezone(self.tz)
+
+    @staticmethod
+    def _seconds_into_day(local: datetime) -> float:
+        return local.hour * 3600 + local.minute * 60 + local.second + local.microsecond / 1_000_000
+
+    def _to_utc(self, day: date, seconds: float) -> datetime:
+        # Aware arithmetic in a ZoneInfo zone is wall-clock arithmetic
+        local = datetime.combine(day, time(0), tzinfo=self.tz) + timedelta(seconds=seconds)
+        return local.astimezone(timezone.utc)
+
+
+# Calendar of the original hard-coded rule: 9 AM to 5 PM UTC, Monday to Friday
+DEFAULT_BUSINESS_CALENDAR = BusinessCalendar()
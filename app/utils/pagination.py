@@ -0,0 +1,37 @@
+"""Opaque keyset pagination cursors."""
+
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+
+
+def encode_cursor(created_at: datetime, ticket_id: UUID, rank: Optional[float] = None) -> str:
+    """
+    Encode the sort key of the last row of a page as an opaque cursor.
+
+    ``rank`` is the search relevance of the row for relevance-ordered pages.
+    """
+    key = [created_at.isoformat(), str(ticket_id)]
+    if rank is not None:
+        key.append(rank)
+    payload = json.dumps(key, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID, Optional[float]]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, ticket_id, *rank = json.loads(payload)
+        if len(rank) > 1:
+            raise ValueError("Unexpected cursor fields")
+        return datetime.fromisoformat(created_at), UUID(ticket_id), float(rank[0]) if rank else None
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
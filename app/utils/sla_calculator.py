@@ -5,6 +5,7 @@ from typing import Optional, Dict, Any
 from enum import Enum as PyEnum
 
 from app.models.ticket import SLAStatus
+from app.utils.business_calendar import BusinessCalendar, DEFAULT_BUSINESS_CALENDAR
 
 
 class SLAType(PyEnum):
@@ -93,59 +94,24 @@ class SLACalculator:
             return f"{days}d"
     
     @staticmethod
-    def calculate_business_hours_elapsed(start_time: datetime, end_time: datetime) -> int:
-        """Calculate elapsed business hours (simplified - 9 AM to 5 PM, Monday to Friday)."""
-        current = start_time
-        business_minutes = 0
-        
-        while current < end_time:
-            # Skip weekends
-            if current.weekday() >= 5:  # Saturday = 5, Sunday = 6
-                # Move to next Monday
-                days_to_add = 7 - current.weekday()
-                current = current.replace(hour=9, minute=0, second=0, microsecond=0)
-                current += timedelta(days=days_to_add)
-                continue
-            
-            # Skip outside business hours
-            if current.hour < 9 or current.hour >= 17:
-                # Move to next business hour
-                if current.hour >= 17:
-                    # Move to next day at 9 AM
-                    current = current.replace(hour=9, minute=0, second=0, microsecond=0)
-                    current += timedelta(days=1)
-                else:
-                    # Move to 9 AM
-                    current = current.replace(hour=9, minute=0, second=0, microsecond=0)
-                continue
-            
-            # Count this minute
-            business_minutes += 1
-            current += timedelta(minutes=1)
-        
-        return business_minutes
+    def calculate_business_hours_elapsed(
+        start_time: datetime, 
+        end_time: datetime, 
+        calendar: Optional[BusinessCalendar] = None
+    ) -> int:
+        """Calculate elapsed business minutes (9 AM to 5 PM UTC, Monday to Friday unless a calendar is given)."""
+        return (calendar or DEFAULT_BUSINESS_CALENDAR).business_minutes_between(start_time, end_time)
     
     @staticmethod
-    def get_next_business_time(current_time: datetime) -> datetime:
-        """Get next business time (9 AM next business day if outside hours)."""
-        # If it's a weekend, move to next Monday
-        if current_time.weekday() >= 5:
-            days_to_add = 7 - current_time.weekday()
-            next_business_time = current_time.replace(hour=9, minute=0, second=0, microsecond=0)
-            next_business_time += timedelta(days=days_to_add)
-            return next_business_time
-        
-        # If it's outside business hours, move to next business time
-        if current_time.hour < 9:
-            # Move to 9 AM today
-            return current_time.replace(hour=9, minute=0, second=0, microsecond=0)
-        elif current_time.hour >= 17:
-            # Move to 9 AM next business day
-            next_day = current_time + timedelta(days=1)
-            # Skip weekend if needed
-            while next_day.weekday() >= 5:
-                next_day += timedelta(days=1)
-            return next_day.replace(hour=9, minute=0, second=0, microsecond=0)
-        
-        # Within business hours, return current time
-        return current_time
+    def calculate_business_deadline(
+        start_time: datetime, 
+        target_minutes: int, 
+        calendar: Optional[BusinessCalendar] = None
+    ) -> datetime:
+        """Calculate the deadline reached after target_minutes business minutes."""
+        return (calendar or DEFAULT_BUSINESS_CALENDAR).add_business_minutes(start_time, target_minutes)
+    
+    @staticmethod
+    def get_next_business_time(current_time: datetime, calendar: Optional[BusinessCalendar] = None) -> datetime:
+        """Get next business time (start of the next business day if outside hours)."""
+        return (calendar or DEFAULT_BUSINESS_CALENDAR).next_business_time(current_time)
@@ -0,0 +1,150 @@
+"""Vectorized SLA status evaluation for whole batches of tickets."""
+
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from app.models.ticket import SLAStatus
+
+# Integer codes of SLAStatus; the index in SLA_STATUSES is the code
+SLA_STATUSES = (
+    SLAStatus.COMPLIANT,
+    SLAStatus.WARNING,
+    SLAStatus.CRITICAL,
+    SLAStatus.BREACHED,
+    SLAStatus.PAUSED,
+)
+STATUS_CODES = {status: code for code, status in enumerate(SLA_STATUSES)}
+COMPLIANT, WARNING, CRITICAL, BREACHED, PAUSED = range(len(SLA_STATUSES))
+UNKNOWN_STATUS = -1  # previous status not known; treated as unchanged
+
+# Alert decisions; the index in ALERT_TYPES is the code
+ALERT_TYPES = (None, "warning", "critical")
+NO_ALERT, WARNING_ALERT, CRITICAL_ALERT = range(len(ALERT_TYPES))
+
+# Deadlines and transitions are int64 epoch microseconds so that threshold
+# comparisons are exact, like the datetime arithmetic they replace
+MICROSECONDS_PER_MINUTE = 60_000_000
+NO_DEADLINE = np.iinfo(np.int64).min
+NO_TRANSITION = np.iinfo(np.int64).max
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_epoch_microseconds(moment: Optional[datetime]) -> int:
+    """Exact epoch microseconds of an aware datetime; NO_DEADLINE for None."""
+    if moment is None:
+        return NO_DEADLINE
+    return (moment - EPOCH) // ONE_MICROSECOND
+
+
+def from_epoch_microseconds(value: int) -> Optional[datetime]:
+    """Aware UTC datetime of epoch microseconds; None for NO_TRANSITION."""
+    if value == NO_TRANSITION:
+        return None
+    return EPOCH + timedelta(microseconds=value)
+
+
+class SLABatchResult(NamedTuple):
+    """Outcome of evaluating one SLA type for a batch of tickets."""
+
+    remaining_minutes: np.ndarray  # int64, whole minutes left, 0 once breached or paused
+    statuses: np.ndarray           # int8 status codes after this evaluation
+    alerts: np.ndarray             # int8 alert decisions (NO_ALERT, WARNING_ALERT, CRITICAL_ALERT)
+    breached: np.ndarray           # bool, deadline passed during this evaluation
+    next_transition: np.ndarray    # int64 epoch microseconds of the next crossing, NO_TRANSITION if none
+
+
+def evaluate_sla_batch(
+    deadlines: np.ndarray,
+    targets: np.ndarray,
+    previous_statuses: np.ndarray,
+    now: int,
+    warning_threshold: float = 15.0,
+    critical_threshold: float = 5.0
+) -> SLABatchResult:
+    """
+    Evaluate one SLA type (response or resolution) for a batch of tickets.
+
+    Replicates ``Ticket.update_sla_status``, the alert decision of
+    ``SLAEngine._check_sla_type_alerts``, the breach check and
+    ``Ticket.calculate_next_transition_at`` in a single vectorized pass.
+
+    Args:
+        deadlines: int64 epoch microseconds, NO_DEADLINE for tickets without one
+        targets: SLA targets in minutes, 0 for tickets without one
+        previous_statuses: int8 status codes before this evaluation, or UNKNOWN_STATUS
+        now: Evaluation time in epoch microseconds
+        warning_threshold: Percentage of the target left that raises a warning alert
+        critical_threshold: Percentage of the target left that raises a critical alert
+
+    Returns:
+        SLABatchResult with one entry per ticket in every array.
+    """
+    deadlines = np.asarray(deadlines, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    previous_statuses = np.asarray(previous_statuses, dtype=np.int8)
+
+    has_deadline = deadlines != NO_DEADLINE
+    # Missing deadlines are masked as "now" so that no arithmetic overflows
+    deadlines = np.where(has_deadline, deadlines, now)
+    remaining = deadlines - now
+    remaining_minutes = np.maximum(remaining, 0) // MICROSECONDS_PER_MINUTE
+
+    # Status thresholds of update_sla_status: whole minutes against int(target * pct)
+    critical_minutes = (targets * 0.05).astype(np.int64)
+    warning_minutes = (targets * 0.15).astype(np.int64)
+    statuses = np.select(
+        [~has_deadline, remaining <= 0, remaining_minutes <= critical_minutes, remaining_minutes <= warning_minutes],
+        [PAUSED, BREACHED, CRITICAL, WARNING],
+        default=COMPLIANT
+    ).astype(np.int8)
+
+    # Alert decisions compare against the status before this evaluation
+    previous = np.where(previous_statuses == UNKNOWN_STATUS, statuses, previous_statuses)
+    alertable = (targets > 0) & (statuses != BREACHED)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        remaining_percentage = np.where(targets > 0, (remaining_minutes / targets) * 100, 0.0)
+    alerts = np.select(
+        [
+            alertable & (remaining_percentage <= critical_threshold) & (previous != CRITICAL),
+            alertable & (remaining_percentage <= warning_threshold) & (previous == COMPLIANT),
+        ],
+        [CRITICAL_ALERT, WARNING_ALERT],
+        default=NO_ALERT
+    ).astype(np.int8)
+
+    breached = has_deadline & (previous != BREACHED) & (now >= deadlines)
+
+    # Next crossing: the earliest of deadline, warning and critical instants still ahead
+    crossings = np.stack([
+        deadlines,
+        deadlines - (warning_minutes + 1) * MICROSECONDS_PER_MINUTE,
+        deadlines - (critical_minutes + 1) * MICROSECONDS_PER_MINUTE,
+    ])
+    valid = np.stack([has_deadline, has_deadline & (targets > 0), has_deadline & (targets > 0)]) & (crossings >= now)
+    next_transition = np.where(valid, crossings, NO_TRANSITION).min(axis=0)
+
+    return SLABatchResult(remaining_minutes, statuses, alerts, breached, next_transition)
+
+
+def escalation_levels(response_statuses: np.ndarray, resolution_statuses: np.ndarray) -> np.ndarray:
+    """
+    Escalation level per ticket from its SLA statuses.
+
+    Mirrors ``SLAEngine._update_escalation_level``: response SLA states take
+    precedence, a critical resolution SLA escalates to level 2.
+    """
+    return np.select(
+        [
+            response_statuses == BREACHED,
+            response_statuses == CRITICAL,
+            response_statuses == WARNING,
+            resolution_statuses == BREACHED,
+            resolution_statuses == CRITICAL,
+        ],
+        [4, 3, 1, 4, 2],
+        default=0
+    ).astype(np.int8)
@@ -0,0 +1,126 @@
+"""Compiled SLA target lookup table."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import structlog
+
+from app.config import SLAConfig, sla_config
+from app.models.ticket import CustomerTier, EscalationLevel, Priority
+from app.utils.sla_calculator import SLAType
+
+logger = structlog.get_logger(__name__)
+
+# Fallback when a tier / priority / SLA type has no configured target
+DEFAULT_TARGET_MINUTES = 1440
+DEFAULT_WARNING_THRESHOLD = 0.15
+DEFAULT_CRITICAL_THRESHOLD = 0.05
+
+# Enum ordinals used as table indexes
+TIER_ORDINALS = {tier: ordinal for ordinal, tier in enumerate(CustomerTier)}
+PRIORITY_ORDINALS = {priority: ordinal for ordinal, priority in enumerate(Priority)}
+LEVEL_ORDINALS = {level: ordinal for ordinal, level in enumerate(EscalationLevel)}
+SLA_TYPE_ORDINALS = {
+    SLAType.RESPONSE: 0, SLAType.RESPONSE.value: 0,
+    SLAType.RESOLUTION: 1, SLAType.RESOLUTION.value: 1,
+}
+PRIORITY_COUNT = len(PRIORITY_ORDINALS)
+
+
+@dataclass(frozen=True, slots=True)
+class SLATargetTable:
+    """
+    Immutable SLA targets, thresholds and escalation timings compiled from ``sla_config.yaml``.
+
+    Targets are stored as one ``(response, resolution)`` tuple per tier and
+    priority in a flat tuple indexed by enum ordinals, so a lookup is two dict
+    hits and a tuple index without walking the raw YAML or allocating.
+    """
+
+    targets: Tuple[Tuple[int, int], ...]                 # [tier * PRIORITY_COUNT + priority] -> (response, resolution)
+    escalation_minutes: Tuple[Tuple[Optional[int], ...], ...]  # [tier * PRIORITY_COUNT + priority][level]
+    warning_threshold: float
+    critical_threshold: float
+
+    def get_targets(self, customer_tier: CustomerTier, priority: Priority) -> Tuple[int, int]:
+        """Response and resolution targets in minutes."""
+        return self.targets[TIER_ORDINALS[customer_tier] * PRIORITY_COUNT + PRIORITY_ORDINALS[priority]]
+
+    def get_target(self, customer_tier: CustomerTier, priority: Priority, sla_type) -> int:
+        """Target in minutes of one SLA type ("response"/"resolution" or SLAType)."""
+        return self.get_targets(customer_tier, priority)[SLA_TYPE_ORDINALS[sla_type]]
+
+    def get_escalation_minutes(
+        self,
+        customer_tier: CustomerTier,
+        priority: Priority,
+        level: EscalationLevel
+    ) -> Optional[int]:
+        """Minutes after creation at which a ticket reaches an escalation level, if configured."""
+        return self.escalation_minutes[
+            TIER_ORDINALS[customer_tier] * PRIORITY_COUNT + PRIORITY_ORDINALS[priority]
+        ][LEVEL_ORDINALS[level]]
+
+    @classmethod
+    def compile(cls, config: Dict[str, Any]) -> "SLATargetTable":
+        """Build a table from the raw configuration."""
+        sla_targets = config.get("sla_targets") or {}
+
+        targets = []
+        escalation_minutes = []
+        for tier in CustomerTier:
+            tier_config = sla_targets.get(tier.value) or {}
+            for priority in Priority:
+                priority_config = tier_config.get(priority.value) or {}
+                targets.append((
+                    int(priority_config.get(SLAType.RESPONSE.value, DEFAULT_TARGET_MINUTES)),
+                    int(priority_config.get(SLAType.RESOLUTION.value, DEFAULT_TARGET_MINUTES)),
+                ))
+                escalation = priority_config.get("escalation") or {}
+                escalation_minutes.append(tuple(
+                    int(escalation[level.name]) if level.name in escalation else None
+                    for level in EscalationLevel
+                ))
+
+        # ``alert_thresholds`` holds fractions, ``thresholds`` percentages
+        alert_thresholds = config.get("alert_thresholds") or {}
+        thresholds = config.get("thresholds") or {}
+        warning_threshold = alert_thresholds.get("warning")
+        if warning_threshold is None:
+            warning_threshold = thresholds.get("warning_pct", DEFAULT_WARNING_THRESHOLD * 100) / 100
+        critical_threshold = alert_thresholds.get("critical")
+        if critical_threshold is None:
+            critical_threshold = thresholds.get("critical_pct", DEFAULT_CRITICAL_THRESHOLD * 100) / 100
+
+        return cls(
+            targets=tuple(targets),
+            escalation_minutes=tuple(escalation_minutes),
+            warning_threshold=float(warning_threshold),
+            critical_threshold=float(critical_threshold)
+        )
+
+
+class SLATargetRegistry:
+    """
+    Current SLA target table, recompiled whenever the configuration is reloaded.
+
+    Readers take ``registry.table`` once and use that snapshot; a reload
+    compiles a complete new table and publishes it with a single reference
+    assignment, so a reader never sees a half-updated table.
+    """
+
+    def __init__(self, config: SLAConfig):
+        self.table = SLATargetTable.compile(config.config)
+        config.subscribe_to_changes(self._reload)
+
+    def _reload(self, config: Dict[str, Any]):
+        try:
+            table = SLATargetTable.compile(config)
+        except Exception as e:
+            logger.error("Failed to compile SLA targets, keeping previous table", error=str(e))
+            return
+        self.table = table
+
+
+# Process-wide registry following sla_config reloads
+sla_targets = SLATargetRegistry(sla_config)
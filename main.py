@@ -5,7 +5,7 @@ from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any, Dict
 import re
-from fastapi import FastAPI, HTTPException, Request, status
+from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, HTMLResponse, PlainTextResponse
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -20,13 +20,19 @@ from app.api.tickets import router as tickets_router
 from app.services.sla_engine import SLAEngine
 from app.services.ticket_service import TicketService
 from app.services.escalation_service import EscalationService
+from app.services.sla_timer import sla_timer
+from app.services.notification_transport import notification_transport
+from app.services.notification_dispatcher import notification_dispatcher
 from app.utils.sla_calculator import SLACalculator
 from app.utils.logging import setup_logging
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 from pydantic import ValidationError
 from app.database import AsyncSessionLocal
-from ticket_triage_service.rag_pipeline import run_rag,PromptIntentClassifier
+from app.dependencies import get_rag_engine
+from ticket_triage_service.intent_classifier import intent_classifier
+from ticket_triage_service.rag_engine import RAGEngine, rag_engine
+from ticket_triage_service.inference_executor import InferenceOverloaded, InferenceTimeout, inference_executor
 
 
 # Setup structured logging
@@ -79,6 +85,10 @@ async def start_background_scheduler():
         # Start scheduler
         scheduler.start()
         
+        # Evaluate tickets at their exact threshold crossings between ticks
+        if settings.sla_timer_enabled:
+            await sla_timer.start(sla_engine, AsyncSessionLocal)
+        
         # logger.info(
         #     "Background SLA scheduler started",
         #     interval_seconds=settings.scheduler_interval
@@ -94,6 +104,7 @@ async def stop_background_scheduler():
     global scheduler
     
     try:
+        await sla_timer.stop()
         scheduler.shutdown()
         # logger.info("Background scheduler stopped")
     except Exception as e:
@@ -115,9 +126,26 @@ async def run_sla_evaluation():
         escalation_service = EscalationService()
         sla_engine = SLAEngine(ticket_service, escalation_service)
         
+        if settings.sla_shard_count > 1:
+            # Claim shards so that replicas split the tickets between them
+            from app.database import async_engine
+            from app.services.shard_lease import ShardLeaseManager
+            
+            lease_manager = ShardLeaseManager(
+                async_engine,
+                settings.sla_shard_count,
+                settings.sla_max_shards_per_worker or None
+            )
+            await sla_engine.run_sharded_evaluation(AsyncSessionLocal, lease_manager)
+            notification_dispatcher.wake()
+            return
+        
         # Get database session
         async with AsyncSessionLocal() as db:
-            await sla_engine.evaluate_all_tickets(db)
+            await sla_engine.run_evaluation(db)
+        
+        # Deliver the alerts of this tick right away
+        notification_dispatcher.wake()
         # result = await sla_engine.evaluate_all_tickets(db_session)
          # logger.info(
             #     "Scheduled SLA evaluation completed",
@@ -151,17 +179,35 @@ async def lifespan(app: FastAPI):
     try:
         # Initialize database
         await init_database()
+        # Open the pooled HTTP client used for notifications
+        await notification_transport.start()
         # Start background scheduler
         await start_background_scheduler()        
+        # Deliver alerts recorded in the notification outbox
+        if settings.notification_outbox_enabled:
+            await notification_dispatcher.start(AsyncSessionLocal)
         # Setup configuration monitoring
         await setup_config_monitoring()
+        # Worker pool for model inference, off the event loop
+        inference_executor.start()
+        # Load the RAG index and models in the background
+        if settings.rag_enabled:
+            await rag_engine.start()
+        # Load the intent classifier and embed the configured intents
+        if settings.classifier_preload:
+            await intent_classifier.start()
         yield        
     except Exception as e:
         logger.error("Failed to start application", error=str(e))
         raise
     finally:        
         try:
+            await rag_engine.stop()
+            await intent_classifier.stop()
+            inference_executor.stop()
             await stop_background_scheduler()
+            await notification_dispatcher.stop()
+            await notification_transport.close()
             await close_database()
             # logger.info("SLA Tracking Service shutdown complete")
         except Exception as e:
@@ -204,32 +250,36 @@ async def root():
 @app.get("/health")
 async def health():
     """Health check endpoint"""
-    return {"status": "healthy", "service": "SLA Tracker API"}
+    return {"status": "healthy", "service": "SLA Tracker API", "rag": rag_engine.state.value}
+
+
+def inference_error_response(error: Exception) -> JSONResponse:
+    """503 for requests shed by the inference pool, 504 for missed deadlines."""
+    if isinstance(error, InferenceOverloaded):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": str(error)},
+            headers={"Retry-After": "5"}
+        )
+    return JSONResponse(status_code=status.HTTP_504_GATEWAY_TIMEOUT, content={"detail": str(error)})
 
 
 @app.post("/classify")
 async def classify_ticket(content: str):
     """Classify ticket content using RAG pipeline"""
     try:
-        classifier = PromptIntentClassifier()
-
-        intents = [
-            "password reset",
-            "account login issue",
-            "DSPM documentation question",
-            "release notes inquiry",
-            "general help"
-        ]
-        result = classifier.classify(content, intents)
+        result = await intent_classifier.classify(content)
         return result
+    except (InferenceOverloaded, InferenceTimeout) as e:
+        return inference_error_response(e)
     except Exception as e:
         return JSONResponse(status_code=500, content={"detail": str(e)})
     
 @app.post("/respond")
-async def responsd(question: str):
+async def responsd(question: str, rag: RAGEngine = Depends(get_rag_engine)):
     """Run RAG on given input question"""
     try:
-        result = run_rag(question)
+        result = await rag.answer(question)
         print("\nANSWER:\n", result["answer"])
         print("\nSOURCES:")
         for i, s in enumerate(result["sources"], 1):
@@ -243,6 +293,8 @@ async def responsd(question: str):
             return HTMLResponse(content=result['answer'])
         else:
             return PlainTextResponse(content=result['answer'])
+    except (InferenceOverloaded, InferenceTimeout) as e:
+        return inference_error_response(e)
     except Exception as e:
         return JSONResponse(status_code=500, content={"detail": str(e)})
 
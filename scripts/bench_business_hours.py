@@ -0,0 +1,81 @@
+"""Benchmark the business calendar against the original per-minute loop.
+
+Usage:
+    python scripts/bench_business_hours.py [--samples 200] [--max-days 30]
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils.business_calendar import BusinessCalendar  # noqa: E402
+
+
+def legacy_business_minutes(start_time: datetime, end_time: datetime) -> int:
+    """The original SLACalculator.calculate_business_hours_elapsed loop."""
+    current = start_time
+    business_minutes = 0
+
+    while current < end_time:
+        if current.weekday() >= 5:
+            days_to_add = 7 - current.weekday()
+            current = current.replace(hour=9, minute=0, second=0, microsecond=0)
+            current += timedelta(days=days_to_add)
+            continue
+
+        if current.hour < 9 or current.hour >= 17:
+            if current.hour >= 17:
+                current = current.replace(hour=9, minute=0, second=0, microsecond=0)
+                current += timedelta(days=1)
+            else:
+                current = current.replace(hour=9, minute=0, second=0, microsecond=0)
+            continue
+
+        business_minutes += 1
+        current += timedelta(minutes=1)
+
+    return business_minutes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=200, help="Intervals to time")
+    parser.add_argument("--max-days", type=int, default=30, help="Longest interval in days")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    base = datetime(2026, 1, 5, tzinfo=timezone.utc)
+    intervals = []
+    for _ in range(args.samples):
+        # Minute-aligned starts, where both implementations agree exactly
+        start = base + timedelta(minutes=rng.randint(0, 60 * 24 * 365))
+        intervals.append((start, start + timedelta(minutes=rng.randint(0, 60 * 24 * args.max_days))))
+
+    calendar = BusinessCalendar()
+
+    started = time.perf_counter()
+    legacy = [legacy_business_minutes(start, end) for start, end in intervals]
+    legacy_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    current = [calendar.business_minutes_between(start, end) for start, end in intervals]
+    calendar_seconds = time.perf_counter() - started
+
+    mismatches = sum(1 for a, b in zip(legacy, current) if a != b)
+
+    print(f"intervals:        {args.samples} (up to {args.max_days} days)")
+    print(f"per-minute loop:  {legacy_seconds * 1e6 / args.samples:10.1f} us/call")
+    print(f"calendar:         {calendar_seconds * 1e6 / args.samples:10.1f} us/call")
+    print(f"speedup:          {legacy_seconds / max(calendar_seconds, 1e-9):10.0f}x")
+    print(f"mismatches:       {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
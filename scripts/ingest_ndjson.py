@@ -0,0 +1,74 @@
+"""Backfill tickets from an NDJSON file (one TicketCreate object per line).
+
+Usage:
+    python scripts/ingest_ndjson.py tickets.ndjson [--batch-size 1000] [--concurrency 4]
+    zcat tickets.ndjson.gz | python scripts/ingest_ndjson.py -
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.database import close_database  # noqa: E402
+from app.services.ticket_ingest import IngestStats, TicketIngestor, iter_ndjson_lines  # noqa: E402
+
+READ_CHUNK_BYTES = 1 << 20
+
+
+async def read_chunks(stream):
+    """Read a binary stream in chunks without blocking the event loop."""
+    while True:
+        chunk = await asyncio.to_thread(stream.read, READ_CHUNK_BYTES)
+        if not chunk:
+            return
+        yield chunk
+
+
+def print_progress(stats: IngestStats):
+    print(
+        f"lines {stats.lines:>12,}  created {stats.created:>12,}  failed {stats.failed:>9,}  "
+        f"invalid {stats.invalid:>9,}  {stats.tickets_per_second:>9,.0f} tickets/s",
+        file=sys.stderr
+    )
+
+
+async def run(args) -> IngestStats:
+    ingestor = TicketIngestor(
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+        max_pending_batches=args.max_pending,
+        progress_interval=args.progress_interval,
+        on_progress=print_progress,
+        # No SLA timer runs in this process; the service's scheduler picks
+        # the tickets up through next_transition_at
+        schedule_timer=False
+    )
+    stream = sys.stdin.buffer if args.path == "-" else open(args.path, "rb")
+    try:
+        return await ingestor.ingest(iter_ndjson_lines(read_chunks(stream)))
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+        await close_database()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="NDJSON file, or - for stdin")
+    parser.add_argument("--batch-size", type=int, help="Tickets per multi-row insert")
+    parser.add_argument("--concurrency", type=int, help="Batches written in parallel")
+    parser.add_argument("--max-pending", type=int, help="Validated batches buffered ahead of the writers")
+    parser.add_argument("--progress-interval", type=float, help="Seconds between progress lines")
+    args = parser.parse_args()
+
+    stats = asyncio.run(run(args))
+    print(json.dumps(stats.summary(), indent=2))
+    return 1 if stats.invalid or stats.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
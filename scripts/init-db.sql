@@ -6,6 +6,7 @@
 -- Extensions
 -- -------------------------
 CREATE EXTENSION IF NOT EXISTS pgcrypto;
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
 
 -- -------------------------
 -- ENUM Types (MUST MATCH PYTHON ENUMS)
@@ -101,9 +102,17 @@ $$ LANGUAGE plpgsql;
 CREATE INDEX IF NOT EXISTS idx_tickets_status_created
     ON tickets(status, created_at DESC);
 
+-- Keyset pagination of the ticket list on (created_at, id)
+CREATE INDEX IF NOT EXISTS idx_ticket_created_id
+    ON tickets(created_at, id);
+
 CREATE INDEX IF NOT EXISTS idx_tickets_priority_customer_tier
     ON tickets(priority, customer_tier);
 
+-- Combined SLA status filter of the ticket list (also in Ticket.__table_args__)
+CREATE INDEX IF NOT EXISTS idx_ticket_sla_status
+    ON tickets(response_sla_status, resolution_sla_status);
+
 CREATE INDEX IF NOT EXISTS idx_tickets_response_sla_status
     ON tickets(response_sla_status);
 
@@ -119,9 +128,70 @@ CREATE INDEX IF NOT EXISTS idx_tickets_assigned_to
 CREATE INDEX IF NOT EXISTS idx_tickets_department
     ON tickets(department);
 
+-- Incremental SLA evaluation: next warning/critical/breach crossing
+ALTER TABLE tickets ADD COLUMN IF NOT EXISTS next_transition_at TIMESTAMPTZ;
+
+CREATE INDEX IF NOT EXISTS idx_ticket_next_transition
+    ON tickets(next_transition_at);
+
+-- Tickets created before the column existed are evaluated once on the
+-- next tick, which stores their real next transition.
+UPDATE tickets
+    SET next_transition_at = CURRENT_TIMESTAMP
+    WHERE next_transition_at IS NULL
+      AND response_sla_deadline IS NOT NULL;
+
+-- Event ingestion: source time of the last applied event, which the
+-- updated_at trigger leaves alone. NULL accepts the next event.
+ALTER TABLE tickets ADD COLUMN IF NOT EXISTS last_event_at TIMESTAMPTZ;
+
+-- Ticket search: weighted full-text vector plus trigram indexes for
+-- substring (ILIKE) matches
+ALTER TABLE tickets ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'B')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_ticket_search_vector
+    ON tickets USING gin(search_vector);
+
+CREATE INDEX IF NOT EXISTS idx_ticket_title_trgm
+    ON tickets USING gin(title gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_ticket_description_trgm
+    ON tickets USING gin(description gin_trgm_ops);
+
 CREATE INDEX IF NOT EXISTS idx_alerts_active_created
     ON alerts(is_active, created_at DESC);
 
+-- At most one active alert per ticket / SLA type / alert type. Bulk alert
+-- inserts rely on it for ON CONFLICT DO NOTHING de-duplication.
+UPDATE alerts a
+    SET is_active = FALSE
+    WHERE a.is_active
+      AND EXISTS (
+          SELECT 1 FROM alerts b
+          WHERE b.is_active
+            AND b.ticket_id = a.ticket_id
+            AND b.sla_type = a.sla_type
+            AND b.alert_type = a.alert_type
+            AND (b.created_at, b.id) < (a.created_at, a.id)
+      );
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_alert_active_ticket_sla_type
+    ON alerts(ticket_id, sla_type, alert_type)
+    WHERE is_active;
+
+-- Notification outbox: unsent alerts are delivered by the dispatcher
+ALTER TABLE alerts ADD COLUMN IF NOT EXISTS delivery_attempts INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE alerts ADD COLUMN IF NOT EXISTS next_delivery_at TIMESTAMPTZ;
+ALTER TABLE alerts ADD COLUMN IF NOT EXISTS last_delivery_error TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_alert_pending_delivery
+    ON alerts(next_delivery_at)
+    WHERE NOT is_sent;
+
 CREATE INDEX IF NOT EXISTS idx_alerts_ticket_id
     ON alerts(ticket_id);
 
@@ -0,0 +1,208 @@
+"""Heap scheduling of the SLA timer, driven with fixed datetimes and stub sessions."""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from app.services.sla_timer import SLATimer
+
+NOW = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class _Session:
+    """Stands in for the session; every query returns the given rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, *args, **kwargs):
+        await asyncio.sleep(0)  # a database round trip yields to the loop
+        return list(self.rows)
+
+
+class _FailingEngine:
+    """SLA engine whose evaluation always fails."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def evaluate_tickets_by_id(self, db, ticket_ids):
+        self.calls.append(list(ticket_ids))
+        raise RuntimeError("database unavailable")
+
+
+class _SkippingEngine:
+    """SLA engine whose due tickets are all locked by another evaluator."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def evaluate_tickets_by_id(self, db, ticket_ids):
+        self.calls.append(list(ticket_ids))
+        return {"processed_tickets": 0}
+
+
+async def _run_timer(timer, seconds, during=None):
+    """Run the timer loop for ``seconds``, calling ``during`` once it is sleeping."""
+    task = asyncio.create_task(timer._run())
+    await asyncio.sleep(0.05)
+    if during is not None:
+        during()
+    await asyncio.sleep(seconds)
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+def test_pop_due_returns_due_tickets_in_order():
+    first, second, later = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    timer = SLATimer()
+    timer.schedule(second, NOW + timedelta(seconds=20))
+    timer.schedule(later, NOW + timedelta(seconds=90))
+    timer.schedule(first, NOW + timedelta(seconds=10))
+
+    assert timer._pop_due(NOW) == []
+    assert timer._pop_due(NOW + timedelta(seconds=30)) == [first, second]
+    assert len(timer) == 1
+    assert timer._seconds_until_next(NOW + timedelta(seconds=30)) == 60
+
+
+def test_pop_due_respects_batch_size():
+    tickets = [uuid.uuid4() for _ in range(5)]
+    timer = SLATimer(batch_size=2)
+    for offset, ticket_id in enumerate(tickets):
+        timer.schedule(ticket_id, NOW + timedelta(seconds=offset))
+
+    due = NOW + timedelta(seconds=10)
+    assert timer._pop_due(due) == tickets[:2]
+    assert timer._pop_due(due) == tickets[2:4]
+    assert timer._pop_due(due) == tickets[4:]
+
+
+def test_stale_entries_are_dropped():
+    ticket_id = uuid.uuid4()
+    timer = SLATimer()
+    timer.schedule(ticket_id, NOW + timedelta(seconds=10))
+    timer.schedule(ticket_id, NOW + timedelta(seconds=40))
+
+    # The old entry stays in the heap until it reaches the top
+    assert len(timer._heap) == 2
+    assert timer._seconds_until_next(NOW) == 40
+    assert len(timer._heap) == 1
+    assert timer._pop_due(NOW + timedelta(seconds=20)) == []
+    assert timer._pop_due(NOW + timedelta(seconds=40)) == [ticket_id]
+    assert timer._heap == []
+
+
+def test_rescheduling_to_the_same_instant_adds_no_entry():
+    ticket_id = uuid.uuid4()
+    timer = SLATimer()
+    timer.schedule(ticket_id, NOW)
+    timer.schedule(ticket_id, NOW)
+
+    assert len(timer._heap) == 1
+
+
+def test_none_removes_the_ticket():
+    ticket_id = uuid.uuid4()
+    timer = SLATimer()
+    timer.schedule(ticket_id, NOW + timedelta(seconds=10))
+    timer.schedule(ticket_id, None)
+
+    assert len(timer) == 0
+    assert timer._seconds_until_next(NOW) is None
+    assert timer._pop_due(NOW + timedelta(days=1)) == []
+
+
+def test_cancel_removes_the_ticket():
+    ticket_id = uuid.uuid4()
+    timer = SLATimer()
+    timer.schedule(ticket_id, NOW)
+    timer.cancel(ticket_id)
+
+    assert timer._pop_due(NOW) == []
+
+
+def test_wakeup_is_set_only_for_a_new_earliest_entry():
+    first, second = uuid.uuid4(), uuid.uuid4()
+    timer = SLATimer()
+    timer.schedule(first, NOW + timedelta(seconds=60))
+    timer._wakeup.clear()
+
+    timer.schedule(second, NOW + timedelta(seconds=90))
+    assert not timer._wakeup.is_set()
+
+    timer.schedule(second, NOW + timedelta(seconds=10))
+    assert timer._wakeup.is_set()
+
+
+def test_rescheduling_to_earlier_wakes_the_sleeping_loop():
+    ticket_id = uuid.uuid4()
+    engine = _SkippingEngine()
+
+    async def run():
+        timer = SLATimer()
+        timer._sla_engine = engine
+        # The ticket was closed by its evaluation
+        timer._session_factory = lambda: _Session([])
+        timer.schedule(ticket_id, datetime.now(timezone.utc) + timedelta(hours=1))
+        await _run_timer(
+            timer, 0.2,
+            during=lambda: timer.schedule(ticket_id, datetime.now(timezone.utc) - timedelta(seconds=1))
+        )
+        return timer
+
+    timer = asyncio.run(run())
+
+    assert engine.calls == [[ticket_id]]
+    assert len(timer) == 0
+
+
+def test_failed_batch_is_retried_later():
+    tickets = [uuid.uuid4(), uuid.uuid4()]
+    engine = _FailingEngine()
+
+    async def run():
+        timer = SLATimer(retry_seconds=60)
+        timer._sla_engine = engine
+        timer._session_factory = lambda: _Session([])
+        for ticket_id in tickets:
+            timer.schedule(ticket_id, datetime.now(timezone.utc) - timedelta(seconds=1))
+        await _run_timer(timer, 0.2)
+        return timer
+
+    started = datetime.now(timezone.utc)
+    timer = asyncio.run(run())
+
+    assert engine.calls == [tickets]
+    for ticket_id in tickets:
+        assert timer._scheduled[ticket_id] >= started + timedelta(seconds=60)
+
+
+def test_skipped_ticket_is_retried_instead_of_refired():
+    ticket_id = uuid.uuid4()
+    overdue_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    engine = _SkippingEngine()
+
+    async def run():
+        timer = SLATimer(retry_seconds=60)
+        timer._sla_engine = engine
+        # The re-select still sees the ticket's old, overdue transition
+        timer._session_factory = lambda: _Session([(ticket_id, overdue_at)])
+        timer.schedule(ticket_id, overdue_at)
+        await _run_timer(timer, 0.2)
+        return timer
+
+    started = datetime.now(timezone.utc)
+    timer = asyncio.run(run())
+
+    assert engine.calls == [[ticket_id]]
+    assert timer._scheduled[ticket_id] >= started + timedelta(seconds=60)
@@ -0,0 +1,110 @@
+"""Shared embedding model and async micro-batching of query encodings."""
+
+import asyncio
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from app.config import settings
+from ticket_triage_service.embeddings import EmbeddingModel
+from ticket_triage_service.inference_executor import inference_executor
+
+_models: Dict[str, EmbeddingModel] = {}
+_models_lock = threading.Lock()
+
+
+def get_embedding_model(model_name: Optional[str] = None) -> EmbeddingModel:
+    """
+    Process-wide embedding model, loaded on first use.
+
+    Retrieval, grounding and the micro-batcher all share this instance, so
+    the weights are held in memory once.
+    """
+    model_name = model_name or settings.embedding_model_name
+    model = _models.get(model_name)
+    if model is None:
+        with _models_lock:
+            model = _models.get(model_name)
+            if model is None:
+                model = _models[model_name] = EmbeddingModel(model_name)
+    return model
+
+
+class EmbeddingBatcher:
+    """
+    Gather concurrent encoding requests into single ``encode`` batches.
+
+    The first request of a batch waits at most ``max_wait_ms`` for others to
+    join; a full batch is flushed at once. Each batch runs in the inference
+    pool as one forward pass, so concurrent queries share the per-call overhead
+    instead of queueing behind each other one by one.
+
+    Args:
+        max_batch_size: Texts per encode call
+        max_wait_ms: Longest time a request waits for its batch to fill
+    """
+
+    def __init__(self, max_batch_size: int = 64, max_wait_ms: float = 5.0):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        # Pending requests and flush timers, per normalize_embeddings flag
+        self._pending: Dict[bool, List[Tuple[str, asyncio.Future]]] = {}
+        self._timers: Dict[bool, asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def encode(self, text: str, normalize: bool = True) -> np.ndarray:
+        """Embedding of one text, computed together with concurrent requests."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(normalize, [])
+        pending.append((text, future))
+
+        if len(pending) >= self.max_batch_size:
+            self._flush(normalize)
+        elif len(pending) == 1:
+            self._timers[normalize] = loop.call_later(self.max_wait, self._flush, normalize)
+
+        return await future
+
+    def _flush(self, normalize: bool):
+        timer = self._timers.pop(normalize, None)
+        if timer:
+            timer.cancel()
+        batch = self._pending.pop(normalize, None)
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._run(batch, normalize))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[str, asyncio.Future]], normalize: bool):
+        texts = [text for text, _ in batch]
+        try:
+            embeddings = await inference_executor.run(self._encode, texts, normalize)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), embedding in zip(batch, embeddings):
+            if not future.done():
+                future.set_result(embedding)
+
+    @staticmethod
+    def _encode(texts: List[str], normalize: bool) -> np.ndarray:
+        return get_embedding_model().get_embedding_model().encode(
+            texts,
+            normalize_embeddings=normalize,
+            batch_size=len(texts),
+            show_progress_bar=False
+        )
+
+
+# Process-wide batcher for query encodings
+embedding_batcher = EmbeddingBatcher(
+    max_batch_size=settings.embedding_batch_max_size,
+    max_wait_ms=settings.embedding_batch_max_wait_ms
+)
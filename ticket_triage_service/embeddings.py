@@ -1,5 +1,7 @@
+import hashlib
 import json
 from bs4 import BeautifulSoup
+from collections import Counter
 from pathlib import Path
 from typing import List, Dict
 import torch
@@ -7,7 +9,6 @@ from sentence_transformers import SentenceTransformer
 from typing import List
 import faiss
 import numpy as np
-from rank_bm25 import BM25Okapi
 
 
 class DocumentLoader:
@@ -98,19 +99,130 @@ class FaissIndex:
         return ids[0]
     
 class BM25Index:
-    def __init__(self, texts):
+    """
+    Okapi BM25 over a term-major CSR matrix of precomputed term weights.
+
+    Row ``t`` of the matrix lists the chunks containing term ``t`` with the
+    full BM25 weight of the term in that chunk, IDF and length norm already
+    applied, so a query only sums a few rows and picks the top-k with
+    ``np.argpartition``. Scores match ``rank_bm25.BM25Okapi``, including its
+    epsilon floor for the IDF of very common terms.
+
+    ``save`` writes the arrays as .npy files; ``load`` memory-maps them, so a
+    prebuilt index opens without re-tokenizing the corpus.
+
+    Args:
+        texts: Chunk texts, aligned with the FAISS index
+        k1: Term frequency saturation
+        b: Document length normalization
+        epsilon: IDF floor, as a fraction of the mean IDF
+    """
+
+    ARRAYS = ("indptr", "doc_ids", "weights")
+
+    def __init__(self, texts, k1=1.5, b=0.75, epsilon=0.25, _arrays=None, _vocabulary=None):
         self.texts = texts
-        tokenized = [t.split() for t in texts]
-        self.bm25 = BM25Okapi(tokenized)
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+        if _arrays is None:
+            _arrays, _vocabulary = self._build([t.split() for t in texts])
+        self.indptr, self.doc_ids, self.weights = _arrays
+        self.vocabulary = _vocabulary
+
+    def _build(self, tokenized):
+        vocabulary = {}
+        term_ids, doc_ids, term_freqs = [], [], []
+        doc_len = np.array([len(tokens) for tokens in tokenized], dtype=np.float64)
+
+        for doc_id, tokens in enumerate(tokenized):
+            for term, tf in Counter(tokens).items():
+                term_ids.append(vocabulary.setdefault(term, len(vocabulary)))
+                doc_ids.append(doc_id)
+                term_freqs.append(tf)
+
+        term_ids = np.array(term_ids, dtype=np.int64)
+        doc_ids = np.array(doc_ids, dtype=np.int32)
+        tf = np.array(term_freqs, dtype=np.float64)
+
+        # Same IDF as BM25Okapi: negative values are raised to epsilon * mean IDF
+        n_docs = len(tokenized)
+        doc_freq = np.bincount(term_ids, minlength=len(vocabulary))
+        idf = np.log(n_docs - doc_freq + 0.5) - np.log(doc_freq + 0.5)
+        if len(idf):
+            idf[idf < 0] = self.epsilon * idf.mean()
+
+        avgdl = doc_len.sum() / n_docs if n_docs else 0.0
+        length_norm = self.k1 * (1 - self.b + self.b * doc_len / max(avgdl, 1e-9))
+        weights = idf[term_ids] * tf * (self.k1 + 1) / (tf + length_norm[doc_ids])
+
+        # Group postings by term; the stable sort keeps chunk order within a row
+        order = np.argsort(term_ids, kind="stable")
+        indptr = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum(doc_freq, out=indptr[1:])
+        return (indptr, doc_ids[order], weights[order].astype(np.float32)), vocabulary
+
+    def save(self, path):
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        for name, array in zip(self.ARRAYS, (self.indptr, self.doc_ids, self.weights)):
+            np.save(path / f"{name}.npy", array)
+        (path / "vocabulary.json").write_text(json.dumps(self.vocabulary))
+        # Written last: its presence marks a complete index
+        (path / "meta.json").write_text(json.dumps({
+            "k1": self.k1,
+            "b": self.b,
+            "epsilon": self.epsilon,
+            "corpus_hash": self.corpus_hash(self.texts)
+        }))
+
+    @classmethod
+    def load(cls, path, texts):
+        path = Path(path)
+        meta = json.loads((path / "meta.json").read_text())
+        if meta["corpus_hash"] != cls.corpus_hash(texts):
+            raise ValueError(f"BM25 index at {path} was built from different texts")
+        arrays = tuple(np.load(path / f"{name}.npy", mmap_mode="r") for name in cls.ARRAYS)
+        vocabulary = json.loads((path / "vocabulary.json").read_text())
+        return cls(texts, meta["k1"], meta["b"], meta["epsilon"], _arrays=arrays, _vocabulary=vocabulary)
+
+    @classmethod
+    def load_or_build(cls, path, texts):
+        """Memory-map the index at ``path``, building and saving it first if missing or stale."""
+        try:
+            return cls.load(path, texts)
+        except (OSError, ValueError, KeyError):
+            index = cls(texts)
+            index.save(path)
+            return cls.load(path, texts)
+
+    @staticmethod
+    def corpus_hash(texts):
+        digest = hashlib.sha256()
+        for text in texts:
+            digest.update(text.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get_scores(self, query):
+        scores = np.zeros(len(self.texts), dtype=np.float32)
+        # Repeated query terms count once per occurrence, as in BM25Okapi
+        for term in query.split():
+            term_id = self.vocabulary.get(term)
+            if term_id is None:
+                continue
+            start, end = self.indptr[term_id], self.indptr[term_id + 1]
+            scores[self.doc_ids[start:end]] += self.weights[start:end]
+        return scores
 
     def search(self, query, k=5):
-        scores = self.bm25.get_scores(query.split())
-        top_k = sorted(
-            range(len(scores)),
-            key=lambda i: scores[i],
-            reverse=True
-        )[:k]
-        return [(self.texts[i], scores[i]) for i in top_k]
+        scores = self.get_scores(query)
+        k = min(k, len(scores))
+        if k == 0:
+            return []
+        top_k = np.argpartition(-scores, k - 1)[:k]
+        top_k = top_k[np.argsort(-scores[top_k], kind="stable")]
+        return [(self.texts[i], float(scores[i])) for i in top_k]
     
 
 class HybridRetriever:
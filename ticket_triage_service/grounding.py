@@ -1,14 +1,13 @@
-from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
 import nltk
 nltk.download("punkt")
 nltk.download('punkt_tab')
 # from nltk.tokenize import sent_tokenize, word_tokenize
 
-model = SentenceTransformer("BAAI/bge-base-en-v1.5")
-
 import re
 
+from ticket_triage_service.embedding_service import get_embedding_model
+
 def split_sentences(text: str):
     """
     Lightweight sentence splitter.
@@ -31,15 +30,23 @@ def grounding_ratio(answer, contexts, threshold=0.75):
             return 0.0
 
         ctx = " ".join(context_texts)
-        ctx_emb = model.encode(ctx, normalize_embeddings=True)
+        sentences = split_sentences(answer)
+
+        # Context and all answer sentences in one encode batch
+        model = get_embedding_model().get_embedding_model()
+        embeddings = model.encode(
+            [ctx] + sentences,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+        ctx_emb, sentence_embs = embeddings[0], embeddings[1:]
 
         grounded, total = 0, 0
 
-        for sent in split_sentences(answer):
+        for sent, emb in zip(sentences, sentence_embs):
             tokens = tokenize_words(sent)
             total += len(tokens)
 
-            emb = model.encode(sent, normalize_embeddings=True)
             sim = cosine_similarity([emb], [ctx_emb])[0][0]
 
             if sim >= threshold:
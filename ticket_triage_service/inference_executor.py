@@ -0,0 +1,123 @@
+"""Bounded worker pool that keeps blocking model inference off the event loop."""
+
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+import structlog
+
+from app.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+class InferenceOverloaded(RuntimeError):
+    """Raised when the inference queue is full and the request is shed."""
+
+
+class InferenceTimeout(TimeoutError):
+    """Raised when an inference call misses its deadline."""
+
+
+class InferenceExecutor:
+    """
+    Thread pool for classification, embedding and generation calls.
+
+    Torch releases the GIL inside its kernels, so a few threads run model
+    calls in parallel while the event loop keeps serving ticket traffic and
+    the SLA scheduler. At most ``max_workers + max_queue_depth`` calls are
+    admitted; further calls are rejected immediately instead of piling up
+    behind a slow generation. Every call has a deadline: a call still queued
+    when its deadline passes is dropped without running, and the caller
+    stops waiting for one that is still running. A running model call cannot
+    be interrupted, so its slot stays taken until the thread finishes.
+
+    Args:
+        max_workers: Inference calls running at the same time
+        max_queue_depth: Calls allowed to wait for a free worker
+        default_timeout: Seconds a call may take, queueing included
+    """
+
+    def __init__(self, max_workers: int = 2, max_queue_depth: int = 16, default_timeout: float = 60.0):
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.default_timeout = default_timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        """Calls admitted and not yet finished, running or queued."""
+        return self._in_flight
+
+    def start(self):
+        """Create the worker pool; ``run`` also starts it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="inference")
+
+    def stop(self):
+        """Drop queued calls and release the pool without waiting for running ones."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def run(self, func: Callable[..., Any], *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Run ``func`` in the pool and return its result.
+
+        Args:
+            func: Blocking callable
+            timeout: Deadline in seconds; defaults to ``default_timeout``
+
+        Raises:
+            InferenceOverloaded: If the queue is full
+            InferenceTimeout: If the call misses its deadline
+        """
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue_depth:
+                logger.warning("Inference request shed", in_flight=self._in_flight)
+                raise InferenceOverloaded("Inference queue is full")
+            self._in_flight += 1
+
+        self.start()
+        timeout = self.default_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        call = functools.partial(self._call, func, args, kwargs, deadline)
+
+        try:
+            future = self._executor.submit(call)
+        except BaseException:
+            self._release()
+            raise
+        # Runs in the worker thread, or at once if the call is cancelled while queued
+        future.add_done_callback(lambda _: self._release())
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            logger.warning("Inference request timed out", func=getattr(func, "__name__", repr(func)), timeout=timeout)
+            raise InferenceTimeout(f"Inference did not finish within {timeout:g}s") from None
+
+    def _release(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    @staticmethod
+    def _call(func: Callable[..., Any], args, kwargs, deadline: float) -> Any:
+        # The caller already gave up on calls that waited out their deadline
+        if time.monotonic() >= deadline:
+            raise InferenceTimeout("Inference request expired in the queue")
+        return func(*args, **kwargs)
+
+
+# Process-wide pool shared by the classifier, the embedding batcher and the RAG engine
+inference_executor = InferenceExecutor(
+    max_workers=settings.inference_max_workers,
+    max_queue_depth=settings.inference_max_queue_depth,
+    default_timeout=settings.inference_timeout
+)
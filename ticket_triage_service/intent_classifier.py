@@ -0,0 +1,173 @@
+"""Ticket intent classification with an embedding fast path and NLI fallback."""
+
+import asyncio
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import numpy as np
+import structlog
+
+from app.config import settings, sla_config
+from ticket_triage_service.inference_executor import inference_executor
+
+logger = structlog.get_logger(__name__)
+
+# Used when sla_config.yaml has no triage.intents
+DEFAULT_INTENTS = [
+    "password reset",
+    "account login issue",
+    "DSPM documentation question",
+    "release notes inquiry",
+    "general help"
+]
+
+
+class IntentSet(NamedTuple):
+    """Configured intents and, once computed, their description embeddings."""
+
+    names: List[str]
+    descriptions: List[str]
+    embeddings: Optional[np.ndarray] = None
+
+
+class IntentClassifier:
+    """
+    Zero-shot intent classifier loaded once per process.
+
+    The query is embedded through the shared micro-batcher and compared with
+    the precomputed embeddings of the intent descriptions; a softmax over the
+    cosine similarities gives the confidence. Only when the best intent is
+    below ``min_confidence`` does the NLI model run, and then only over the
+    ``nli_top_k`` most similar intents. Intents and thresholds come from the
+    ``triage`` section of sla_config.yaml and follow its hot reloads.
+
+    Args:
+        nli_model: HuggingFace zero-shot classification model of the fallback
+        triage_config: The ``triage`` configuration section
+    """
+
+    def __init__(self, nli_model: str = "facebook/bart-large-mnli", triage_config: Optional[Dict[str, Any]] = None):
+        self.nli_model = nli_model
+        self._nli = None
+        self._nli_lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.configure(triage_config or {})
+
+    def configure(self, triage_config: Dict[str, Any]):
+        """Apply a ``triage`` section; intent embeddings are recomputed on next use."""
+        names, descriptions = [], []
+        for intent in triage_config.get("intents") or DEFAULT_INTENTS:
+            if isinstance(intent, str):
+                intent = {"name": intent}
+            names.append(intent["name"])
+            descriptions.append(intent.get("description") or intent["name"])
+
+        self.min_confidence = float(triage_config.get("min_confidence", 0.6))
+        self.temperature = float(triage_config.get("temperature", 0.05))
+        self.nli_top_k = int(triage_config.get("nli_top_k", 3))
+        # Replaced as a whole so that a request in flight keeps a consistent set
+        self._intents = IntentSet(names, descriptions)
+
+    async def start(self):
+        """Load the models and intent embeddings in the background; returns immediately."""
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._preload())
+
+    async def stop(self):
+        """Cancel a pending preload."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def classify(self, query: str) -> Dict[str, Any]:
+        """
+        Best intent of a ticket text with its confidence.
+
+        Raises:
+            InferenceOverloaded: If the inference queue is full
+            InferenceTimeout: If the NLI fallback misses ``classify_timeout``
+        """
+        from ticket_triage_service.embedding_service import embedding_batcher
+
+        intents = self._intents
+        if intents.embeddings is None:
+            intents = await inference_executor.run(self._embed_intents, intents)
+
+        query_embedding = await embedding_batcher.encode(query, normalize=True)
+        probabilities = self._softmax(intents.embeddings @ query_embedding)
+        order = np.argsort(-probabilities)
+        best = order[0]
+
+        candidates = [intents.names[i] for i in order[:self.nli_top_k]]
+        if probabilities[best] >= self.min_confidence or len(candidates) < 2:
+            return {
+                "intent": intents.names[best],
+                "confidence": round(float(probabilities[best]), 4),
+                "all_scores": {intents.names[i]: float(probabilities[i]) for i in order},
+                "method": "embedding"
+            }
+
+        result = await inference_executor.run(
+            self._classify_nli, query, candidates,
+            timeout=settings.classify_timeout
+        )
+        result["method"] = "nli"
+        return result
+
+    def load(self):
+        """Load the embedding model, intent embeddings and NLI model (blocking)."""
+        self._embed_intents(self._intents)
+        self._nli_classifier()
+
+    async def _preload(self):
+        try:
+            await asyncio.to_thread(self.load)
+            logger.info("Intent classifier ready", intents=len(self._intents.names), nli_model=self.nli_model)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Failed to preload intent classifier", error=str(e))
+
+    def _embed_intents(self, intents: IntentSet) -> IntentSet:
+        from ticket_triage_service.embedding_service import get_embedding_model
+
+        embeddings = get_embedding_model().get_embedding_model().encode(
+            intents.descriptions,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+        embedded = intents._replace(embeddings=np.asarray(embeddings))
+        # Keep the result unless the configuration was reloaded meanwhile
+        if self._intents is intents:
+            self._intents = embedded
+        return embedded
+
+    def _classify_nli(self, query: str, intents: List[str]) -> Dict[str, Any]:
+        return self._nli_classifier().classify(query, intents)
+
+    def _nli_classifier(self):
+        if self._nli is None:
+            with self._nli_lock:
+                if self._nli is None:
+                    from ticket_triage_service.rag_pipeline import PromptIntentClassifier
+
+                    self._nli = PromptIntentClassifier(self.nli_model)
+        return self._nli
+
+    def _softmax(self, similarities: np.ndarray) -> np.ndarray:
+        scaled = similarities / self.temperature
+        exp = np.exp(scaled - scaled.max())
+        return exp / exp.sum()
+
+
+# Process-wide classifier, preloaded from the application lifespan
+intent_classifier = IntentClassifier(
+    nli_model=settings.classifier_nli_model,
+    triage_config=sla_config.get_triage_config()
+)
+sla_config.subscribe_to_changes(lambda _: intent_classifier.configure(sla_config.get_triage_config()))
@@ -0,0 +1,175 @@
+"""Process-resident RAG engine loaded once at application startup."""
+
+import asyncio
+from enum import Enum
+from typing import Dict, Optional
+
+import structlog
+
+from app.config import settings
+from ticket_triage_service.inference_executor import InferenceOverloaded, InferenceTimeout, inference_executor
+
+logger = structlog.get_logger(__name__)
+
+
+class EngineState(str, Enum):
+    """Lifecycle of the RAG engine."""
+
+    STOPPED = "stopped"
+    LOADING = "loading"
+    WARMING_UP = "warming_up"
+    READY = "ready"
+    FAILED = "failed"
+
+
+class RAGEngineNotReady(RuntimeError):
+    """Raised when a question arrives before the engine finished loading."""
+
+
+class RAGEngine:
+    """
+    FAISS index, texts, BM25 index, embedding model and LLM held in memory for the process lifetime.
+
+    ``start`` loads everything in a worker thread in the background, so the
+    API serves ticket traffic while the models load; ``state`` reports the
+    progress and ``answer`` refuses questions until the engine is ready.
+    After loading, an optional warmup generation pays one-time lazy
+    initialization (kernels, caches) before the first real request does.
+
+    Args:
+        index_path: FAISS index built by the embedding job
+        texts_path: Chunk texts aligned with the index
+        bm25_path: Directory of the persisted BM25 index
+        llm_model: HuggingFace model name of the generator
+        warmup: Run a one-token generation before reporting ready
+    """
+
+    def __init__(
+        self,
+        index_path: str = "artifacts/faiss.index",
+        texts_path: str = "artifacts/texts.json",
+        bm25_path: str = "artifacts/bm25",
+        llm_model: str = "LiquidAI/LFM2-1.2B-RAG",
+        warmup: bool = True
+    ):
+        self.index_path = index_path
+        self.texts_path = texts_path
+        self.bm25_path = bm25_path
+        self.llm_model = llm_model
+        self.warmup = warmup
+        self.state = EngineState.STOPPED
+        self.error: Optional[str] = None
+        self._pipeline = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.state == EngineState.READY
+
+    async def start(self):
+        """Begin loading in the background; returns immediately."""
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._load_and_warm_up())
+
+    async def stop(self):
+        """Cancel a pending load and release the models."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._pipeline = None
+        self.state = EngineState.STOPPED
+
+    async def wait_ready(self) -> bool:
+        """Wait for loading to finish; True if the engine is ready."""
+        if self._task:
+            await asyncio.shield(self._task)
+        return self.ready
+
+    async def answer(self, question: str) -> Dict:
+        """
+        Answer a question; only retrieval, prompt assembly and generation run here.
+
+        The question is embedded through the shared micro-batcher, so
+        concurrent questions are encoded together; the rest of the pipeline
+        runs in the inference pool.
+
+        Raises:
+            RAGEngineNotReady: If the engine is still loading or failed to load
+            InferenceOverloaded: If the inference queue is full
+            InferenceTimeout: If the answer is not ready within ``respond_timeout``
+        """
+        if not self.ready:
+            raise RAGEngineNotReady(f"RAG engine is {self.state.value}")
+
+        from ticket_triage_service.embedding_service import embedding_batcher
+        from ticket_triage_service.rag_pipeline import answer_query, to_response
+
+        try:
+            query_embedding = await embedding_batcher.encode(question, normalize=False)
+            result = await inference_executor.run(
+                answer_query, self._pipeline, question, query_embedding,
+                timeout=settings.respond_timeout
+            )
+            return to_response(result)
+        except (InferenceOverloaded, InferenceTimeout):
+            raise
+        except Exception as e:
+            error_msg = f"Error in RAG pipeline: {str(e)}"
+            logger.error("RAG query failed", error=str(e))
+            return {
+                "error": error_msg,
+                "question": question,
+                "answer": "I apologize, but I encountered an error while processing your question.",
+                "context_documents": [],
+                "source_metadata": []
+            }
+
+    async def _load_and_warm_up(self):
+        try:
+            self.state = EngineState.LOADING
+            await asyncio.to_thread(self._load)
+
+            if self.warmup:
+                self.state = EngineState.WARMING_UP
+                await asyncio.to_thread(self._warm_up)
+
+            self.state = EngineState.READY
+            logger.info("RAG engine ready", llm_model=self.llm_model)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.state = EngineState.FAILED
+            self.error = str(e)
+            logger.error("Failed to load RAG engine", error=str(e))
+
+    def _load(self):
+        # Heavy ML imports are deferred so the API starts without waiting for them
+        from ticket_triage_service.embedding_service import get_embedding_model
+        from ticket_triage_service.embeddings import BM25Index, HybridRetriever
+        from ticket_triage_service.rag_pipeline import RAGPipeline, get_hf_llm, load_faiss_store
+
+        # Shared with grounding and the query micro-batcher
+        get_embedding_model()
+        index, texts = load_faiss_store(self.index_path, self.texts_path)
+        retriever = HybridRetriever(index, BM25Index.load_or_build(self.bm25_path, texts))
+        llm = get_hf_llm(self.llm_model)
+        self._pipeline = RAGPipeline(llm, retriever, texts)
+        logger.info("RAG engine loaded", chunks=len(texts))
+
+    def _warm_up(self):
+        self._pipeline.llm_pipeline("Warmup", max_new_tokens=1, do_sample=False)
+
+
+# Process-wide engine, started from the application lifespan
+rag_engine = RAGEngine(
+    index_path=settings.rag_index_path,
+    texts_path=settings.rag_texts_path,
+    bm25_path=settings.rag_bm25_path,
+    llm_model=settings.rag_llm_model,
+    warmup=settings.rag_warmup
+)
@@ -18,6 +18,7 @@ import re
 from transformers import pipeline
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
 from ticket_triage_service.grounding import grounding_ratio
+from ticket_triage_service.embedding_service import get_embedding_model
 
 
 class PromptIntentClassifier:
@@ -77,20 +78,21 @@ class RAGPipeline:
         self.retriever = retriever
         self.documents = documents
         
-    def query(self, question: str, max_context_docs: int = 3) -> Dict:
+    def query(self, question: str, max_context_docs: int = 3, query_embedding=None) -> Dict:
         """
         Process a query through the complete RAG pipeline
         
         Args:
             question: User question
             max_context_docs: Number of documents to use as context
+            query_embedding: Precomputed question embedding, e.g. from the micro-batcher
             
         Returns:
             Dictionary with answer and source documents
         """
         try:
-            embedder = EmbeddingModel().get_embedding_model()
-            query_embedding = embedder.encode(question)
+            if query_embedding is None:
+                query_embedding = get_embedding_model().get_embedding_model().encode(question)
             # Step 1: Retrieve relevant documents
             retrieved_docs = self.retriever.retrieve(query_embedding,question, k=max_context_docs)
             
@@ -308,7 +310,7 @@ def rag_pipeline(query: str) -> Dict:
                     "artifacts/faiss.index",
                     "artifacts/texts.json"
                 )
-        bm25_index = BM25Index(documents)
+        bm25_index = BM25Index.load_or_build(settings.rag_bm25_path, documents)
         retriever = HybridRetriever(index, bm25_index)
         print("Retrieval system built successfully!")                    
         
@@ -325,17 +327,7 @@ def rag_pipeline(query: str) -> Dict:
         
         # 4. Process query
         print(f"Processing query: {query}")
-        result = rag.query(query)
-
-        # Check hallucination ratio
-        final_response = extract_final_answer(result)
-        grounding_ratio_val = grounding_ratio(final_response, result["source_metadata"])
-        if grounding_ratio_val < 0.75:
-            print(f"Warning: hallucination ratio is {grounding_ratio_val:.2f}. Results may be unreliable.")
-
-        
-        print("Query processed successfully!")
-        return result
+        return answer_query(rag, query)
         
     except Exception as e:
         error_msg = f"Error in RAG pipeline: {str(e)}"
@@ -349,6 +341,41 @@ def rag_pipeline(query: str) -> Dict:
         }
 
 
+def answer_query(rag: RAGPipeline, query: str, query_embedding=None) -> Dict:
+    """
+    Answer a question with a ready RAG pipeline and check its grounding
+    
+    Args:
+        rag: Pipeline with loaded retriever and LLM
+        query: User question
+        query_embedding: Precomputed question embedding
+        
+    Returns:
+        Dictionary with answer and source information
+    """
+    result = rag.query(query, query_embedding=query_embedding)
+
+    # Check hallucination ratio
+    final_response = extract_final_answer(result)
+    grounding_ratio_val = grounding_ratio(final_response, result["source_metadata"])
+    if grounding_ratio_val < 0.75:
+        print(f"Warning: hallucination ratio is {grounding_ratio_val:.2f}. Results may be unreliable.")
+
+    print("Query processed successfully!")
+    return result
+
+
+def to_response(result: Dict) -> Dict:
+    """Convert a pipeline result to the format expected by main.py"""
+    if "error" in result:
+        return result
+    
+    return {
+        "answer": result.get("answer", "No answer generated"),
+        "sources": result.get("context_documents", [])
+    }
+
+
 def extract_final_answer(llm_response: str) -> str:
     """
     Extracts the actual answer text from LLM output.
@@ -386,14 +413,5 @@ def run_rag(question: str) -> Dict:
     Returns:
         Dictionary with answer and source information
     """
-    result = rag_pipeline(question)
-    
-    # Convert to the expected format for main.py
-    if "error" in result:
-        return result
-    
-    return {
-        "answer": result.get("answer", "No answer generated"),
-        "sources": result.get("context_documents", [])
-    }
+    return to_response(rag_pipeline(question))
 
@@ -2,7 +2,8 @@ import json
 import faiss
 import numpy as np
 from rank_bm25 import BM25Okapi
-from sentence_transformers import SentenceTransformer
+
+from ticket_triage_service.embedding_service import get_embedding_model
 
 ARTIFACTS = "../embedding_service/artifacts"
 
@@ -12,7 +13,7 @@ class HybridRetriever:
         self.texts = json.loads(open(f"{ARTIFACTS}/texts.json").read())
 
         self.bm25 = BM25Okapi([t.lower().split() for t in self.texts])
-        self.model = SentenceTransformer("BAAI/bge-base-en-v1.5")
+        self.model = get_embedding_model().get_embedding_model()
 
     def search(self, query, k=5):
         # Semantic